@@ -0,0 +1,169 @@
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+FIRST_JOB_ID = 4000000000
+
+TITLES = ["Backend Developer", "Data Engineer", "Frontend Developer", "Site Reliability Engineer",
+          "Product Manager", "Machine Learning Engineer", "QA Engineer", "Engineering Manager"]
+LOCATIONS = ["Milano, Lombardia, Italia", "Roma, Lazio, Italia", "Torino, Piemonte, Italia",
+             "Bologna, Emilia-Romagna, Italia", "Remote"]
+SKILLS = ["Python", "SQL", "Kubernetes", "React", "Go", "AWS", "Terraform", "Spark", "TypeScript", "Kafka"]
+INDUSTRIES = ["Software Development", "IT Services and IT Consulting", "Financial Services", "Retail"]
+SIZES = ["11-50 employees", "51-200 employees", "201-500 employees", "1,001-5,000 employees"]
+FIRST_NAMES = ["Giulia", "Marco", "Sara", "Luca", "Chiara", "Paolo", "Elena", "Davide"]
+LAST_NAMES = ["Rossi", "Bianchi", "Ferrari", "Esposito", "Romano", "Colombo", "Ricci", "Marino"]
+
+
+class FixtureDataset:
+    """
+    Deterministic synthetic job postings, companies and hirers for the stand-in site.
+
+    Every entity is derived from the seed and its own id, so any page can be generated
+    on demand without keeping the whole set in memory. A share of the entities has
+    sections missing (no description, no skills, no hirers, no location, closed postings)
+    to exercise the optional-field paths of the scrapers.
+    """
+
+    def __init__(self, job_count: int = 1000, company_count: int = 100, hirer_count: int = 200,
+                 missing_rate: float = 0.1, seed: int = 0) -> None:
+        """
+        Initialize the dataset.
+
+        Args:
+            job_count: Number of job postings returned by searches
+            company_count: Number of distinct companies
+            hirer_count: Number of distinct hirers
+            missing_rate: Probability of each optional section being absent
+            seed: Seed of the generator
+        """
+        self.job_count = job_count
+        self.company_count = company_count
+        self.hirer_count = hirer_count
+        self.missing_rate = missing_rate
+        self.seed = seed
+        # Listing dates are relative to the dataset creation, like real "2 days ago" postings
+        self.now_ms = int(time.time() * 1000)
+
+    def _random(self, kind: str, key: Any) -> random.Random:
+        return random.Random(f"{self.seed}:{kind}:{key}")
+
+    def _missing(self, rng: random.Random) -> bool:
+        return rng.random() < self.missing_rate
+
+    def job_ids(self) -> List[int]:
+        """
+        Get the ids of every job posting, in search order.
+
+        Returns:
+            List of job posting ids
+        """
+        return list(range(FIRST_JOB_ID, FIRST_JOB_ID + self.job_count))
+
+    def search(self, start: int, count: int = 25) -> List[Dict[str, Any]]:
+        """
+        Get a page of search results.
+
+        Args:
+            start: Offset of the first result
+            count: Page size
+
+        Returns:
+            Job postings of the page, fewer than count on the last page
+        """
+        ids = range(FIRST_JOB_ID + start, FIRST_JOB_ID + min(self.job_count, start + count))
+        return [self.get_job(job_id) for job_id in ids]
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a job posting.
+
+        Args:
+            job_id: Job posting id
+
+        Returns:
+            Job posting values, or None if the id is outside the dataset
+        """
+        if not FIRST_JOB_ID <= job_id < FIRST_JOB_ID + self.job_count:
+            return None
+
+        rng = self._random('job', job_id)
+        company = self.get_company(f"company-{rng.randrange(self.company_count)}")
+        title = rng.choice(TITLES)
+        is_simple = rng.random() < 0.4
+        hirers = [] if self._missing(rng) else [
+            self.get_hirer(f"hirer-{rng.randrange(self.hirer_count)}") for _ in range(rng.randint(1, 2))
+        ]
+        skills = [] if self._missing(rng) else rng.sample(SKILLS, rng.randint(2, 6))
+        return {
+            'id': job_id,
+            'title': title,
+            'location': None if self._missing(rng) else rng.choice(LOCATIONS),
+            'description': None if self._missing(rng) else " ".join(
+                f"{title} at {company['name']}: paragraph {i} of the job description." for i in range(rng.randint(3, 30))
+            ),
+            'skills': skills,
+            'additional_skills': ", ".join(skills[:2]) if skills else None,
+            'company': company,
+            'hirers': hirers,
+            'is_simple': is_simple,
+            'external_url': None if is_simple else f"https://www.linkedin.com/fixture/apply/{job_id}",
+            'closed': self._missing(rng),
+            'listed_at': self.now_ms - rng.randrange(30) * 86400000,
+        }
+
+    def get_company(self, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a company.
+
+        Args:
+            slug: Company slug, company-<n>
+
+        Returns:
+            Company values, or None if the slug is outside the dataset
+        """
+        number = self._parse_slug(slug, 'company-', self.company_count)
+        if number is None:
+            return None
+
+        rng = self._random('company', number)
+        name = f"Fixture Company {number}"
+        return {
+            'slug': slug,
+            'urn': f"urn:li:fs_normalized_company:{1000 + number}",
+            'name': name,
+            'tagline': None if self._missing(rng) else f"{name} builds things",
+            'website': None if self._missing(rng) else f"https://company-{number}.example.com",
+            'industry': None if self._missing(rng) else rng.choice(INDUSTRIES),
+            'size': None if self._missing(rng) else rng.choice(SIZES),
+            'headquarters': None if self._missing(rng) else rng.choice(LOCATIONS),
+        }
+
+    def get_hirer(self, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a hirer profile.
+
+        Args:
+            slug: Hirer slug, hirer-<n>
+
+        Returns:
+            Hirer values, or None if the slug is outside the dataset
+        """
+        number = self._parse_slug(slug, 'hirer-', self.hirer_count)
+        if number is None:
+            return None
+
+        rng = self._random('hirer', number)
+        return {
+            'slug': slug,
+            'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            'role': None if self._missing(rng) else f"Talent Acquisition at Fixture Company {rng.randrange(self.company_count)}",
+            'location': None if self._missing(rng) else rng.choice(LOCATIONS),
+        }
+
+    @staticmethod
+    def _parse_slug(slug: str, prefix: str, count: int) -> Optional[int]:
+        if not slug.startswith(prefix) or not slug[len(prefix):].isdigit():
+            return None
+        number = int(slug[len(prefix):])
+        return number if number < count else None
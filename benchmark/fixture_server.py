@@ -0,0 +1,319 @@
+import argparse
+import html
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from benchmark.fixture_data import FixtureDataset
+
+# Client-side router of the stand-in SPA: renders the jobs search and job view routes from
+# the same voyager endpoints the real site fetches, and re-renders on history navigation
+SPA_SCRIPT = """
+const esc = value => String(value).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+const text = value => value && typeof value === 'object' ? value.text : value;
+
+function renderCards(root, payload) {
+    const cards = payload.included.filter(entity => entity.entityUrn.startsWith('urn:li:fsd_jobPostingCard:'));
+    if (!cards.length) {
+        root.innerHTML = '<div class="jobs-search-no-results-banner"><h2>No matching jobs found.</h2></div>';
+        return;
+    }
+    root.innerHTML = '<div class="scaffold-layout__list" style="height: 600px; overflow-y: auto"><ul>' + cards.map(card => {
+        const id = card.entityUrn.match(/\\((\\d+),/)[1];
+        const listed = card.footerItems.find(item => item.type === 'LISTED_DATE');
+        const easyApply = card.footerItems.some(item => item.type === 'EASY_APPLY_TEXT');
+        return '<li style="height: 120px"><div class="job-card-container" data-job-id="' + id + '">' +
+            '<a href="/jobs/view/' + id + '/"><strong>' + esc(card.jobPostingTitle) + '</strong></a>' +
+            '<div class="artdeco-entity-lockup__subtitle">' + esc(text(card.primaryDescription)) + '</div>' +
+            '<ul>' + [card.secondaryDescription, card.tertiaryDescription].filter(Boolean).map(item =>
+                '<li class="job-card-container__metadata-wrapper">' + esc(text(item)) + '</li>').join('') + '</ul>' +
+            (listed ? '<time datetime="' + new Date(listed.timeAt).toISOString().slice(0, 10) + '">listed</time>' : '') +
+            (easyApply ? '<span><svg data-test-icon="linkedin-bug-color-small"></svg>Candidatura semplice</span>' : '') +
+            '</div></li>';
+    }).join('') + '</ul>' + renderPagination(payload.data.paging) + '</div>';
+}
+
+function renderPagination(paging) {
+    // Like LinkedIn, the bar shows the first pages and the last one, and only when there's more than one
+    const pageCount = Math.ceil(paging.total / 25);
+    if (pageCount <= 1) {
+        return '';
+    }
+    const pages = [...new Set([1, 2, 3, pageCount])].filter(page => page <= pageCount);
+    return '<ul class="artdeco-pagination__pages">' + pages.map(page =>
+        '<li data-test-pagination-page-btn="' + page + '"><button>' + page + '</button></li>').join('') + '</ul>';
+}
+
+function renderJob(root, payload) {
+    const posting = payload.data;
+    const company = payload.included.find(entity => entity.entityUrn === posting.companyDetails['*companyResolutionResult']);
+    const simple = posting.applyMethod.$type.includes('OnsiteApply');
+    root.innerHTML = '<main class="jobs-details"><div class="artdeco-card">' +
+        '<h1>' + esc(posting.title) + '</h1>' +
+        '<div class="job-details-jobs-unified-top-card__company-name"><a href="https://www.linkedin.com/company/' +
+            esc(company.universalName) + '/life/">' + esc(company.name) + '</a></div>' +
+        (posting.formattedLocation ? '<div class="job-details-jobs-unified-top-card__primary-description-container">' +
+            '<span class="tvm__text">' + esc(posting.formattedLocation) + '</span><span class="tvm__text"> · 2 days ago</span></div>' : '') +
+        (posting.jobState === 'CLOSED' ? '<div class="artdeco-inline-feedback artdeco-inline-feedback--error" role="alert">' +
+            '<svg data-test-icon="signal-error"></svg><span class="artdeco-inline-feedback__message">Non accetta più candidature</span></div>' :
+            '<div class="jobs-apply-button--top-card"><button class="jobs-apply-button" data-url="' +
+            esc(posting.applyMethod.companyApplyUrl || '') + '">' + (simple ? '<svg data-test-icon="linkedin-bug-xxsmall"></svg>Candidatura semplice' :
+            '<svg data-test-icon="link-external-small"></svg>Candidati') + '</button></div>') +
+        '</div>' +
+        (posting.description ? '<div class="jobs-box__html-content"><p>' + esc(text(posting.description)) + '</p></div>' : '') +
+        (posting.skills.length ? '<div class="job-details-how-you-match__skills-item-subtitle">' + esc(posting.skills.join(', ')) + '</div>' : '') +
+        (posting.additionalSkills ? '<div class="job-details-how-you-match__skills-section-descriptive-skill">' + esc(posting.additionalSkills) + '</div>' : '') +
+        posting.hirers.map(hirer => '<div class="hirer-card__hirer-information">' +
+            '<a href="https://www.linkedin.com/in/' + esc(hirer.slug) + '/"><span class="jobs-poster__name"><strong>' + esc(hirer.name) + '</strong></span></a>' +
+            '<div class="linked-area"><div class="text-body-small">' + esc(hirer.role || '') + '</div></div></div>').join('') +
+        '</main>';
+    const button = root.querySelector('.jobs-apply-button[data-url]:not([data-url=""])');
+    if (button) {
+        button.addEventListener('click', () => window.open(button.dataset.url, '_blank'));
+    }
+}
+
+async function render() {
+    const root = document.getElementById('app');
+    const path = location.pathname;
+    const params = new URLSearchParams(location.search);
+    if (path.startsWith('/jobs/view/')) {
+        const response = await fetch('/voyager/api/jobs/jobPostings/' + path.split('/')[3]);
+        if (!response.ok) {
+            root.innerHTML = '<main class="jobs-details"><p>This job is no longer available</p></main>';
+            return;
+        }
+        renderJob(root, await response.json());
+    } else if (path.startsWith('/jobs/search') && params.get('keywords')) {
+        const response = await fetch('/voyager/api/voyagerJobsDashJobCards?count=25&start=' + (params.get('start') || 0));
+        renderCards(root, await response.json());
+    } else {
+        root.innerHTML = '<main class="jobs-home"></main>';
+    }
+}
+
+window.addEventListener('popstate', render);
+render();
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body><header id="global-nav"></header><div id="app">{body}</div>{script}</body></html>"""
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler serving the stand-in pages and voyager payloads of a FixtureDataset.
+    """
+
+    dataset: FixtureDataset = FixtureDataset()
+    latency_ms: int = 0
+    requests = 0
+
+    def do_GET(self) -> None:
+        FixtureRequestHandler.requests += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path
+
+        if path.startswith('/jobs/'):
+            self._send_html("Jobs", "", "<script>" + SPA_SCRIPT + "</script>")
+        elif path == '/voyager/api/voyagerJobsDashJobCards':
+            start = int(query.get('start', ['0'])[0])
+            count = int(query.get('count', ['25'])[0])
+            self._send_json(self._job_cards_payload(start, count))
+        elif re.fullmatch(r'/voyager/api/jobs/jobPostings/\d+', path):
+            job = self.dataset.get_job(int(path.rsplit('/', 1)[1]))
+            if job is None:
+                self._send_json({"status": 404}, status=404)
+            else:
+                self._send_json(self._job_posting_payload(job))
+        elif re.fullmatch(r'/company/[^/]+/?', path):
+            company = self.dataset.get_company(path.split('/')[2])
+            self._send_entity_page(company, self._company_body)
+        elif re.fullmatch(r'/in/[^/]+/?', path):
+            hirer = self.dataset.get_hirer(path.split('/')[2])
+            self._send_entity_page(hirer, self._hirer_body)
+        elif path.startswith('/fixture/apply/'):
+            self._send_html("Apply", "<main><h1>External application form</h1></main>")
+        else:
+            self._send_html("Not found", "<main><h1>Page not found</h1></main>", status=404)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _job_cards_payload(self, start: int, count: int) -> Dict[str, Any]:
+        jobs = self.dataset.search(start, count)
+        included = []
+        elements = []
+        for job in jobs:
+            urn = f"urn:li:fsd_jobPostingCard:({job['id']},JOBS_SEARCH)"
+            elements.append({"jobCardUnion": {"*jobPostingCard": urn}})
+            footer_items = [{"type": "LISTED_DATE", "timeAt": job['listed_at']}]
+            if job['is_simple']:
+                footer_items.append({"type": "EASY_APPLY_TEXT"})
+            included.append({
+                "entityUrn": urn,
+                "jobPostingTitle": job['title'],
+                "primaryDescription": {"text": job['company']['name']},
+                "secondaryDescription": {"text": job['location']} if job['location'] else None,
+                "tertiaryDescription": {"text": "Be an early applicant"},
+                "footerItems": footer_items,
+            })
+        return {
+            "data": {
+                "paging": {"start": start, "count": count, "total": self.dataset.job_count},
+                "elements": elements,
+            },
+            "included": included,
+        }
+
+    @staticmethod
+    def _job_posting_payload(job: Dict[str, Any]) -> Dict[str, Any]:
+        company = job['company']
+        if job['is_simple']:
+            apply_method = {"$type": "com.linkedin.voyager.jobs.OnsiteApply"}
+        else:
+            apply_method = {"$type": "com.linkedin.voyager.jobs.OffsiteApply", "companyApplyUrl": job['external_url']}
+        return {
+            "data": {
+                "entityUrn": f"urn:li:fs_jobPosting:{job['id']}",
+                "jobPostingId": job['id'],
+                "title": job['title'],
+                "formattedLocation": job['location'],
+                "description": {"text": job['description']} if job['description'] else None,
+                "applyMethod": apply_method,
+                "jobState": "CLOSED" if job['closed'] else "LISTED",
+                "companyDetails": {"*companyResolutionResult": company['urn']},
+                # Not part of the real payload, the stand-in renders these sections from it too
+                "skills": job['skills'],
+                "additionalSkills": job['additional_skills'],
+                "hirers": job['hirers'],
+            },
+            "included": [{"entityUrn": company['urn'], "name": company['name'], "universalName": company['slug']}],
+        }
+
+    @staticmethod
+    def _company_body(company: Dict[str, Any]) -> str:
+        parts = ['<main><section class="org-top-card">',
+                 f'<h1 class="org-top-card-summary__title">{html.escape(company["name"])}</h1>']
+        if company['tagline']:
+            parts.append(f'<p class="org-top-card-summary__tagline">{html.escape(company["tagline"])}</p>')
+        if company['website']:
+            parts.append('<div class="org-top-card-primary-actions__inner">'
+                         f'<a href="{html.escape(company["website"])}">'
+                         '<span class="org-top-card-primary-actions__external-link">Visit website</span></a></div>')
+        parts.append('</section><dl>')
+        for css_class, key in (('org-about-company-module__industry', 'industry'),
+                               ('org-about-company-module__company-size-definition-text', 'size'),
+                               ('org-about-company-module__headquarters', 'headquarters')):
+            if company[key]:
+                parts.append(f'<dd class="{css_class}">{html.escape(company[key])}</dd>')
+        parts.append('</dl></main>')
+        return "".join(parts)
+
+    @staticmethod
+    def _hirer_body(hirer: Dict[str, Any]) -> str:
+        parts = [f'<main><h1>{html.escape(hirer["name"])}</h1>']
+        if hirer['role']:
+            parts.append(f'<div class="text-body-medium break-words">{html.escape(hirer["role"])}</div>')
+        if hirer['location']:
+            parts.append(f'<span class="text-body-small inline t-black--light break-words">{html.escape(hirer["location"])}</span>')
+        parts.append('</main>')
+        return "".join(parts)
+
+    def _send_entity_page(self, entity: Optional[Dict[str, Any]], render_body) -> None:
+        if entity is None:
+            self._send_html("Not found", "<main><h2>This page doesn't exist</h2></main>", status=404)
+        else:
+            self._send_html(entity['name'], render_body(entity))
+
+    def _send_html(self, title: str, body: str, script: str = "", status: int = 200) -> None:
+        self._send(status, 'text/html; charset=utf-8',
+                   PAGE_TEMPLATE.format(title=html.escape(title), body=body, script=script).encode('utf-8'))
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
+        self._send(status, 'application/json', json.dumps(payload).encode('utf-8'))
+
+    def _send(self, status: int, content_type: str, content: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server running the stand-in site in the background.
+    """
+
+    def __init__(self, dataset: FixtureDataset, host: str = '127.0.0.1', port: int = 0, latency_ms: int = 0) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            dataset: Dataset the pages are generated from
+            host: Interface to listen on
+            port: Port to listen on, 0 picks a free one
+            latency_ms: Delay added to every response, to mimic the network
+        """
+        handler = type('BoundFixtureRequestHandler', (FixtureRequestHandler,),
+                       {'dataset': dataset, 'latency_ms': latency_ms})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """
+        Start serving in a daemon thread.
+        """
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving and release the port.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the offline LinkedIn stand-in used by the benchmarks")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--jobs', type=int, default=1000, help="Number of job postings returned by searches")
+    parser.add_argument('--missing-rate', type=float, default=0.1, help="Probability of each optional section being absent")
+    parser.add_argument('--latency-ms', type=int, default=0, help="Delay added to every response")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    dataset = FixtureDataset(job_count=args.jobs, missing_rate=args.missing_rate, seed=args.seed)
+    server = FixtureServer(dataset, args.host, args.port, args.latency_ms)
+    print(f"Serving the LinkedIn stand-in on {server.base_url}, run the API with LINKEDIN_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from benchmark.fixture_data import FixtureDataset
+from benchmark.fixture_server import FixtureServer
+
+USERNAME = 'benchmark@example.com'
+OPERATIONS = ['search_page', 'job_posting', 'company', 'hirer']
+# Operations FETCH_ROUTES can send to a fetch backend, 'browser' runs them without a route
+ROUTED_OPERATIONS = ['job_posting', 'company', 'hirer']
+BACKENDS = ['browser', 'http', 'playwright']
+
+
+class DriverCallCounter:
+    """
+    Counter of the protocol messages sent from Python to the Playwright driver.
+
+    Each message is one round trip to the driver, which maps it to one or more CDP commands,
+    so the count per operation tracks how chatty a scraper is with the browser.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.by_method: Dict[str, int] = {}
+
+    def install(self) -> None:
+        from playwright._impl._connection import Connection
+
+        send_message = Connection._send_message_to_server
+        counter = self
+
+        def counting_send_message(connection, object, method, params, no_reply=False):
+            counter.count += 1
+            counter.by_method[method] = counter.by_method.get(method, 0) + 1
+            return send_message(connection, object, method, params, no_reply)
+
+        Connection._send_message_to_server = counting_send_message
+
+
+def process_tree_rss_kb(root_pid: int) -> Optional[int]:
+    """
+    Sum the resident memory of a process and all its descendants (Linux only).
+
+    Args:
+        root_pid: Process id of the root, the benchmark itself
+
+    Returns:
+        Resident set size in KiB, None when /proc is not available
+    """
+    if not os.path.isdir('/proc'):
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open(f'/proc/{entry}/statm') as f:
+                resident_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+        rss[int(entry)] = resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        total += rss.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    return total
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+async def measure(name: str, operation: Callable[[int], Awaitable[Any]], iterations: int, warmup: int,
+                  counter: DriverCallCounter) -> Dict[str, Any]:
+    for i in range(warmup):
+        await operation(i)
+
+    latencies_ms: List[float] = []
+    errors = 0
+    calls_before = counter.count
+    rss_before = process_tree_rss_kb(os.getpid())
+    for i in range(warmup, warmup + iterations):
+        started = time.perf_counter()
+        try:
+            await operation(i)
+        except Exception as e:
+            errors += 1
+            print(f"  {name} #{i} failed: {e}", file=sys.stderr)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    rss_after = process_tree_rss_kb(os.getpid())
+
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies_ms, 0.50), 1),
+        "p95_ms": round(percentile(latencies_ms, 0.95), 1),
+        "mean_ms": round(statistics.mean(latencies_ms), 1),
+        "driver_calls_per_op": round((counter.count - calls_before) / iterations, 1),
+        "rss_mb": round(rss_after / 1024, 1) if rss_after is not None else None,
+        "rss_kb_per_op": round((rss_after - rss_before) / iterations, 1) if rss_after is not None else None,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    dataset = FixtureDataset(job_count=args.jobs, missing_rate=args.missing_rate, seed=args.seed)
+    server = FixtureServer(dataset, latency_ms=args.latency_ms)
+    server.start()
+
+    # The container reads its settings from the environment when it's first built
+    os.environ['LINKEDIN_BASE_URL'] = server.base_url
+    os.environ['EXTRACTION_ENGINE'] = args.engine
+    os.environ.setdefault('WARMUP', '0')
+    os.environ.setdefault('SEARCH_PAGE_CACHE_TTL', '0')
+    os.environ.setdefault('ACCOUNT_RATE_PER_MINUTE', '0')
+
+    from linkedinapi.client.LinkedinClient import LinkedinClient
+    from linkedinapi.container.DefaultContainer import DefaultContainer
+    from linkedinapi.manager.BrowserManager import BrowserManager
+    from linkedinapi.manager.FetchBackendManager import FetchBackendManager
+    from linkedinapi.manager.LifecycleManager import LifecycleManager
+    from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+    from linkedinapi.model.JobSearchQuery import JobSearchQuery
+
+    BrowserManager.headless = not args.headed
+    counter = DriverCallCounter()
+    counter.install()
+
+    container = DefaultContainer.getInstance()
+    await container.get(SessionStoreManager).save(USERNAME, {
+        "cookies": [{
+            "name": "li_at", "value": "benchmark", "domain": ".www.linkedin.com", "path": "/",
+            "expires": time.time() + 86400, "httpOnly": True, "secure": True, "sameSite": "None",
+        }],
+        "origins": [],
+    })
+    client: LinkedinClient = container.get(LinkedinClient)
+    lifecycle_manager: LifecycleManager = container.get(LifecycleManager)
+    fetch_backends: FetchBackendManager = container.get(FetchBackendManager)
+
+    job_ids = dataset.job_ids()
+    search_pages = max(1, min(args.jobs // 25, 40))
+    operations: Dict[str, Callable[[int], Awaitable[Any]]] = {
+        'search_page': lambda i: client.search_page(
+            USERNAME, JobSearchQuery(keywords='engineer', location='Italia', start=(i % search_pages) * 25)
+        ),
+        'job_posting': lambda i: client.get_job_posting(USERNAME, job_ids[i % len(job_ids)]),
+        'company': lambda i: client.get_company(USERNAME, f"company-{i % dataset.company_count}"),
+        'hirer': lambda i: client.get_hirer(USERNAME, f"hirer-{i % dataset.hirer_count}"),
+    }
+
+    results: Dict[str, Any] = {}
+    try:
+        for backend in args.backends:
+            fetch_backends.routes = {} if backend == 'browser' else {name: backend for name in ROUTED_OPERATIONS}
+            for name in args.operations:
+                if backend != 'browser' and name not in ROUTED_OPERATIONS:
+                    continue
+                label = name if backend == 'browser' else f"{name}[{backend}]"
+                print(f"Running {label} x{args.iterations}", file=sys.stderr)
+                routed_before = dict(fetch_backends.operations.get(name, {}))
+                results[label] = await measure(label, operations[name], args.iterations, args.warmup, counter)
+                if backend != 'browser':
+                    routed_after = fetch_backends.operations.get(name, {})
+                    fallbacks = sum(routed_after.get(key, 0) - routed_before.get(key, 0)
+                                    for key in ('unavailable', 'incomplete'))
+                    # Warm-up runs are routed too
+                    results[label]["fallback_rate"] = round(fallbacks / (args.iterations + args.warmup), 2)
+    finally:
+        await lifecycle_manager.stop()
+        server.stop()
+
+    return {
+        "settings": {
+            "engine": args.engine,
+            "backends": args.backends,
+            "iterations": args.iterations,
+            "jobs": args.jobs,
+            "missing_rate": args.missing_rate,
+            "latency_ms": args.latency_ms,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare a report with a baseline.
+
+    Args:
+        report: Report of the current run
+        baseline: Report saved earlier
+        tolerance: Allowed relative slowdown, e.g. 0.2 for 20%
+
+    Returns:
+        Descriptions of the regressions, empty when there are none
+    """
+    regressions = []
+    for name, result in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'driver_calls_per_op'):
+            if previous.get(metric) and result[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{name} {metric}: {previous[metric]} -> {result[metric]}")
+    return regressions
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'operation':<24} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9} {'calls/op':>9} {'rss MB':>8} {'KB/op':>8} {'errors':>6} {'fallback':>8}"
+    print(header)
+    print('-' * len(header))
+    for name, result in report['results'].items():
+        print(f"{name:<24} {result['p50_ms']:>9} {result['p95_ms']:>9} {result['mean_ms']:>9} "
+              f"{result['driver_calls_per_op']:>9} {str(result['rss_mb']):>8} {str(result['rss_kb_per_op']):>8} {result['errors']:>6} "
+              f"{str(result.get('fallback_rate', '')):>8}")
+        previous = (baseline or {}).get('results', {}).get(name)
+        if previous:
+            print(f"{'  baseline':<24} {previous['p50_ms']:>9} {previous['p95_ms']:>9} {previous['mean_ms']:>9} "
+                  f"{previous['driver_calls_per_op']:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers against the offline LinkedIn stand-in")
+    parser.add_argument('--engine', default='dom', choices=['dom', 'snapshot', 'network'])
+    parser.add_argument('--operations', nargs='+', default=OPERATIONS, choices=OPERATIONS)
+    parser.add_argument('--backends', nargs='+', default=['browser'], choices=BACKENDS,
+                        help="Fetch backends to run the job posting, company and hirer operations on, "
+                             "non-browser ones fall back to the browser flow on incomplete pages")
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2, help="Unmeasured runs per operation")
+    parser.add_argument('--jobs', type=int, default=1000, help="Number of job postings in the stand-in")
+    parser.add_argument('--missing-rate', type=float, default=0.1)
+    parser.add_argument('--latency-ms', type=int, default=0, help="Delay added to every stand-in response")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--headed', action='store_true', help="Show the browser window")
+    parser.add_argument('--output', help="Write the report as JSON to this path")
+    parser.add_argument('--save-baseline', help="Write the report as the new baseline to this path")
+    parser.add_argument('--baseline', help="Compare with the baseline at this path, exit 1 on regressions")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown against the baseline")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(args))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
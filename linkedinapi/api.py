@@ -1,15 +1,41 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from starlette.responses import RedirectResponse
 
 from linkedinapi.container.DefaultContainer import DefaultContainer
 from linkedinapi.controller.company_controller import company_controller
+from linkedinapi.controller.crawl_job_controller import crawl_job_controller
+from linkedinapi.controller.flight_recording_controller import flight_recording_controller
 from linkedinapi.controller.hirer_controller import hirer_controller
 from linkedinapi.controller.job_posting_controller import job_posting_controller
 from linkedinapi.controller.login_controller import login_controller
+from linkedinapi.controller.metrics_controller import metrics_controller
+from linkedinapi.controller.stats_controller import stats_controller
+from linkedinapi.manager.CrawlJobManager import CrawlJobManager
+from linkedinapi.manager.LifecycleManager import LifecycleManager
+from linkedinapi.manager.MetricsManager import MetricsManager
 
 default_container: DefaultContainer = DefaultContainer.getInstance()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Browser and sessions are warmed up in the background, /ready tells when it's done
+    lifecycle_manager: LifecycleManager = default_container.get(LifecycleManager)
+    await lifecycle_manager.start()
+    # Crawl job workers live as long as the server, interrupted jobs resume on the next start
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+    await crawl_job_manager.start()
+    try:
+        yield
+    finally:
+        await crawl_job_manager.stop()
+        await lifecycle_manager.stop()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="LinkedIn API",
@@ -20,9 +46,23 @@ app = FastAPI(
             "url": default_container.get_var('api_base_url'),
             "description": "Server"
         },
-    ]
+    ],
+    lifespan=lifespan,
 )
 
+# Break the scraping phases of every request down in a Server-Timing header
+@app.middleware("http")
+async def add_server_timing(request: Request, call_next):
+    metrics: MetricsManager = default_container.get(MetricsManager)
+    token = metrics.start_request()
+    try:
+        response = await call_next(request)
+    finally:
+        server_timing = metrics.end_request(token)
+    if server_timing:
+        response.headers['Server-Timing'] = server_timing
+    return response
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -34,11 +74,25 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+# Readiness endpoint, 503 until the startup warm-up is over
+# Unauthenticated, so the warmed-up usernames and their errors are only listed under /stats
+@app.get("/ready")
+async def ready_check():
+    lifecycle_manager: LifecycleManager = default_container.get(LifecycleManager)
+    content = {"state": lifecycle_manager.state, "duration_ms": lifecycle_manager.duration_ms}
+    if not lifecycle_manager.is_ready():
+        return JSONResponse(status_code=503, content={"status": "not_ready", **content})
+    return {"status": "ready", **content}
+
 # Include routers
 app.include_router(login_controller)
 app.include_router(job_posting_controller)
 app.include_router(company_controller)
 app.include_router(hirer_controller)
+app.include_router(stats_controller)
+app.include_router(metrics_controller)
+app.include_router(flight_recording_controller)
+app.include_router(crawl_job_controller)
 
 # Run the application (for development)
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from linkedinapi.model.FetchedPage import FetchedPage
+
+
+class FetchBackend:
+    """
+    Base class of the backends fetching the HTML of a LinkedIn page with a user's session.
+    """
+
+    name: str = ''
+
+    async def fetch(self, username: str, url: str, ready_selector: Optional[str] = None) -> Optional[FetchedPage]:
+        """
+        Fetch a page.
+
+        Args:
+            username: LinkedIn username whose session the page is fetched with
+            url: LinkedIn URL of the page
+            ready_selector: Selector present once the page content is there, for backends running scripts
+
+        Returns:
+            The fetched page, or None if it could not be fetched or the session was redirected to a login
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release the connections or browser resources held by the backend.
+        """
+
+    def get_stats(self) -> dict:
+        """
+        Get backend counters.
+
+        Returns:
+            Dictionary of counters
+        """
+        return {}
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+from injector import inject
+
+from linkedinapi.backend.FetchBackend import FetchBackend
+from linkedinapi.helper.SessionHelper import SessionHelper
+from linkedinapi.manager.RequestFilterManager import RequestFilterManager
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.model.FetchedPage import FetchedPage
+from linkedinapi.variable.HttpFetchConnectionsVariable import HttpFetchConnectionsVariable
+from linkedinapi.variable.HttpFetchTimeoutVariable import HttpFetchTimeoutVariable
+from linkedinapi.variable.LinkedinBaseUrlVariable import LinkedinBaseUrlVariable
+
+
+class _AccountClient:
+
+    def __init__(self, client: httpx.AsyncClient, mtime: Optional[float]) -> None:
+        self.client = client
+        self.mtime = mtime
+        self.in_flight = 0
+        self.retired = False
+
+
+class HttpFetchBackend(FetchBackend):
+    """
+    Backend fetching server-rendered pages over plain HTTP with the cookies of the stored sessions.
+
+    Every account gets its own pooled HTTP/2 client built from the cookies of its storage
+    state, rebuilt when the session file changes. No script runs, so only pages LinkedIn
+    renders on the server come back complete.
+    """
+
+    name = 'http'
+
+    HEADERS = {
+        'User-Agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/133.0.0.0 Safari/537.36",
+        'Accept': "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    }
+
+    @inject
+    def __init__(self, session_store: SessionStoreManager, base_url: LinkedinBaseUrlVariable,
+                 timeout: HttpFetchTimeoutVariable, connections: HttpFetchConnectionsVariable) -> None:
+        """
+        Initialize the HTTP backend.
+
+        Args:
+            session_store: Store the cookies of each user are read from
+            base_url: Origin serving LinkedIn requests in place of www.linkedin.com, empty for the real site
+            timeout: Seconds before a request is given up
+            connections: Maximum number of open connections per account
+        """
+        self.session_store = session_store
+        self.base_url = str(base_url).rstrip('/')
+        self.timeout = float(timeout)
+        self.connections = max(1, int(connections))
+        self.clients: Dict[str, _AccountClient] = {}
+        self.retired: List[_AccountClient] = []
+        self.lock: Optional[asyncio.Lock] = None
+        self.requests = 0
+        self.errors = 0
+        self.logged_out = 0
+        self.by_status: Dict[int, int] = {}
+        self.by_http_version: Dict[str, int] = {}
+        self.total_ms = 0.0
+
+    async def fetch(self, username: str, url: str, ready_selector: Optional[str] = None) -> Optional[FetchedPage]:
+        """
+        Fetch a page with a GET request, following redirects.
+
+        Args:
+            username: LinkedIn username whose cookies are sent
+            url: LinkedIn URL of the page
+            ready_selector: Ignored, no script runs
+
+        Returns:
+            The fetched page, or None on errors, non-200 answers or redirects to a login
+        """
+        account_client = await self._checkout_client(username)
+        self.requests += 1
+        started = time.perf_counter()
+        try:
+            response = await account_client.client.get(self._to_request_url(url))
+        except httpx.HTTPError as e:
+            self.errors += 1
+            logging.warning("HTTP fetch of %s failed: %s", url, e)
+            return None
+        finally:
+            account_client.in_flight -= 1
+            if account_client.retired and account_client.in_flight == 0:
+                await self._close_client(account_client)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.total_ms += elapsed_ms
+        self.by_status[response.status_code] = self.by_status.get(response.status_code, 0) + 1
+        self.by_http_version[response.http_version] = self.by_http_version.get(response.http_version, 0) + 1
+
+        final_url = self._to_linkedin_url(str(response.url))
+        if SessionHelper.is_logged_out_url(final_url):
+            self.logged_out += 1
+            return None
+        if response.status_code != 200:
+            return None
+        return FetchedPage(
+            url=final_url,
+            status=response.status_code,
+            html=response.text,
+            backend=self.name,
+            elapsed_ms=round(elapsed_ms, 1),
+        )
+
+    async def close(self) -> None:
+        """
+        Close the HTTP clients of every account.
+        """
+        account_clients = list(self.clients.values()) + self.retired
+        self.clients = {}
+        self.retired = []
+        for account_client in account_clients:
+            await account_client.client.aclose()
+
+    def get_stats(self) -> dict:
+        """
+        Get request counters.
+
+        Returns:
+            Dictionary with requests, errors, login redirects, answers by status and HTTP version and average time
+        """
+        answered = sum(self.by_status.values())
+        return {
+            "clients": len(self.clients),
+            "retired": len(self.retired),
+            "requests": self.requests,
+            "errors": self.errors,
+            "logged_out": self.logged_out,
+            "by_status": self.by_status,
+            "by_http_version": self.by_http_version,
+            "avg_ms": round(self.total_ms / answered, 1) if answered else 0.0,
+        }
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        return self.lock
+
+    async def _checkout_client(self, username: str) -> _AccountClient:
+        # The request is counted on the client before any await, so a rebuild can't close it under the request
+        mtime = await self.session_store.get_mtime(username)
+        account_client = self.clients.get(username)
+        if account_client is not None and account_client.mtime == mtime:
+            account_client.in_flight += 1
+            return account_client
+
+        # Concurrent first fetches of an account would each build a client, only one is kept
+        async with self._get_lock():
+            account_client = self.clients.get(username)
+            if account_client is not None and account_client.mtime == mtime:
+                account_client.in_flight += 1
+                return account_client
+
+            state = await self.session_store.get_state(username)
+            client = httpx.AsyncClient(
+                http2=True,
+                headers=self.HEADERS,
+                cookies=self._create_cookies(state),
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.connections, max_keepalive_connections=self.connections),
+                follow_redirects=True,
+            )
+            new_client = _AccountClient(client, mtime)
+            new_client.in_flight += 1
+            self.clients[username] = new_client
+
+        if account_client is not None:
+            # Requests may still be running on the old client, the last one to finish closes it
+            account_client.retired = True
+            if account_client.in_flight == 0:
+                await self._close_client(account_client)
+            else:
+                self.retired.append(account_client)
+        return new_client
+
+    async def _close_client(self, account_client: _AccountClient) -> None:
+        if account_client in self.retired:
+            self.retired.remove(account_client)
+        try:
+            await account_client.client.aclose()
+        except Exception as e:
+            logging.warning("Could not close a retired HTTP client: %s", e)
+
+    def _create_cookies(self, state: dict) -> httpx.Cookies:
+        cookies = httpx.Cookies()
+        now = time.time()
+        # Against the stand-in the cookies are scoped to its host instead of linkedin.com
+        base_domain = urlparse(self.base_url).hostname if self.base_url else None
+        for cookie in state.get('cookies', []):
+            expires = cookie.get('expires', -1)
+            if expires is not None and 0 < expires < now:
+                continue
+            domain = cookie.get('domain', '')
+            if not domain.lstrip('.').endswith('linkedin.com'):
+                continue
+            cookies.set(cookie['name'], cookie['value'], domain=base_domain or domain, path=cookie.get('path', '/'))
+        return cookies
+
+    def _to_request_url(self, url: str) -> str:
+        if self.base_url and url.startswith(RequestFilterManager.LINKEDIN_ORIGIN):
+            return self.base_url + url[len(RequestFilterManager.LINKEDIN_ORIGIN):]
+        return url
+
+    def _to_linkedin_url(self, url: str) -> str:
+        if self.base_url and url.startswith(self.base_url):
+            return RequestFilterManager.LINKEDIN_ORIGIN + url[len(self.base_url):]
+        return url
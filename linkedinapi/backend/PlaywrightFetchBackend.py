@@ -0,0 +1,88 @@
+import logging
+import time
+from typing import Optional
+
+from injector import inject
+
+from linkedinapi.backend.FetchBackend import FetchBackend
+from linkedinapi.helper.SessionHelper import SessionHelper
+from linkedinapi.manager.ContextPoolManager import ContextPoolManager
+from linkedinapi.model.FetchedPage import FetchedPage
+from linkedinapi.model.PageWaiter import PageWaiter
+from linkedinapi.variable.WaitBudgetVariable import WaitBudgetVariable
+
+
+class PlaywrightFetchBackend(FetchBackend):
+    """
+    Backend loading pages in a pooled browser tab, so the scripts of the page run before the HTML is read.
+    """
+
+    name = 'playwright'
+
+    @inject
+    def __init__(self, context_pool: ContextPoolManager, wait_budget: WaitBudgetVariable) -> None:
+        """
+        Initialize the Playwright backend.
+
+        Args:
+            context_pool: Pool of per-user browser contexts the tabs are taken from
+            wait_budget: Deadline in milliseconds for the ready selector to show up
+        """
+        self.context_pool = context_pool
+        self.wait_budget = int(wait_budget)
+        self.requests = 0
+        self.errors = 0
+        self.logged_out = 0
+        self.total_ms = 0.0
+
+    async def fetch(self, username: str, url: str, ready_selector: Optional[str] = None) -> Optional[FetchedPage]:
+        """
+        Load a page in a tab of the user's context and capture its HTML.
+
+        Args:
+            username: LinkedIn username whose context the tab belongs to
+            url: LinkedIn URL of the page
+            ready_selector: Selector to wait for before capturing, the load event otherwise
+
+        Returns:
+            The fetched page, or None on errors or redirects to a login
+        """
+        self.requests += 1
+        started = time.perf_counter()
+        try:
+            async with self.context_pool.acquire_page(username, 'blank') as page:
+                response = await page.goto(url, wait_until='commit' if ready_selector else 'load')
+                if ready_selector:
+                    await PageWaiter(page, self.wait_budget).for_selector('fetch_ready', ready_selector, required=False)
+                if SessionHelper.is_logged_out_url(page.url):
+                    self.logged_out += 1
+                    return None
+                html, final_url = await page.content(), page.url
+        except Exception as e:
+            self.errors += 1
+            logging.warning("Browser fetch of %s failed: %s", url, e)
+            return None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.total_ms += elapsed_ms
+        return FetchedPage(
+            url=final_url,
+            status=response.status if response is not None else 200,
+            html=html,
+            backend=self.name,
+            elapsed_ms=round(elapsed_ms, 1),
+        )
+
+    def get_stats(self) -> dict:
+        """
+        Get request counters.
+
+        Returns:
+            Dictionary with requests, errors, login redirects and average time
+        """
+        answered = self.requests - self.errors - self.logged_out
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "logged_out": self.logged_out,
+            "avg_ms": round(self.total_ms / answered, 1) if answered > 0 else 0.0,
+        }
@@ -1,15 +1,31 @@
-import json
-import os
+import asyncio
 import time
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, ContextManager, List, Optional, Tuple
 
 from injector import inject
-from playwright.async_api import async_playwright
+from playwright.async_api import Page
 
+from linkedinapi.exception.LoggedOutError import LoggedOutError
 from linkedinapi.factory.CompanyFactory import CompanyFactory
 from linkedinapi.factory.HirerFactory import HirerFactory
 from linkedinapi.factory.JobPostingInfoFactory import JobPostingInfoFactory
 from linkedinapi.factory.JobPostingListingItemFactory import JobPostingListingItemFactory
+from linkedinapi.helper.JobSearchUrlHelper import JobSearchUrlHelper
+from linkedinapi.helper.SessionHelper import SessionHelper
+from linkedinapi.manager.AccountSchedulerManager import AccountSchedulerManager
+from linkedinapi.manager.BrowserManager import BrowserManager
+from linkedinapi.manager.ContextPoolManager import ContextPoolManager
+from linkedinapi.manager.FetchBackendManager import FetchBackendManager
+from linkedinapi.manager.FlightRecorderManager import FlightRecorderManager
+from linkedinapi.manager.MetricsManager import MetricsManager
+from linkedinapi.manager.PagePool import PagePool
+from linkedinapi.manager.RequestFilterManager import RequestFilterManager
+from linkedinapi.manager.SearchPageCacheManager import SearchPageCacheManager
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.manager.SnapshotArchiveManager import SnapshotArchiveManager
+from linkedinapi.manager.SnapshotParserManager import SnapshotParserManager
+from linkedinapi.manager.WaitStatsManager import WaitStatsManager
 from linkedinapi.model.Company import Company
 from linkedinapi.model.CompanySinglePage import CompanySinglePage
 from linkedinapi.model.Hirer import Hirer
@@ -18,7 +34,14 @@ from linkedinapi.model.JobPostingInfo import JobPostingInfo
 from linkedinapi.model.JobPostingListingItem import JobPostingListingItem
 from linkedinapi.model.JobPostingSearchPage import JobPostingSearchPage
 from linkedinapi.model.JobPostingSinglePage import JobPostingSinglePage
-from linkedinapi.variable.SessionDirVariable import SessionDirVariable
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+from linkedinapi.model.LoginPage import LoginPage
+from linkedinapi.model.LoginResult import LoginResult
+from linkedinapi.model.PageWaiter import PageWaiter
+from linkedinapi.model.ResponseCapture import ResponseCapture
+from linkedinapi.variable.ExtractionEngineVariable import ExtractionEngineVariable
+from linkedinapi.variable.SearchFanOutVariable import SearchFanOutVariable
+from linkedinapi.variable.WaitBudgetVariable import WaitBudgetVariable
 
 
 class LinkedinClient:
@@ -29,103 +52,336 @@ class LinkedinClient:
     and authenticate with LinkedIn using Playwright for browser automation.
     """
 
-    headless: bool = False
+    LOGIN_MESSAGES = {
+        'already_logged_in': "Already logged in",
+        'success': "Logged in",
+        'wrong_credentials': "LinkedIn rejected the username or password",
+        'checkpoint': "LinkedIn asks for a verification step (2FA, email or phone), complete it in a browser",
+        'captcha': "LinkedIn asks to solve a captcha, complete the login in a browser",
+        'timeout': "The login page didn't reach a known state in time",
+    }
+
+    # Fields a model fetched without the browser flow must have, or the browser flow runs
+    REQUIRED_FIELDS = {
+        'job_posting': ('title', 'description'),
+        'company': ('name',),
+        'hirer': ('name',),
+    }
 
     @inject
-    def __init__(self, session_dir: SessionDirVariable) -> None:
+    def __init__(self, session_store: SessionStoreManager, browser_manager: BrowserManager,
+                 context_pool: ContextPoolManager, request_filter: RequestFilterManager,
+                 wait_stats: WaitStatsManager, wait_budget: WaitBudgetVariable,
+                 extraction_engine: ExtractionEngineVariable, snapshot_parser: SnapshotParserManager,
+                 snapshot_archive: SnapshotArchiveManager, search_page_cache: SearchPageCacheManager,
+                 search_fan_out: SearchFanOutVariable, account_scheduler: AccountSchedulerManager,
+                 metrics: MetricsManager, flight_recorder: FlightRecorderManager,
+                 fetch_backends: FetchBackendManager) -> None:
         """
         Initialize the LinkedIn client.
         
         Args:
-            session_dir: Directory path where browser session data will be stored
+            session_store: In-memory store of the users' storage state
+            browser_manager: Manager owning the shared Chromium instance
+            context_pool: Pool of per-user browser contexts
+            request_filter: Filter blocking resources the scrapers don't need
+            wait_stats: Aggregator of page wait timings
+            wait_budget: Deadline in milliseconds for the waits of a single scrape step
+            extraction_engine: 'dom' to read fields in the live page, 'snapshot' to parse captured HTML,
+                'network' to decode the JSON the page fetches, falling back to 'dom'
+            snapshot_parser: Worker pool parsing captured HTML
+            snapshot_archive: Archive of compressed page snapshots
+            search_page_cache: Short-lived cache of extracted search result pages
+            search_fan_out: Number of search result pages fetched in parallel
+            account_scheduler: Scheduler pacing the operations of each account
+            metrics: Metrics the operations and their phases are timed in
+            flight_recorder: Recorder tracing a sample of the operations
+            fetch_backends: Router trying cheaper backends than the browser flow first
         """
-        self.session_dir = session_dir
+        self.session_store = session_store
+        self.browser_manager = browser_manager
+        self.context_pool = context_pool
+        self.request_filter = request_filter
+        self.wait_stats = wait_stats
+        self.wait_budget = int(wait_budget)
+        self.extraction_engine = str(extraction_engine)
+        self.snapshot_parser = snapshot_parser
+        self.snapshot_archive = snapshot_archive
+        self.search_page_cache = search_page_cache
+        self.search_fan_out = max(1, int(search_fan_out))
+        self.account_scheduler = account_scheduler
+        self.metrics = metrics
+        self.flight_recorder = flight_recorder
+        self.fetch_backends = fetch_backends
 
-    def get_session_path(self, username: str) -> str:
+    @asynccontextmanager
+    async def _acquire_page(self, username: str, route: str, operation: str, key: str) -> AsyncIterator[Page]:
         """
-        Get the path to the browser session file for a specific user.
-        
-        Creates an empty session file if it doesn't exist.
-        
+        Wait for the account's turn in the scheduler, then check out a warm tab of its context.
+
+        The block is traced by the flight recorder when the operation is sampled.
+
         Args:
-            username: LinkedIn username
-            
+            username: LinkedIn username whose session the tab is loaded with
+            route: Name of the route the tab should be parked on, one of PagePool.ROUTES
+            operation: Name of the operation the tab is used for
+            key: Entity key of the operation, e.g. job id or company slug
+
+        Yields:
+            Page parked on the requested route
+        """
+        started = time.perf_counter()
+        async with self.account_scheduler.slot(username):
+            self.metrics.record_phase('schedule', time.perf_counter() - started)
+            acquire_started = time.perf_counter()
+            async with self.context_pool.acquire_page(username, route) as page:
+                self.metrics.record_phase('page_acquire', time.perf_counter() - acquire_started)
+                async with self.flight_recorder.record(operation, key, username, page, started):
+                    yield page
+
+    def _create_waiter(self, page: Page) -> PageWaiter:
+        """
+        Create a page waiter bound to the configured budget and wait statistics.
+
+        Args:
+            page: Page to wait on
+
         Returns:
-            Full path to the session file
+            PageWaiter recording into the shared wait statistics and the phase metrics
         """
-        p = os.path.join(self.session_dir, "linkedin_" + username + '.json')
-        if not os.path.exists(p):
-            with open(p, 'w') as f:
-                f.write('{}')
-        return p
+        return PageWaiter(page, self.wait_budget, self._record_wait)
 
-    def _is_already_logged_in(self, username: str) -> bool:
+    def _record_wait(self, step: str, elapsed_ms: float, ok: bool) -> None:
+        self.wait_stats.record(step, elapsed_ms, ok)
+        self.metrics.record_phase(f"wait_{step}", elapsed_ms / 1000)
+
+    def _time_field(self, field: str) -> ContextManager:
+        return self.metrics.phase(f"extract_{field}")
+
+    def _create_capture(self, page: Page) -> Optional[ResponseCapture]:
         """
-        Check if the user is already logged in by verifying the session file.
-        
+        Start capturing the data API responses of a page when the network engine is enabled.
+
         Args:
-            username: LinkedIn username
-            
+            page: Page about to navigate
+
         Returns:
-            True if the user is already logged in, False otherwise
+            Started ResponseCapture, or None with the other engines
         """
-        session_path = self.get_session_path(username)
-        if not os.path.exists(session_path):
-            return False
-        
-        with open(session_path, 'r') as f:
-            session_data = json.load(f)
-        
-        if 'cookies' not in session_data:
+        if self.extraction_engine != 'network':
+            return None
+        capture = ResponseCapture(page)
+        capture.start()
+        return capture
+
+    async def _build_from_snapshot(self, kind: str, key: str, page: Page) -> Any:
+        """
+        Capture the current HTML of a page and build its model on the snapshot parser.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            key: Entity key used to archive the snapshot
+            page: Page to capture
+
+        Returns:
+            Model built from the captured HTML
+        """
+        html, url = await page.content(), page.url
+        return await self._build_from_html(kind, key, html, url)
+
+    async def _build_from_html(self, kind: str, key: str, html: str, url: str) -> Any:
+        """
+        Archive a captured page and build its model on the snapshot parser.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            key: Entity key used to archive the snapshot
+            html: Captured page HTML
+            url: URL the page was captured at
+
+        Returns:
+            Model built from the HTML
+        """
+        await self.snapshot_archive.archive(kind, key, url, html)
+        return await self.snapshot_parser.build(kind, html, url)
+
+    async def _fetch_without_browser(self, kind: str, username: str, key: str, url: str,
+                                     ready_selector: str) -> Any:
+        """
+        Build a model from the page fetched by the backend routed for its kind, if any.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS, also the operation name
+            username: LinkedIn username whose session the page is fetched with
+            key: Entity key used to archive the snapshot
+            url: LinkedIn URL of the page
+            ready_selector: Selector present once the page content is there
+
+        Returns:
+            The complete model, or None when the browser flow is needed
+        """
+        return await self.fetch_backends.fetch(
+            kind, username, url,
+            lambda fetched_page: self._build_from_html(kind, key, fetched_page.html, fetched_page.url),
+            lambda model: self._is_complete(kind, model),
+            ready_selector,
+        )
+
+    def _is_complete(self, kind: str, model: Any) -> bool:
+        if any(not getattr(model, field) for field in self.REQUIRED_FIELDS[kind]):
             return False
-        
-        current_time = time.time()
-        for cookie in session_data['cookies']:
-            if cookie.get('expires', 0) > current_time:
-                return True
-        
-        return False
+        # The external apply URL only exists behind a click in a live tab
+        return kind != 'job_posting' or model.is_simple or model.disabled or bool(model.external_url)
 
-    async def search(self, username: str, query: str, location: str, limit_first_page: bool = False,
-               filter_date: Optional[int] = None) -> List[JobPostingListingItem]:
+    async def search(self, username: str, search_query: JobSearchQuery,
+                     limit_first_page: bool = False) -> List[JobPostingListingItem]:
         """
         Search for job listings on LinkedIn with specified criteria.
         
         Args:
             username: LinkedIn username to load browser session
-            query: Job search query (title, skill, or company)
-            location: Location to search in
+            search_query: Search criteria, starting at the result offset it carries
             limit_first_page: If True, only return results from the first page
-            filter_date: Filter for job posting date (None=no filter, 1=24h, 2=week, etc.)
             
         Returns:
             List of job posting items matching the search criteria
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            session = await browser.new_context(storage_state=self.get_session_path(username))
-            page = await session.new_page()
+        return [job_posting async for job_posting in self.iter_search(username, search_query, limit_first_page)]
 
-            job_search_page = JobPostingSearchPage(page)
-            await job_search_page.search_jobs(query, location, filter_date)
+    async def iter_search(self, username: str, search_query: JobSearchQuery,
+                          limit_first_page: bool = False) -> AsyncIterator[JobPostingListingItem]:
+        """
+        Search for job listings, yielding them page by page as soon as each page is extracted.
 
-            job_postings = []
-            has_next_page = True
+        After the first page, the following ones are fetched search_fan_out at a time
+        in parallel tabs, until the result count LinkedIn reports is reached; pages past that count are not
+        fetched. Pages are yielded in result order and no new window is started before the consumer has
+        drained the previous one.
 
-            while has_next_page:
-                job_cards = await job_search_page.get_job_cards()
-                for job_card in job_cards:
-                    job_posting = await JobPostingListingItemFactory.create_from_job_posting_search_card(job_card)
-                    job_postings.append(job_posting)
-                if limit_first_page:
-                    has_next_page = False
-                else:
-                    has_next_page = await job_search_page.has_next_page()
-                    if has_next_page:
-                        await job_search_page.go_to_next_page()
+        Args:
+            username: LinkedIn username to load browser session
+            search_query: Search criteria, starting at the result offset it carries
+            limit_first_page: If True, only yield results from the first page
+
+        Yields:
+            Job posting items matching the search criteria
+        """
+        job_postings, next_query, result_count = await self._search_page(username, search_query)
+        for job_posting in job_postings:
+            yield job_posting
+        if limit_first_page:
+            return
+
+        while next_query is not None:
+            last_start = JobSearchUrlHelper.MAX_START
+            if result_count is not None:
+                last_start = min(last_start, result_count - 1)
+            window = [
+                next_query.with_start(next_query.start + i * JobSearchUrlHelper.PAGE_SIZE)
+                for i in range(self.search_fan_out)
+                if next_query.start + i * JobSearchUrlHelper.PAGE_SIZE <= last_start
+            ]
+            tasks = [asyncio.ensure_future(self._search_page(username, page_query)) for page_query in window]
+            try:
+                for task in tasks:
+                    started = time.perf_counter()
+                    job_postings, next_query, page_result_count = await task
+                    if page_result_count is not None:
+                        result_count = page_result_count
+                    self.metrics.record_phase('next_page', time.perf_counter() - started, operation='search')
+                    for job_posting in job_postings:
+                        yield job_posting
+                    if next_query is None:
+                        break
+            finally:
+                # The consumer went away or the search ended early: drop the pages still loading
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def search_page(self, username: str, search_query: JobSearchQuery
+                          ) -> Tuple[List[JobPostingListingItem], Optional[JobSearchQuery]]:
+        """
+        Get a single result page of a search, at the offset carried by the query.
+
+        Args:
+            username: LinkedIn username to load browser session
+            search_query: Search criteria and offset of the page
+
+        Returns:
+            Tuple of the page items and the query of the next page, None if this is the last one
+        """
+        job_postings, next_query, _ = await self._search_page(username, search_query)
+        return job_postings, next_query
+
+    async def _search_page(self, username: str, search_query: JobSearchQuery
+                           ) -> Tuple[List[JobPostingListingItem], Optional[JobSearchQuery], Optional[int]]:
+        """
+        Get a single result page of a search, along with the result count LinkedIn reported on it.
+
+        Args:
+            username: LinkedIn username to load browser session
+            search_query: Search criteria and offset of the page
+
+        Returns:
+            Tuple of the page items, the query of the next page, None if this is the last one, and the
+            result count of the search, None if it wasn't reported or the page came from the cache
+        """
+        cached = self.search_page_cache.get(username, search_query)
+        if cached is not None:
+            return cached[0], cached[1], None
+
+        async with self.metrics.operation('search_page'):
+            async with self._acquire_page(username, 'jobs_search', 'search_page',
+                                          f"{search_query.keywords}@{search_query.start}") as page:
+                self.request_filter.set_profile(page, self.request_filter.default_profile)
+                capture = self._create_capture(page)
+                job_search_page = JobPostingSearchPage(page, self._create_waiter(page), capture)
+                try:
+                    job_postings = []
+                    result_count = None
+                    with self.metrics.phase('goto'):
+                        has_results = await job_search_page.search_jobs(search_query)
+                    if has_results:
+                        if self.extraction_engine == 'snapshot':
+                            with self.metrics.phase('load_cards'):
+                                await job_search_page.load_job_cards()
+                            with self.metrics.phase('extract'):
+                                job_postings = await self._build_from_snapshot('job_search', search_query.keywords, page)
+                        else:
+                            with self.metrics.phase('extract'):
+                                job_postings = await self._extract_job_cards(job_search_page)
+                        result_count = await job_search_page.get_result_count()
+                    partial = job_search_page.has_partial_cards()
+                finally:
+                    if capture is not None:
+                        capture.stop()
+
+            for job_posting in job_postings:
+                self.metrics.record_misses('search_page', job_posting.model_dump())
 
-            await browser.close()
-            return job_postings
+        next_start = JobSearchUrlHelper.get_next_start(search_query, len(job_postings), result_count)
+        next_query = search_query.with_start(next_start) if next_start >= 0 else None
+        # A page left empty or short by a timeout is served once, the next call loads it again
+        if not partial:
+            self.search_page_cache.put(username, search_query, job_postings, next_query)
+        return job_postings, next_query, result_count
+
+    async def _extract_job_cards(self, job_search_page: JobPostingSearchPage) -> List[JobPostingListingItem]:
+        """
+        Extract the job cards of a loaded result page, from the captured search API responses
+        when there are any, from the rendered cards otherwise.
+
+        Args:
+            job_search_page: Page object of the loaded result page
+
+        Returns:
+            List of JobPostingListingItem objects
+        """
+        job_cards_payload = await job_search_page.capture_job_cards()
+        if job_cards_payload is None:
+            job_cards_payload = await job_search_page.extract_job_cards()
+        return JobPostingListingItemFactory.create_all_from_job_posting_search_payload(job_cards_payload)
 
     async def get_job_posting(self, username: str, job_id: int) -> Optional[JobPostingInfo]:  # Return should be JobPostingInfo, needs import
         """
@@ -138,21 +394,70 @@ class LinkedinClient:
         Returns:
             JobPostingInfo object containing detailed job information
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            session = await browser.new_context(storage_state=self.get_session_path(username))
-            page = await session.new_page()
+        job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+        async with self.metrics.operation('job_posting'):
+            job_posting_info = await self._fetch_without_browser(
+                'job_posting', username, str(job_id), job_url, JobPostingSinglePage.ready_selector
+            )
+            if job_posting_info is not None:
+                self.metrics.record_misses('job_posting', job_posting_info.model_dump())
+                return job_posting_info
+
+            async with self._acquire_page(username, 'job_view', 'job_posting', str(job_id)) as page:
+                # External apply tabs opened from this page get the popup profile of the configured one
+                self.request_filter.set_profile(page, self.request_filter.default_profile)
 
-            # Navigate to job posting page
-            job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-            await page.goto(job_url)
+                capture = self._create_capture(page)
+                try:
+                    # Navigate to job posting page
+                    with self.metrics.phase('goto'):
+                        await PagePool.soft_goto(page, job_url, JobPostingSinglePage.ready_selector)
 
-            job_posting_single_page = JobPostingSinglePage(page)
-            job_posting_info = await JobPostingInfoFactory.create_from_job_posting_single_page(job_posting_single_page)
+                    job_posting_single_page = JobPostingSinglePage(page, self._create_waiter(page), capture)
+                    with self.metrics.phase('extract'):
+                        job_posting_info = await self._extract_job_posting(job_posting_single_page, job_id, page)
+                finally:
+                    if capture is not None:
+                        capture.stop()
 
-            await browser.close()
+            self.metrics.record_misses('job_posting', job_posting_info.model_dump())
             return job_posting_info
 
+    async def _extract_job_posting(self, job_posting_single_page: JobPostingSinglePage, job_id: int,
+                                   page: Page) -> JobPostingInfo:
+        """
+        Extract a job posting from its loaded page with the configured engine.
+
+        Args:
+            job_posting_single_page: Page object of the job posting
+            job_id: LinkedIn job posting ID
+            page: Tab the job posting is loaded in
+
+        Returns:
+            JobPostingInfo object containing detailed job information
+        """
+        if self.extraction_engine == 'network':
+            job_posting_info = await JobPostingInfoFactory.create_from_captured_job_posting(
+                job_posting_single_page, job_id
+            )
+            if job_posting_info is not None:
+                if not (job_posting_info.is_simple or job_posting_info.disabled or job_posting_info.external_url):
+                    with self.metrics.phase('extract_external_url'):
+                        job_posting_info.external_url = await job_posting_single_page.get_external_url()
+                return job_posting_info
+
+        if self.extraction_engine != 'snapshot':
+            return await JobPostingInfoFactory.create_from_job_posting_single_page(job_posting_single_page)
+
+        await job_posting_single_page.wait_until_loaded()
+        job_posting_info = await self._build_from_snapshot('job_posting', str(job_id), page)
+        # The external URL only exists behind a click, so it still needs the live tab
+        if not job_posting_info.is_simple and not job_posting_info.disabled:
+            with self.metrics.phase('extract_external_url'):
+                job_posting_info.external_url = await job_posting_single_page.get_external_url()
+
+        return job_posting_info
+
     async def get_company(self, username: str, company_slug: str) -> Optional[Company]:
         """
         Get detailed information about a specific company.
@@ -164,22 +469,39 @@ class LinkedinClient:
         Returns:
             CompanyInfo object containing detailed company information
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            session = await browser.new_context(storage_state=self.get_session_path(username))
-            page = await session.new_page()
+        company_url = f"https://www.linkedin.com/company/{company_slug}/"
+        async with self.metrics.operation('company'):
+            company = await self._fetch_without_browser('company', username, company_slug, company_url, CompanySinglePage.ready_selector)
+            if company is not None:
+                self.metrics.record_misses('company', company.model_dump())
+                return company
 
-            # Navigate to company page
-            company_url = f"https://www.linkedin.com/company/{company_slug}/"
-            await page.goto(company_url)
+            async with self._acquire_page(username, 'blank', 'company', company_slug) as page:
+                # Navigate to company page
+                with self.metrics.phase('goto'):
+                    await page.goto(company_url, wait_until='commit')
 
-            await page.wait_for_timeout(2000)
+                waiter = self._create_waiter(page)
+                await waiter.for_selector('company_ready', CompanySinglePage.ready_selector, required=False)
+                if SessionHelper.is_logged_out_url(page.url):
+                    raise LoggedOutError(username, page.url)
 
-            company_single_page = CompanySinglePage(page)
-            company_info = await CompanyFactory.create_from_company_single_page(company_single_page)
+                if self.extraction_engine == 'snapshot':
+                    # The website may only be in the overflow menu, rendered once the live page opens it
+                    await CompanySinglePage(page).open_overflow_menu()
+                    html, url = await page.content(), page.url
+                else:
+                    with self.metrics.phase('extract'):
+                        company = await CompanyFactory.create_from_company_single_page(
+                            CompanySinglePage(page), self._time_field
+                        )
 
-            await browser.close()
-            return company_info
+            if self.extraction_engine == 'snapshot':
+                with self.metrics.phase('extract'):
+                    company = await self._build_from_html('company', company_slug, html, url)
+            if company is not None:
+                self.metrics.record_misses('company', company.model_dump())
+            return company
 
     async def get_hirer(self, username: str, hirer_slug: str) -> Optional[Hirer]:
         """
@@ -192,52 +514,86 @@ class LinkedinClient:
         Returns:
             Hirer object containing detailed hirer information
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            session = await browser.new_context(storage_state=self.get_session_path(username))
-            page = await session.new_page()
+        hirer_url = f"https://www.linkedin.com/in/{hirer_slug}/"
+        async with self.metrics.operation('hirer'):
+            hirer = await self._fetch_without_browser('hirer', username, hirer_slug, hirer_url, HirerSinglePage.ready_selector)
+            if hirer is not None:
+                self.metrics.record_misses('hirer', hirer.model_dump())
+                return hirer
 
-            # Navigate to hirer page
-            hirer_url = f"https://www.linkedin.com/in/{hirer_slug}/"
-            await page.goto(hirer_url)
+            async with self._acquire_page(username, 'blank', 'hirer', hirer_slug) as page:
+                # Navigate to hirer page
+                with self.metrics.phase('goto'):
+                    await page.goto(hirer_url, wait_until='commit')
 
-            await page.wait_for_timeout(2000)
+                waiter = self._create_waiter(page)
+                await waiter.for_selector('hirer_ready', HirerSinglePage.ready_selector, required=False)
+                if SessionHelper.is_logged_out_url(page.url):
+                    raise LoggedOutError(username, page.url)
 
-            hirer_single_page = HirerSinglePage(page)
-            hirer_info = await HirerFactory.create_from_hirer_single_page(hirer_single_page)
+                if self.extraction_engine == 'snapshot':
+                    html, url = await page.content(), page.url
+                else:
+                    with self.metrics.phase('extract'):
+                        hirer = await HirerFactory.create_from_hirer_single_page(
+                            HirerSinglePage(page), self._time_field
+                        )
 
-            await browser.close()
-            return hirer_info
+            if self.extraction_engine == 'snapshot':
+                with self.metrics.phase('extract'):
+                    hirer = await self._build_from_html('hirer', hirer_slug, html, url)
+            if hirer is not None:
+                self.metrics.record_misses('hirer', hirer.model_dump())
+            return hirer
 
-    async def login(self, username: str, password: str) -> None:
+    async def login(self, username: str, password: str) -> LoginResult:
         """
         Login to LinkedIn using provided credentials.
         
-        Automates the login process and saves the session for future use.
+        Automates the login process and saves the session for future use. Returns as soon
+        as the page after the submit shows how the login went. A live session is reused only
+        for the password of the login that created it, any other password is checked by LinkedIn.
         
         Args:
             username: LinkedIn username/email
             password: LinkedIn password
+
+        Returns:
+            LoginResult with the outcome, the URL it was detected at and the time it took
         """
-        if self._is_already_logged_in(username):
-            return
+        logged_in = await self.session_store.is_logged_in(username)
+        if logged_in and await self.session_store.check_password(username, password):
+            return LoginResult(outcome='success', message=self.LOGIN_MESSAGES['already_logged_in'])
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            session = await browser.new_context(storage_state=self.get_session_path(username))
-            page = await session.new_page()
-            
-            # Navigate to login page
-            await page.goto("https://www.linkedin.com/login")
-            
-            # Fill in credentials and submit
-            await page.fill("input#username", username)
-            await page.fill("input#password", password)
-            await page.click("button[type=submit]")
-            
-            # Wait for login to complete
-            await page.wait_for_timeout(50000)
-            
-            # Save session state for future use
-            await page.context.storage_state(path=self.get_session_path(username))
-            await browser.close()
+        started = time.monotonic()
+        async with self.metrics.operation('login'):
+            with self.metrics.phase('context_create'):
+                # LinkedIn skips the password form for a live session, so an unverified password starts from a blank one
+                session = await self.browser_manager.new_context(
+                    storage_state=None if logged_in else await self.session_store.get_state(username)
+                )
+            try:
+                await self.request_filter.install(session, self.request_filter.login_profile)
+                page = await session.new_page()
+                self.request_filter.set_profile(page, self.request_filter.login_profile)
+
+                login_page = LoginPage(page)
+                with self.metrics.phase('submit'):
+                    await login_page.submit(username, password)
+                outcome, url = await login_page.wait_for_outcome(self._create_waiter(page), self.wait_budget)
+
+                # Save session state for future use
+                if outcome == 'success':
+                    await self.session_store.save_context(username, session)
+                    await self.session_store.save_password(username, password)
+            finally:
+                await session.close()
+
+        if outcome == 'success':
+            await self.context_pool.invalidate(username)
+        return LoginResult(
+            outcome=outcome,
+            message=self.LOGIN_MESSAGES[outcome],
+            url=url,
+            elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+        )
@@ -2,12 +2,73 @@ import logging
 import os
 
 from dotenv import load_dotenv
-from injector import Injector
+from injector import Injector, singleton
 
 from linkedinapi.client.LinkedinClient import LinkedinClient
+from linkedinapi.manager.AccountPoolManager import AccountPoolManager
+from linkedinapi.manager.AccountSchedulerManager import AccountSchedulerManager
+from linkedinapi.manager.BatchManager import BatchManager
+from linkedinapi.manager.BrowserManager import BrowserManager
+from linkedinapi.manager.ContextPoolManager import ContextPoolManager
+from linkedinapi.manager.CrawlJobManager import CrawlJobManager
+from linkedinapi.manager.EntityCacheManager import EntityCacheManager
+from linkedinapi.manager.FetchBackendManager import FetchBackendManager
+from linkedinapi.manager.FlightRecorderManager import FlightRecorderManager
+from linkedinapi.manager.LifecycleManager import LifecycleManager
+from linkedinapi.manager.MetricsManager import MetricsManager
+from linkedinapi.manager.RequestFilterManager import RequestFilterManager
+from linkedinapi.manager.SearchPageCacheManager import SearchPageCacheManager
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.manager.SingleFlightManager import SingleFlightManager
+from linkedinapi.manager.SnapshotArchiveManager import SnapshotArchiveManager
+from linkedinapi.manager.SnapshotParserManager import SnapshotParserManager
+from linkedinapi.manager.WaitStatsManager import WaitStatsManager
 from linkedinapi.service.JobPostingService import JobPostingService
+from linkedinapi.variable.AccountBurstVariable import AccountBurstVariable
+from linkedinapi.variable.AccountConcurrencyVariable import AccountConcurrencyVariable
+from linkedinapi.variable.AccountPoolAttemptsVariable import AccountPoolAttemptsVariable
+from linkedinapi.variable.AccountPoolCooldownVariable import AccountPoolCooldownVariable
+from linkedinapi.variable.AccountPoolEnabledVariable import AccountPoolEnabledVariable
+from linkedinapi.variable.AccountPoolVariable import AccountPoolVariable
+from linkedinapi.variable.AccountRateVariable import AccountRateVariable
+from linkedinapi.variable.AccountWeightsVariable import AccountWeightsVariable
+from linkedinapi.variable.BatchConcurrencyVariable import BatchConcurrencyVariable
+from linkedinapi.variable.ContextPoolIdleTimeoutVariable import ContextPoolIdleTimeoutVariable
+from linkedinapi.variable.ContextPoolSizeVariable import ContextPoolSizeVariable
+from linkedinapi.variable.CrawlJobDbPathVariable import CrawlJobDbPathVariable
+from linkedinapi.variable.CrawlWorkersVariable import CrawlWorkersVariable
+from linkedinapi.variable.EntityCacheDbPathVariable import EntityCacheDbPathVariable
+from linkedinapi.variable.EntityCacheNegativeTtlVariable import EntityCacheNegativeTtlVariable
+from linkedinapi.variable.EntityCachePersistVariable import EntityCachePersistVariable
+from linkedinapi.variable.EntityCacheSizeVariable import EntityCacheSizeVariable
+from linkedinapi.variable.EntityCacheStaleTtlVariable import EntityCacheStaleTtlVariable
+from linkedinapi.variable.EntityCacheTtlsVariable import EntityCacheTtlsVariable
+from linkedinapi.variable.ExtractionEngineVariable import ExtractionEngineVariable
+from linkedinapi.variable.FetchRoutesVariable import FetchRoutesVariable
+from linkedinapi.variable.FlightRecorderDirVariable import FlightRecorderDirVariable
+from linkedinapi.variable.FlightRecorderHarVariable import FlightRecorderHarVariable
+from linkedinapi.variable.FlightRecorderMaxSizeVariable import FlightRecorderMaxSizeVariable
+from linkedinapi.variable.FlightRecorderSampleRateVariable import FlightRecorderSampleRateVariable
+from linkedinapi.variable.FlightRecorderScreenshotsVariable import FlightRecorderScreenshotsVariable
+from linkedinapi.variable.FlightRecorderThresholdVariable import FlightRecorderThresholdVariable
+from linkedinapi.variable.GlobalConcurrencyVariable import GlobalConcurrencyVariable
+from linkedinapi.variable.HttpFetchConnectionsVariable import HttpFetchConnectionsVariable
+from linkedinapi.variable.HttpFetchTimeoutVariable import HttpFetchTimeoutVariable
+from linkedinapi.variable.LinkedinBaseUrlVariable import LinkedinBaseUrlVariable
+from linkedinapi.variable.LoginRequestFilterProfileVariable import LoginRequestFilterProfileVariable
+from linkedinapi.variable.PagePoolSizeVariable import PagePoolSizeVariable
+from linkedinapi.variable.RequestFilterProfileVariable import RequestFilterProfileVariable
+from linkedinapi.variable.SearchFanOutVariable import SearchFanOutVariable
+from linkedinapi.variable.SearchPageCacheTtlVariable import SearchPageCacheTtlVariable
 from linkedinapi.variable.SecretKeyVariable import SecretKeyVariable
 from linkedinapi.variable.SessionDirVariable import SessionDirVariable
+from linkedinapi.variable.SnapshotArchiveEnabledVariable import SnapshotArchiveEnabledVariable
+from linkedinapi.variable.SnapshotDirVariable import SnapshotDirVariable
+from linkedinapi.variable.SnapshotParserPoolVariable import SnapshotParserPoolVariable
+from linkedinapi.variable.SnapshotParserWorkersVariable import SnapshotParserWorkersVariable
+from linkedinapi.variable.WaitBudgetVariable import WaitBudgetVariable
+from linkedinapi.variable.WarmupEnabledVariable import WarmupEnabledVariable
+from linkedinapi.variable.WarmupRoutesVariable import WarmupRoutesVariable
 
 
 class DefaultContainer:
@@ -47,18 +108,152 @@ class DefaultContainer:
         self.session_dir = os.path.join(self.var_dir, 'session')
         os.makedirs(self.session_dir, exist_ok=True)
 
+        self.snapshot_dir = os.path.join(self.var_dir, 'snapshot')
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+        self.cache_dir = os.path.join(self.var_dir, 'cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.entity_cache_db_path = os.path.join(self.cache_dir, 'entity.sqlite')
+
+        self.crawl_job_dir = os.path.join(self.var_dir, 'jobs')
+        os.makedirs(self.crawl_job_dir, exist_ok=True)
+        self.crawl_job_db_path = os.path.join(self.crawl_job_dir, 'jobs.sqlite')
+
+        self.flight_recorder_dir = os.path.join(self.var_dir, 'flight_recorder')
+        os.makedirs(self.flight_recorder_dir, exist_ok=True)
+
     def _init_environment_variables(self):
         # self.pandoc_executable = os.environ.get('PANDOC_EXECUTABLE', 'pandoc')
         self.api_host = os.environ.get('API_HOST', '0.0.0.0')
         self.api_port = int(os.environ.get('API_PORT', 8000))
         self.api_base_url = os.environ.get('API_BASE_URL', "http://" + self.api_host + ":" + str(self.api_port))
         self.secret_key = os.environ.get('SECRET_KEY')
+        self.context_pool_size = int(os.environ.get('CONTEXT_POOL_SIZE', 8))
+        self.context_pool_idle_timeout = int(os.environ.get('CONTEXT_POOL_IDLE_TIMEOUT', 600))
+        self.page_pool_size = int(os.environ.get('PAGE_POOL_SIZE', 2))
+        self.request_filter_profile = os.environ.get('REQUEST_FILTER_PROFILE', 'strict')
+        self.login_request_filter_profile = os.environ.get('LOGIN_REQUEST_FILTER_PROFILE', 'relaxed')
+        self.linkedin_base_url = os.environ.get('LINKEDIN_BASE_URL', '')
+        self.wait_budget = int(os.environ.get('WAIT_BUDGET_MS', 30000))
+        self.extraction_engine = os.environ.get('EXTRACTION_ENGINE', 'dom')
+        self.snapshot_parser_pool = os.environ.get('SNAPSHOT_PARSER_POOL', 'thread')
+        self.snapshot_parser_workers = int(os.environ.get('SNAPSHOT_PARSER_WORKERS', 2))
+        self.snapshot_archive_enabled = int(os.environ.get('SNAPSHOT_ARCHIVE', 0))
+        self.search_fan_out = int(os.environ.get('SEARCH_FAN_OUT', 3))
+        self.search_page_cache_ttl = int(os.environ.get('SEARCH_PAGE_CACHE_TTL', 60))
+        self.batch_concurrency = int(os.environ.get('BATCH_CONCURRENCY', 4))
+        self.account_rate = float(os.environ.get('ACCOUNT_RATE_PER_MINUTE', 30))
+        self.account_burst = int(os.environ.get('ACCOUNT_BURST', 5))
+        self.account_concurrency = int(os.environ.get('ACCOUNT_CONCURRENCY', 2))
+        self.global_concurrency = int(os.environ.get('GLOBAL_CONCURRENCY', 8))
+        # username:weight pairs, e.g. "alice@example.com:3,bob@example.com:1"
+        self.account_weights = {
+            username.strip(): int(weight)
+            for username, _, weight in (
+                pair.rpartition(':') for pair in os.environ.get('ACCOUNT_WEIGHTS', '').split(',') if pair.strip()
+            )
+        }
+        self.account_pool_enabled = int(os.environ.get('ACCOUNT_POOL_ENABLED', 0))
+        self.account_pool = [
+            username.strip() for username in os.environ.get('ACCOUNT_POOL', '').split(',') if username.strip()
+        ]
+        self.account_pool_cooldown = int(os.environ.get('ACCOUNT_POOL_COOLDOWN', 60))
+        self.account_pool_attempts = int(os.environ.get('ACCOUNT_POOL_ATTEMPTS', 3))
+        self.crawl_workers = int(os.environ.get('CRAWL_WORKERS', 2))
+        self.warmup_enabled = int(os.environ.get('WARMUP', 1))
+        self.warmup_routes = [
+            route.strip() for route in os.environ.get('WARMUP_ROUTES', '').split(',') if route.strip()
+        ]
+        self.entity_cache_size = int(os.environ.get('ENTITY_CACHE_SIZE', 1024))
+        self.entity_cache_ttls = {
+            'job_posting': int(os.environ.get('ENTITY_CACHE_TTL_JOB_POSTING', 3600)),
+            'company': int(os.environ.get('ENTITY_CACHE_TTL_COMPANY', 86400)),
+            'hirer': int(os.environ.get('ENTITY_CACHE_TTL_HIRER', 86400)),
+        }
+        self.entity_cache_negative_ttl = int(os.environ.get('ENTITY_CACHE_NEGATIVE_TTL', 300))
+        self.entity_cache_stale_ttl = int(os.environ.get('ENTITY_CACHE_STALE_TTL', 86400))
+        self.entity_cache_persist = int(os.environ.get('ENTITY_CACHE_PERSIST', 0))
+        self.flight_recorder_sample_rate = float(os.environ.get('FLIGHT_RECORDER_SAMPLE_RATE', 0))
+        self.flight_recorder_threshold = int(os.environ.get('FLIGHT_RECORDER_THRESHOLD_MS', 10000))
+        self.flight_recorder_har = int(os.environ.get('FLIGHT_RECORDER_HAR', 0))
+        self.flight_recorder_screenshots = int(os.environ.get('FLIGHT_RECORDER_SCREENSHOTS', 0))
+        self.flight_recorder_max_size = int(os.environ.get('FLIGHT_RECORDER_MAX_MB', 500))
+        # operation:backend pairs, e.g. "company:http,hirer:http"
+        self.fetch_routes = {
+            operation.strip(): backend.strip()
+            for operation, _, backend in (
+                pair.partition(':') for pair in os.environ.get('FETCH_ROUTES', '').split(',') if pair.strip()
+            )
+        }
+        self.http_fetch_timeout = float(os.environ.get('HTTP_FETCH_TIMEOUT', 10))
+        self.http_fetch_connections = int(os.environ.get('HTTP_FETCH_CONNECTIONS', 10))
 
     def _init_logging(self):
         logging.basicConfig(filename=self.app_log_path, level=logging.INFO, filemode='a', format='%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s', datefmt='%H:%M:%S')
 
     def _init_bindings(self):
         self.injector.binder.bind(SessionDirVariable, SessionDirVariable(self.session_dir))
+        self.injector.binder.bind(SessionStoreManager, to=SessionStoreManager, scope=singleton)
+        self.injector.binder.bind(MetricsManager, to=MetricsManager, scope=singleton)
+        self.injector.binder.bind(BrowserManager, to=BrowserManager, scope=singleton)
+        self.injector.binder.bind(ContextPoolSizeVariable, to=ContextPoolSizeVariable(self.context_pool_size))
+        self.injector.binder.bind(ContextPoolIdleTimeoutVariable, to=ContextPoolIdleTimeoutVariable(self.context_pool_idle_timeout))
+        self.injector.binder.bind(PagePoolSizeVariable, to=PagePoolSizeVariable(self.page_pool_size))
+        self.injector.binder.bind(RequestFilterProfileVariable, to=RequestFilterProfileVariable(self.request_filter_profile))
+        self.injector.binder.bind(LoginRequestFilterProfileVariable, to=LoginRequestFilterProfileVariable(self.login_request_filter_profile))
+        self.injector.binder.bind(LinkedinBaseUrlVariable, to=LinkedinBaseUrlVariable(self.linkedin_base_url))
+        self.injector.binder.bind(RequestFilterManager, to=RequestFilterManager, scope=singleton)
+        self.injector.binder.bind(ContextPoolManager, to=ContextPoolManager, scope=singleton)
+        self.injector.binder.bind(WaitBudgetVariable, to=WaitBudgetVariable(self.wait_budget))
+        self.injector.binder.bind(WaitStatsManager, to=WaitStatsManager, scope=singleton)
+        self.injector.binder.bind(ExtractionEngineVariable, to=ExtractionEngineVariable(self.extraction_engine))
+        self.injector.binder.bind(SnapshotParserPoolVariable, to=SnapshotParserPoolVariable(self.snapshot_parser_pool))
+        self.injector.binder.bind(SnapshotParserWorkersVariable, to=SnapshotParserWorkersVariable(self.snapshot_parser_workers))
+        self.injector.binder.bind(SnapshotParserManager, to=SnapshotParserManager, scope=singleton)
+        self.injector.binder.bind(SnapshotDirVariable, to=SnapshotDirVariable(self.snapshot_dir))
+        self.injector.binder.bind(SnapshotArchiveEnabledVariable, to=SnapshotArchiveEnabledVariable(self.snapshot_archive_enabled))
+        self.injector.binder.bind(SnapshotArchiveManager, to=SnapshotArchiveManager, scope=singleton)
+        self.injector.binder.bind(SearchFanOutVariable, to=SearchFanOutVariable(self.search_fan_out))
+        self.injector.binder.bind(SearchPageCacheTtlVariable, to=SearchPageCacheTtlVariable(self.search_page_cache_ttl))
+        self.injector.binder.bind(SearchPageCacheManager, to=SearchPageCacheManager, scope=singleton)
+        self.injector.binder.bind(EntityCacheSizeVariable, to=EntityCacheSizeVariable(self.entity_cache_size))
+        self.injector.binder.bind(EntityCacheTtlsVariable, to=EntityCacheTtlsVariable(self.entity_cache_ttls))
+        self.injector.binder.bind(EntityCacheNegativeTtlVariable, to=EntityCacheNegativeTtlVariable(self.entity_cache_negative_ttl))
+        self.injector.binder.bind(EntityCacheStaleTtlVariable, to=EntityCacheStaleTtlVariable(self.entity_cache_stale_ttl))
+        self.injector.binder.bind(EntityCachePersistVariable, to=EntityCachePersistVariable(self.entity_cache_persist))
+        self.injector.binder.bind(EntityCacheDbPathVariable, to=EntityCacheDbPathVariable(self.entity_cache_db_path))
+        self.injector.binder.bind(EntityCacheManager, to=EntityCacheManager, scope=singleton)
+        self.injector.binder.bind(SingleFlightManager, to=SingleFlightManager, scope=singleton)
+        self.injector.binder.bind(BatchConcurrencyVariable, to=BatchConcurrencyVariable(self.batch_concurrency))
+        self.injector.binder.bind(BatchManager, to=BatchManager, scope=singleton)
+        self.injector.binder.bind(AccountRateVariable, to=AccountRateVariable(self.account_rate))
+        self.injector.binder.bind(AccountBurstVariable, to=AccountBurstVariable(self.account_burst))
+        self.injector.binder.bind(AccountConcurrencyVariable, to=AccountConcurrencyVariable(self.account_concurrency))
+        self.injector.binder.bind(GlobalConcurrencyVariable, to=GlobalConcurrencyVariable(self.global_concurrency))
+        self.injector.binder.bind(AccountWeightsVariable, to=AccountWeightsVariable(self.account_weights))
+        self.injector.binder.bind(AccountSchedulerManager, to=AccountSchedulerManager, scope=singleton)
+        self.injector.binder.bind(AccountPoolEnabledVariable, to=AccountPoolEnabledVariable(self.account_pool_enabled))
+        self.injector.binder.bind(AccountPoolVariable, to=AccountPoolVariable(self.account_pool))
+        self.injector.binder.bind(AccountPoolCooldownVariable, to=AccountPoolCooldownVariable(self.account_pool_cooldown))
+        self.injector.binder.bind(AccountPoolAttemptsVariable, to=AccountPoolAttemptsVariable(self.account_pool_attempts))
+        self.injector.binder.bind(AccountPoolManager, to=AccountPoolManager, scope=singleton)
+        self.injector.binder.bind(FlightRecorderDirVariable, to=FlightRecorderDirVariable(self.flight_recorder_dir))
+        self.injector.binder.bind(FlightRecorderSampleRateVariable, to=FlightRecorderSampleRateVariable(self.flight_recorder_sample_rate))
+        self.injector.binder.bind(FlightRecorderThresholdVariable, to=FlightRecorderThresholdVariable(self.flight_recorder_threshold))
+        self.injector.binder.bind(FlightRecorderHarVariable, to=FlightRecorderHarVariable(self.flight_recorder_har))
+        self.injector.binder.bind(FlightRecorderScreenshotsVariable, to=FlightRecorderScreenshotsVariable(self.flight_recorder_screenshots))
+        self.injector.binder.bind(FlightRecorderMaxSizeVariable, to=FlightRecorderMaxSizeVariable(self.flight_recorder_max_size))
+        self.injector.binder.bind(FlightRecorderManager, to=FlightRecorderManager, scope=singleton)
+        self.injector.binder.bind(FetchRoutesVariable, to=FetchRoutesVariable(self.fetch_routes))
+        self.injector.binder.bind(HttpFetchTimeoutVariable, to=HttpFetchTimeoutVariable(self.http_fetch_timeout))
+        self.injector.binder.bind(HttpFetchConnectionsVariable, to=HttpFetchConnectionsVariable(self.http_fetch_connections))
+        self.injector.binder.bind(FetchBackendManager, to=FetchBackendManager, scope=singleton)
         self.injector.binder.bind(LinkedinClient, to=LinkedinClient)
         self.injector.binder.bind(JobPostingService, to=JobPostingService)
+        self.injector.binder.bind(CrawlWorkersVariable, to=CrawlWorkersVariable(self.crawl_workers))
+        self.injector.binder.bind(CrawlJobDbPathVariable, to=CrawlJobDbPathVariable(self.crawl_job_db_path))
+        self.injector.binder.bind(CrawlJobManager, to=CrawlJobManager, scope=singleton)
+        self.injector.binder.bind(WarmupEnabledVariable, to=WarmupEnabledVariable(self.warmup_enabled))
+        self.injector.binder.bind(WarmupRoutesVariable, to=WarmupRoutesVariable(self.warmup_routes))
+        self.injector.binder.bind(LifecycleManager, to=LifecycleManager, scope=singleton)
         self.injector.binder.bind(SecretKeyVariable, to=SecretKeyVariable(self.secret_key))
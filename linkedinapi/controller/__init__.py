@@ -1,5 +1,11 @@
+import json
+import logging
+from typing import AsyncIterator
+
 from fastapi import Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
 
 from linkedinapi.container.DefaultContainer import DefaultContainer
 from linkedinapi.helper.TokenHelper import TokenHelper
@@ -16,3 +22,18 @@ async def get_current_username(token_credentials: HTTPAuthorizationCredentials =
         return token_data['username']
     except Exception as e:
         raise HTTPException(status_code=401, detail=str(e))
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """Stream models as NDJSON lines, reporting a failure after the first byte as a final error line"""
+    async def encode() -> AsyncIterator[str]:
+        try:
+            async for item in items:
+                yield item.model_dump_json() + "\n"
+        except Exception as e:
+            logging.exception("Error streaming results")
+            yield json.dumps({"detail": str(e)}) + "\n"
+        finally:
+            await items.aclose()
+
+    return StreamingResponse(encode(), media_type='application/x-ndjson', headers={"Cache-Control": "no-cache"})
@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Header
 
 from linkedinapi.container.DefaultContainer import DefaultContainer
-from linkedinapi.controller import get_current_username
+from linkedinapi.controller import get_current_username, ndjson_response
+from linkedinapi.helper.CacheControlHelper import CacheControlHelper
+from linkedinapi.model.BatchItemResult import BatchItemResult
 from linkedinapi.model.Company import Company
+from linkedinapi.model.CompanyBatchRequest import CompanyBatchRequest
 from linkedinapi.service.CompanyService import CompanyService
 
 company_controller = APIRouter(
@@ -11,12 +16,14 @@ company_controller = APIRouter(
 )
 
 @company_controller.get("/{company_slug}")
-async def get_company(company_slug: str, username: str = Depends(get_current_username)) -> Company:
+async def get_company(company_slug: str, cache_control: Optional[str] = Header(default=None),
+                      username: str = Depends(get_current_username)) -> Company:
     """
     Get detailed information about a specific company.
     
     Args:
         company_slug: LinkedIn company slug
+        cache_control: Cache-Control request header, no-cache/no-store/max-age=N bypass or bound the cache
         username: LinkedIn username to load browser session
         
     Returns:
@@ -26,7 +33,39 @@ async def get_company(company_slug: str, username: str = Depends(get_current_use
     company_service: CompanyService = default_container.get(CompanyService)
 
     try:
-        company_details = await company_service.get_company(username, company_slug)
+        company_details = await company_service.get_company(username, company_slug, CacheControlHelper.parse(cache_control))
         return company_details
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving company details: {str(e)}")
+
+
+@company_controller.post("/batch")
+async def get_companies_batch(batch_request: CompanyBatchRequest, stream: bool = False,
+                              cache_control: Optional[str] = Header(default=None),
+                              username: str = Depends(get_current_username)) -> List[BatchItemResult[Company]]:
+    """
+    Get detailed information about several companies in one request.
+
+    Duplicates are fetched once and items are scraped with the configured batch concurrency.
+    Failed items are reported in their result instead of failing the whole batch.
+
+    Args:
+        batch_request: Company slugs to fetch
+        stream: Stream results as NDJSON in completion order instead of a list in request order
+        cache_control: Cache-Control request header, applied to every item
+        username: LinkedIn username to load browser session
+
+    Returns:
+        Per-item results
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    company_service: CompanyService = default_container.get(CompanyService)
+
+    cache_policy = CacheControlHelper.parse(cache_control)
+    if stream:
+        return ndjson_response(company_service.iter_companies(username, batch_request.company_slugs, cache_policy))
+
+    try:
+        return await company_service.get_companies(username, batch_request.company_slugs, cache_policy)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving company details: {str(e)}")
@@ -0,0 +1,101 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+
+from linkedinapi.container.DefaultContainer import DefaultContainer
+from linkedinapi.controller import get_current_username
+from linkedinapi.manager.CrawlJobManager import CrawlJobManager
+from linkedinapi.model.CrawlJob import CrawlJob
+from linkedinapi.model.CrawlJobRequest import CrawlJobRequest
+from linkedinapi.model.CrawlJobResultPage import CrawlJobResultPage
+
+crawl_job_controller = APIRouter(
+    prefix="/jobs",
+    tags=["Crawl jobs"],
+)
+
+
+async def _get_own_job(job_id: str, username: str) -> CrawlJob:
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+
+    crawl_job = await crawl_job_manager.get(job_id)
+    if crawl_job is None or crawl_job.username != username:
+        raise HTTPException(status_code=404, detail="Crawl job not found")
+    return crawl_job
+
+
+@crawl_job_controller.post("/", status_code=202)
+async def submit_crawl_job(crawl_job_request: CrawlJobRequest,
+                           username: str = Depends(get_current_username)) -> CrawlJob:
+    """
+    Queue a long crawl to run in the background.
+
+    Args:
+        crawl_job_request: What to crawl, a search or a list of ids/slugs
+        username: LinkedIn username to load browser session
+
+    Returns:
+        The queued crawl job, to be polled with GET /jobs/{job_id}
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+
+    return await crawl_job_manager.submit(username, crawl_job_request)
+
+
+@crawl_job_controller.get("/{job_id}")
+async def get_crawl_job(job_id: str, username: str = Depends(get_current_username)) -> CrawlJob:
+    """
+    Get the status, progress and timing stats of a crawl job.
+
+    Args:
+        job_id: Crawl job identifier
+        username: LinkedIn username that submitted the job
+
+    Returns:
+        The crawl job
+    """
+    return await _get_own_job(job_id, username)
+
+
+@crawl_job_controller.get("/{job_id}/results")
+async def get_crawl_job_results(job_id: str, offset: int = Query(default=0, ge=0),
+                                limit: int = Query(default=100, ge=1, le=1000),
+                                username: str = Depends(get_current_username)) -> CrawlJobResultPage:
+    """
+    Get the results a crawl job stored so far, including while it is still running.
+
+    Args:
+        job_id: Crawl job identifier
+        offset: Index of the first result
+        limit: Maximum number of results
+        username: LinkedIn username that submitted the job
+
+    Returns:
+        A page of results with the offset of the next one
+    """
+    await _get_own_job(job_id, username)
+
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+
+    return await crawl_job_manager.get_results(job_id, offset, limit)
+
+
+@crawl_job_controller.delete("/{job_id}")
+async def cancel_crawl_job(job_id: str, username: str = Depends(get_current_username)) -> CrawlJob:
+    """
+    Cancel a queued or running crawl job, keeping the results stored so far.
+
+    Args:
+        job_id: Crawl job identifier
+        username: LinkedIn username that submitted the job
+
+    Returns:
+        The cancelled crawl job
+    """
+    await _get_own_job(job_id, username)
+
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+
+    return await crawl_job_manager.cancel(job_id)
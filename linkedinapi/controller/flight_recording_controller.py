@@ -0,0 +1,82 @@
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from linkedinapi.container.DefaultContainer import DefaultContainer
+from linkedinapi.controller import get_current_username
+from linkedinapi.manager.FlightRecorderManager import FlightRecorderManager
+from linkedinapi.model.FlightRecording import FlightRecording
+
+flight_recording_controller = APIRouter(
+    prefix="/flight-recordings",
+    tags=["Stats"],
+)
+
+
+async def _get_own_recording(recording_id: str, username: str) -> FlightRecording:
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    flight_recorder: FlightRecorderManager = default_container.get(FlightRecorderManager)
+
+    recording = await flight_recorder.get(recording_id)
+    # Traces hold the session of the account, only its owner may read them
+    if recording is None or recording.username != username:
+        raise HTTPException(status_code=404, detail="Flight recording not found")
+    return recording
+
+
+@flight_recording_controller.get("/")
+async def list_flight_recordings(username: str = Depends(get_current_username)) -> List[FlightRecording]:
+    """
+    List the kept recordings of slow or failed operations run with the user's session, newest first.
+
+    Args:
+        username: LinkedIn username the recordings were made with
+
+    Returns:
+        Kept flight recordings
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    flight_recorder: FlightRecorderManager = default_container.get(FlightRecorderManager)
+
+    return await flight_recorder.list_recordings(username)
+
+
+@flight_recording_controller.get("/{recording_id}")
+async def get_flight_recording(recording_id: str, username: str = Depends(get_current_username)) -> FlightRecording:
+    """
+    Get a kept recording.
+
+    Args:
+        recording_id: Recording identifier
+        username: LinkedIn username the recording was made with
+
+    Returns:
+        The flight recording
+    """
+    return await _get_own_recording(recording_id, username)
+
+
+@flight_recording_controller.get("/{recording_id}/{file_name}")
+async def download_flight_recording_file(recording_id: str, file_name: Literal['trace.zip', 'har.json'],
+                                         username: str = Depends(get_current_username)) -> FileResponse:
+    """
+    Download an artifact of a kept recording. Open trace.zip with `playwright show-trace`.
+
+    Args:
+        recording_id: Recording identifier
+        file_name: Artifact to download, trace.zip or har.json
+        username: LinkedIn username the recording was made with
+
+    Returns:
+        The artifact file
+    """
+    recording = await _get_own_recording(recording_id, username)
+
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    flight_recorder: FlightRecorderManager = default_container.get(FlightRecorderManager)
+
+    path = flight_recorder.get_file_path(recording, file_name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Flight recording file not found")
+    return FileResponse(path, filename=f"{recording.id}-{file_name}")
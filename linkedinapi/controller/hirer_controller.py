@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Header
 
 from linkedinapi.container.DefaultContainer import DefaultContainer
-from linkedinapi.controller import get_current_username
+from linkedinapi.controller import get_current_username, ndjson_response
+from linkedinapi.helper.CacheControlHelper import CacheControlHelper
+from linkedinapi.model.BatchItemResult import BatchItemResult
 from linkedinapi.model.Hirer import Hirer
+from linkedinapi.model.HirerBatchRequest import HirerBatchRequest
 from linkedinapi.service.HirerService import HirerService
 
 hirer_controller = APIRouter(
@@ -11,12 +16,14 @@ hirer_controller = APIRouter(
 )
 
 @hirer_controller.get("/{hirer_slug}")
-async def get_hirer(hirer_slug: str, username: str = Depends(get_current_username)) -> Hirer:
+async def get_hirer(hirer_slug: str, cache_control: Optional[str] = Header(default=None),
+                    username: str = Depends(get_current_username)) -> Hirer:
     """
     Get detailed information about a specific hirer.
     
     Args:
         hirer_slug: LinkedIn hirer slug
+        cache_control: Cache-Control request header, no-cache/no-store/max-age=N bypass or bound the cache
         username: LinkedIn username to load browser session
         
     Returns:
@@ -26,7 +33,39 @@ async def get_hirer(hirer_slug: str, username: str = Depends(get_current_usernam
     hirer_service: HirerService = default_container.get(HirerService)
 
     try:
-        hirer_details = await hirer_service.get_hirer(username, hirer_slug)
+        hirer_details = await hirer_service.get_hirer(username, hirer_slug, CacheControlHelper.parse(cache_control))
         return hirer_details
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving hirer details: {str(e)}")
+
+
+@hirer_controller.post("/batch")
+async def get_hirers_batch(batch_request: HirerBatchRequest, stream: bool = False,
+                           cache_control: Optional[str] = Header(default=None),
+                           username: str = Depends(get_current_username)) -> List[BatchItemResult[Hirer]]:
+    """
+    Get detailed information about several hirers in one request.
+
+    Duplicates are fetched once and items are scraped with the configured batch concurrency.
+    Failed items are reported in their result instead of failing the whole batch.
+
+    Args:
+        batch_request: Hirer slugs to fetch
+        stream: Stream results as NDJSON in completion order instead of a list in request order
+        cache_control: Cache-Control request header, applied to every item
+        username: LinkedIn username to load browser session
+
+    Returns:
+        Per-item results
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    hirer_service: HirerService = default_container.get(HirerService)
+
+    cache_policy = CacheControlHelper.parse(cache_control)
+    if stream:
+        return ndjson_response(hirer_service.iter_hirers(username, batch_request.hirer_slugs, cache_policy))
+
+    try:
+        return await hirer_service.get_hirers(username, batch_request.hirer_slugs, cache_policy)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving hirer details: {str(e)}")
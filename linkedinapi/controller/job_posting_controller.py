@@ -1,11 +1,19 @@
-from typing import Optional, List
+import json
+import logging
+from typing import AsyncIterator, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, Header
+from fastapi.responses import StreamingResponse
 
 from linkedinapi.container.DefaultContainer import DefaultContainer
-from linkedinapi.controller import get_current_username
+from linkedinapi.controller import get_current_username, ndjson_response
+from linkedinapi.helper.CacheControlHelper import CacheControlHelper
+from linkedinapi.model.BatchItemResult import BatchItemResult
+from linkedinapi.helper.PageTokenHelper import PageTokenHelper
+from linkedinapi.model.JobPostingBatchRequest import JobPostingBatchRequest
 from linkedinapi.model.JobPostingInfo import JobPostingInfo
 from linkedinapi.model.JobPostingListingItem import JobPostingListingItem
+from linkedinapi.model.JobSearchQuery import ExperienceLevel, JobSearchQuery, SortBy, WorkplaceType
 from linkedinapi.service.JobPostingService import JobPostingService
 
 job_posting_controller = APIRouter(
@@ -14,13 +22,112 @@ job_posting_controller = APIRouter(
 )
 
 
+def get_job_search_query(query: Optional[str] = None, location: Optional[str] = None,
+                         date_filter: Optional[int] = Query(default=None, ge=1, le=3),
+                         workplace_types: List[WorkplaceType] = Query(default=[]),
+                         experience_levels: List[ExperienceLevel] = Query(default=[]),
+                         easy_apply: bool = False, sort_by: Optional[SortBy] = None,
+                         start: int = Query(default=0, ge=0),
+                         page_token: Optional[str] = None) -> JobSearchQuery:
+    """
+    Dependency building the search query from the request parameters or a page token.
+
+    Args:
+        query: Search query for job postings, required without page_token
+        location: Location filter for job postings, required without page_token
+        date_filter: Posting date filter (1=past 24 hours, 2=past week, 3=past month)
+        workplace_types: Workplace types to include (on_site, remote, hybrid)
+        experience_levels: Experience levels to include
+        easy_apply: Only include postings with simple application
+        sort_by: Result order (relevance or date)
+        start: Offset of the first result
+        page_token: Cursor returned by a previous call, overrides the search criteria
+
+    Returns:
+        JobSearchQuery positioned at the requested offset
+    """
+    if page_token is not None:
+        try:
+            return PageTokenHelper.decode(page_token)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid page_token")
+
+    if query is None or location is None:
+        raise HTTPException(status_code=400, detail="query and location are required without page_token")
+
+    return JobSearchQuery(
+        keywords=query,
+        location=location,
+        date_filter=date_filter,
+        workplace_types=workplace_types,
+        experience_levels=experience_levels,
+        easy_apply=easy_apply,
+        sort_by=sort_by,
+        start=start,
+    )
+
+
+@job_posting_controller.get("/stream")
+async def stream_job_postings(request: Request, limit_first_page: bool = False,
+                              output_format: Optional[Literal['ndjson', 'sse']] = Query(default=None, alias='format'),
+                              search_query: JobSearchQuery = Depends(get_job_search_query),
+                              username: str = Depends(get_current_username)) -> StreamingResponse:
+    """
+    Stream job postings as they are extracted, page by page.
+
+    Items are written as NDJSON lines, or as Server-Sent Events when format=sse or the
+    client accepts text/event-stream. Pages are only scraped as fast as the client reads.
+
+    Args:
+        request: Incoming request, used for content negotiation
+        limit_first_page: Flag to limit search to first page of results
+        output_format: Output format, negotiated from the Accept header if omitted
+        search_query: Search criteria built from the query parameters or page_token
+        username: LinkedIn username to load browser session
+
+    Returns:
+        Streaming response of job posting listing items
+    """
+
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    job_posting_service: JobPostingService = default_container.get(JobPostingService)
+
+    if output_format is None:
+        output_format = 'sse' if 'text/event-stream' in request.headers.get('accept', '') else 'ndjson'
+
+    job_postings = job_posting_service.iter_job_posting_listing_items(username, search_query, limit_first_page)
+
+    async def encode() -> AsyncIterator[str]:
+        try:
+            async for job_posting in job_postings:
+                if output_format == 'sse':
+                    yield f"event: job_posting\ndata: {job_posting.model_dump_json()}\n\n"
+                else:
+                    yield job_posting.model_dump_json() + "\n"
+        except Exception as e:
+            # Headers are already sent, so the error is reported in-band
+            logging.exception("Error streaming job postings")
+            error = json.dumps({"detail": f"Error retrieving job postings: {str(e)}"})
+            yield f"event: error\ndata: {error}\n\n" if output_format == 'sse' else error + "\n"
+        else:
+            if output_format == 'sse':
+                yield "event: end\ndata: {}\n\n"
+        finally:
+            await job_postings.aclose()
+
+    media_type = 'text/event-stream' if output_format == 'sse' else 'application/x-ndjson'
+    return StreamingResponse(encode(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+
 @job_posting_controller.get("/{job_id}")
-async def get_job_posting(job_id: int, username: str = Depends(get_current_username)) -> JobPostingInfo:
+async def get_job_posting(job_id: int, cache_control: Optional[str] = Header(default=None),
+                          username: str = Depends(get_current_username)) -> JobPostingInfo:
     """
     Get detailed information about a specific job posting.
     
     Args:
         job_id: LinkedIn job posting ID
+        cache_control: Cache-Control request header, no-cache/no-store/max-age=N bypass or bound the cache
         username: LinkedIn username to load browser session
         
     Returns:
@@ -31,23 +138,27 @@ async def get_job_posting(job_id: int, username: str = Depends(get_current_usern
     job_posting_service: JobPostingService = default_container.get(JobPostingService)
 
     try:
-        job_details = await job_posting_service.get_job_posting(username, job_id)
+        job_details = await job_posting_service.get_job_posting(username, job_id, CacheControlHelper.parse(cache_control))
         return job_details
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving job details: {str(e)}")
 
 
 @job_posting_controller.get("/")
-async def get_job_postings(query: str, location: str, limit_first_page: bool = True, date_filter: Optional[int] = None,
+async def get_job_postings(response: Response, limit_first_page: bool = True, page_token: Optional[str] = None,
+                           search_query: JobSearchQuery = Depends(get_job_search_query),
                            username: str = Depends(get_current_username)) -> List[JobPostingListingItem]:
     """
     Get a list of job postings based on search criteria.
+
+    Single-page requests (limit_first_page or page_token) return the cursor of the following
+    page in the X-Next-Page-Token header.
     
     Args:
-        query: Search query for job postings
-        location: Location filter for job postings
+        response: Response the next page token header is set on
         limit_first_page: Flag to limit search to first page of results
-        date_filter: Date filter for job postings
+        page_token: Cursor returned by a previous call, overrides the search criteria
+        search_query: Search criteria built from the query parameters or page_token
         username: LinkedIn username to load browser session
         
     Returns:
@@ -58,13 +169,48 @@ async def get_job_postings(query: str, location: str, limit_first_page: bool = T
     job_posting_service: JobPostingService = default_container.get(JobPostingService)
 
     try:
-        job_postings = await job_posting_service.get_job_posting_listing_items(
-            username,
-            query,
-            location,
-            limit_first_page,
-            date_filter
-        )
+        if page_token is None and not limit_first_page:
+            return await job_posting_service.get_job_posting_listing_items(
+                username,
+                search_query,
+                limit_first_page
+            )
+
+        job_postings, next_query = await job_posting_service.get_job_posting_listing_page(username, search_query)
+        if next_query is not None:
+            response.headers["X-Next-Page-Token"] = PageTokenHelper.encode(next_query)
         return job_postings
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving job postings: {str(e)}")
+
+
+@job_posting_controller.post("/batch")
+async def get_job_postings_batch(batch_request: JobPostingBatchRequest, stream: bool = False,
+                                 cache_control: Optional[str] = Header(default=None),
+                                 username: str = Depends(get_current_username)) -> List[BatchItemResult[JobPostingInfo]]:
+    """
+    Get detailed information about several job postings in one request.
+
+    Duplicates are fetched once and items are scraped with the configured batch concurrency.
+    Failed items are reported in their result instead of failing the whole batch.
+
+    Args:
+        batch_request: Job ids to fetch
+        stream: Stream results as NDJSON in completion order instead of a list in request order
+        cache_control: Cache-Control request header, applied to every item
+        username: LinkedIn username to load browser session
+
+    Returns:
+        Per-item results
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    job_posting_service: JobPostingService = default_container.get(JobPostingService)
+
+    cache_policy = CacheControlHelper.parse(cache_control)
+    if stream:
+        return ndjson_response(job_posting_service.iter_job_postings(username, batch_request.job_ids, cache_policy))
+
+    try:
+        return await job_posting_service.get_job_postings(username, batch_request.job_ids, cache_policy)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving job details: {str(e)}")
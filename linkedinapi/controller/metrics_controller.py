@@ -0,0 +1,54 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from linkedinapi.container.DefaultContainer import DefaultContainer
+from linkedinapi.manager.AccountSchedulerManager import AccountSchedulerManager
+from linkedinapi.manager.BatchManager import BatchManager
+from linkedinapi.manager.BrowserManager import BrowserManager
+from linkedinapi.manager.ContextPoolManager import ContextPoolManager
+from linkedinapi.manager.CrawlJobManager import CrawlJobManager
+from linkedinapi.manager.MetricsManager import MetricsManager
+
+metrics_controller = APIRouter(
+    prefix="/metrics",
+    tags=["Stats"],
+)
+
+
+@metrics_controller.get("")
+async def get_metrics() -> Response:
+    """
+    Get operation and phase timings, selector misses and live browser resources in the Prometheus format.
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    metrics: MetricsManager = default_container.get(MetricsManager)
+    browser_manager: BrowserManager = default_container.get(BrowserManager)
+    context_pool: ContextPoolManager = default_container.get(ContextPoolManager)
+    account_scheduler: AccountSchedulerManager = default_container.get(AccountSchedulerManager)
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+    batch_manager: BatchManager = default_container.get(BatchManager)
+
+    contexts = context_pool.get_stats()
+    accounts = account_scheduler.get_stats()
+    crawl_jobs = await crawl_job_manager.get_stats()
+    metrics.set_gauges(
+        browsers=1 if browser_manager.is_running() else 0,
+        contexts={
+            "in_use": contexts["in_use"],
+            "idle": contexts["size"] - contexts["in_use"],
+        },
+        tabs={
+            "in_use": sum(pages["in_use"] for pages in contexts["pages"].values()),
+            "idle": sum(sum(pages["idle"].values()) for pages in contexts["pages"].values()),
+        },
+        queues={
+            "scheduler": sum(account["queued"] for account in accounts["accounts"].values()),
+            "crawl_jobs": crawl_jobs["jobs"].get("queued", 0),
+            "batch": batch_manager.get_stats()["active"],
+        },
+    )
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE_LATEST)
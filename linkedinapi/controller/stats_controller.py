@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends
+
+from linkedinapi.container.DefaultContainer import DefaultContainer
+from linkedinapi.controller import get_current_username
+from linkedinapi.manager.AccountPoolManager import AccountPoolManager
+from linkedinapi.manager.AccountSchedulerManager import AccountSchedulerManager
+from linkedinapi.manager.BatchManager import BatchManager
+from linkedinapi.manager.BrowserManager import BrowserManager
+from linkedinapi.manager.ContextPoolManager import ContextPoolManager
+from linkedinapi.manager.CrawlJobManager import CrawlJobManager
+from linkedinapi.manager.EntityCacheManager import EntityCacheManager
+from linkedinapi.manager.FetchBackendManager import FetchBackendManager
+from linkedinapi.manager.FlightRecorderManager import FlightRecorderManager
+from linkedinapi.manager.LifecycleManager import LifecycleManager
+from linkedinapi.manager.RequestFilterManager import RequestFilterManager
+from linkedinapi.manager.SearchPageCacheManager import SearchPageCacheManager
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.manager.SingleFlightManager import SingleFlightManager
+from linkedinapi.manager.SnapshotArchiveManager import SnapshotArchiveManager
+from linkedinapi.manager.SnapshotParserManager import SnapshotParserManager
+from linkedinapi.manager.WaitStatsManager import WaitStatsManager
+
+stats_controller = APIRouter(
+    prefix="/stats",
+    tags=["Stats"],
+)
+
+
+@stats_controller.get("/")
+async def get_stats(username: str = Depends(get_current_username)) -> dict:
+    """
+    Get runtime counters of the shared browser resources.
+
+    Counters are keyed by the usernames of every account, so a valid token is required.
+
+    Returns:
+        Dictionary of counters grouped by component
+    """
+    default_container: DefaultContainer = DefaultContainer.getInstance()
+    browser_manager: BrowserManager = default_container.get(BrowserManager)
+    context_pool: ContextPoolManager = default_container.get(ContextPoolManager)
+    request_filter: RequestFilterManager = default_container.get(RequestFilterManager)
+    wait_stats: WaitStatsManager = default_container.get(WaitStatsManager)
+    snapshot_parser: SnapshotParserManager = default_container.get(SnapshotParserManager)
+    snapshot_archive: SnapshotArchiveManager = default_container.get(SnapshotArchiveManager)
+    search_page_cache: SearchPageCacheManager = default_container.get(SearchPageCacheManager)
+    entity_cache: EntityCacheManager = default_container.get(EntityCacheManager)
+    single_flight: SingleFlightManager = default_container.get(SingleFlightManager)
+    batch_manager: BatchManager = default_container.get(BatchManager)
+    crawl_job_manager: CrawlJobManager = default_container.get(CrawlJobManager)
+    account_scheduler: AccountSchedulerManager = default_container.get(AccountSchedulerManager)
+    account_pool: AccountPoolManager = default_container.get(AccountPoolManager)
+    session_store: SessionStoreManager = default_container.get(SessionStoreManager)
+    lifecycle_manager: LifecycleManager = default_container.get(LifecycleManager)
+    flight_recorder: FlightRecorderManager = default_container.get(FlightRecorderManager)
+    fetch_backends: FetchBackendManager = default_container.get(FetchBackendManager)
+
+    return {
+        "browser": browser_manager.get_stats(),
+        "contexts": context_pool.get_stats(),
+        "request_filter": request_filter.get_stats(),
+        "waits": wait_stats.get_stats(),
+        "snapshot_parser": snapshot_parser.get_stats(),
+        "snapshot_archive": snapshot_archive.get_stats(),
+        "search_page_cache": search_page_cache.get_stats(),
+        "entity_cache": entity_cache.get_stats(),
+        "single_flight": single_flight.get_stats(),
+        "batch": batch_manager.get_stats(),
+        "crawl_jobs": await crawl_job_manager.get_stats(),
+        "accounts": account_scheduler.get_stats(),
+        "account_pool": account_pool.get_stats(),
+        "sessions": session_store.get_stats(),
+        "warmup": lifecycle_manager.get_stats(),
+        "flight_recorder": flight_recorder.get_stats(),
+        "fetch_backends": fetch_backends.get_stats(),
+    }
@@ -0,0 +1,9 @@
+class LoggedOutError(Exception):
+    """
+    Raised when LinkedIn redirects a scrape to a login, authwall or checkpoint screen.
+    """
+
+    def __init__(self, username: str, url: str) -> None:
+        super().__init__(f"Session of {username} is logged out (redirected to {url})")
+        self.username = username
+        self.url = url
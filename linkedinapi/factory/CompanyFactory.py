@@ -1,16 +1,32 @@
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict
+
 from linkedinapi.model.Company import Company
 from linkedinapi.model.CompanySinglePage import CompanySinglePage
 
 class CompanyFactory:
     @staticmethod
-    async def create_from_company_single_page(company_single_page: CompanySinglePage) -> Company:
+    async def create_from_company_single_page(company_single_page: CompanySinglePage,
+                                              timer: Callable[[str], ContextManager] = lambda field: nullcontext()
+                                              ) -> Company:
         company_info = Company()
-        company_info.name = await company_single_page.get_name()
-        company_info.slug = await company_single_page.get_slug()
-        company_info.website = await company_single_page.get_website()
+        with timer('name'):
+            company_info.name = await company_single_page.get_name()
+        with timer('slug'):
+            company_info.slug = await company_single_page.get_slug()
+        with timer('website'):
+            company_info.website = await company_single_page.get_website()
         # company_info.description = await company_single_page.get_description()
         # company_info.website = await company_single_page.get_website()
         # company_info.industry = await company_single_page.get_industry()
         # company_info.company_size = await company_single_page.get_company_size()
         # company_info.headquarters = await company_single_page.get_headquarters()
         return company_info
+
+    @staticmethod
+    def create_from_company_fields(fields: Dict[str, Any]) -> Company:
+        company_info = Company()
+        company_info.name = fields.get('name')
+        company_info.slug = fields.get('slug')
+        company_info.website = fields.get('website')
+        return company_info
@@ -1,12 +1,30 @@
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict
+
 from linkedinapi.model.Hirer import Hirer
 from linkedinapi.model.HirerSinglePage import HirerSinglePage
 
 class HirerFactory:
     @staticmethod
-    async def create_from_hirer_single_page(hirer_single_page: HirerSinglePage) -> Hirer:
+    async def create_from_hirer_single_page(hirer_single_page: HirerSinglePage,
+                                            timer: Callable[[str], ContextManager] = lambda field: nullcontext()
+                                            ) -> Hirer:
+        hirer_info = Hirer()
+        with timer('name'):
+            hirer_info.name = await hirer_single_page.get_name()
+        with timer('slug'):
+            hirer_info.slug = await hirer_single_page.get_slug()
+        with timer('location'):
+            hirer_info.location = await hirer_single_page.get_location()
+        with timer('role'):
+            hirer_info.role = await hirer_single_page.get_role()
+        return hirer_info
+
+    @staticmethod
+    def create_from_hirer_fields(fields: Dict[str, Any]) -> Hirer:
         hirer_info = Hirer()
-        hirer_info.name = await hirer_single_page.get_name()
-        hirer_info.slug = await hirer_single_page.get_slug()
-        hirer_info.location = await hirer_single_page.get_location()
-        hirer_info.role = await hirer_single_page.get_role()
+        hirer_info.name = fields.get('name')
+        hirer_info.slug = fields.get('slug')
+        hirer_info.location = fields.get('location')
+        hirer_info.role = fields.get('role')
         return hirer_info
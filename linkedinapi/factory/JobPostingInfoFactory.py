@@ -1,3 +1,5 @@
+from typing import Any, Dict, Optional
+
 from linkedinapi.model.Company import Company
 from linkedinapi.model.JobPostingInfo import JobPostingInfo
 from linkedinapi.model.JobPostingSinglePage import JobPostingSinglePage
@@ -5,23 +7,61 @@ from linkedinapi.model.JobPostingSinglePage import JobPostingSinglePage
 class JobPostingInfoFactory:
     @staticmethod
     async def create_from_job_posting_single_page(job_posting_single_page: JobPostingSinglePage) -> JobPostingInfo:
+        await job_posting_single_page.wait_until_loaded()
+        fields = await job_posting_single_page.extract_fields()
+        job_posting_info = JobPostingInfoFactory.create_from_job_posting_fields(fields)
+
+        if not job_posting_info.is_simple and not job_posting_info.disabled:
+            job_posting_info.external_url = await job_posting_single_page.get_external_url()
+
+        return job_posting_info
+
+    @staticmethod
+    async def create_from_captured_job_posting(job_posting_single_page: JobPostingSinglePage,
+                                               job_id: int) -> Optional[JobPostingInfo]:
+        posting = await job_posting_single_page.capture_job_posting(job_id)
+        if posting is None:
+            return None
+
+        # Skills and hirers are not part of the posting payload, read them from the rendered page
+        await job_posting_single_page.wait_until_loaded()
+        fields = await job_posting_single_page.extract_fields()
+        return JobPostingInfoFactory.create_from_voyager_job_posting(posting, fields)
+
+    @staticmethod
+    def create_from_voyager_job_posting(posting: Dict[str, Any], fields: Dict[str, Any]) -> JobPostingInfo:
+        job_posting_info = JobPostingInfoFactory.create_from_job_posting_fields(fields)
+        job_posting_info.id = posting.get('id') or job_posting_info.id
+        job_posting_info.title = posting.get('title') or job_posting_info.title
+        job_posting_info.location = posting.get('location') or job_posting_info.location
+        job_posting_info.description = posting.get('description') or job_posting_info.description
+
+        if posting.get('company_slug'):
+            job_posting_info.company.set_name(posting.get('company_name'))
+            job_posting_info.company.set_slug(posting.get('company_slug'))
+
+        job_posting_info.disabled = bool(posting.get('disabled'))
+        job_posting_info.is_simple = bool(posting.get('is_simple'))
+        job_posting_info.external_url = posting.get('external_url')
+        return job_posting_info
+
+    @staticmethod
+    def create_from_job_posting_fields(fields: Dict[str, Any]) -> JobPostingInfo:
         job_posting_info = JobPostingInfo()
-        job_posting_info.id = await job_posting_single_page.get_id()
-        job_posting_info.title = await job_posting_single_page.get_title()
-        job_posting_info.location = await job_posting_single_page.get_location()
-        job_posting_info.description = await job_posting_single_page.get_description()
-        job_posting_info.skills = await job_posting_single_page.get_skills() + await job_posting_single_page.get_additional_skills()
-        company_name, company_slug = await job_posting_single_page.get_company_info()
+        job_posting_info.id = fields.get('id')
+        job_posting_info.title = fields.get('title')
+        job_posting_info.location = fields.get('location')
+        job_posting_info.description = fields.get('description')
+        job_posting_info.skills = JobPostingSinglePage.parse_skills(fields.get('skills') or []) + \
+            JobPostingSinglePage.parse_additional_skills(fields.get('additional_skills'))
 
         company = Company()
-        company.set_name(company_name)
-        company.set_slug(company_slug)
+        if fields.get('company_url'):
+            company.set_name(fields.get('company_name'))
+            company.set_slug(JobPostingSinglePage.parse_company_slug(fields.get('company_url')))
         job_posting_info.company = company
 
-        job_posting_info.disabled = await job_posting_single_page.is_disabled()
-        job_posting_info.is_simple = await job_posting_single_page.is_simple_application()
-        if not job_posting_info.is_simple:
-            job_posting_info.external_url = await job_posting_single_page.get_external_url()
-
-        job_posting_info.hirers = await job_posting_single_page.get_hirers()
+        job_posting_info.disabled = bool(fields.get('disabled'))
+        job_posting_info.is_simple = bool(fields.get('is_simple'))
+        job_posting_info.hirers = JobPostingSinglePage.parse_hirers(fields.get('hirers') or [])
         return job_posting_info
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 from linkedinapi.model.JobPostingListingItem import JobPostingListingItem
 from linkedinapi.model.JobPostingSearchCard import JobPostingSearchCard
 
@@ -12,3 +14,18 @@ class JobPostingListingItemFactory:
         job_posting.created_at = await job_posting_search_card.get_created_at()
         job_posting.is_simple = await job_posting_search_card.is_simple_application()
         return job_posting
+
+    @staticmethod
+    def create_from_job_posting_search_payload(item: Dict[str, Any]) -> JobPostingListingItem:
+        job_posting = JobPostingListingItem()
+        job_posting.id = int(item['id']) if item.get('id') else None
+        job_posting.title = item.get('title')
+        job_posting.company_name = item.get('company_name')
+        job_posting.metadata_items = item.get('metadata_items') or []
+        job_posting.created_at = item.get('created_at')
+        job_posting.is_simple = bool(item.get('is_simple'))
+        return job_posting
+
+    @staticmethod
+    def create_all_from_job_posting_search_payload(payload: List[Dict[str, Any]]) -> List[JobPostingListingItem]:
+        return [JobPostingListingItemFactory.create_from_job_posting_search_payload(item) for item in payload]
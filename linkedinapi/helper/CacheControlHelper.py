@@ -0,0 +1,33 @@
+from typing import Optional
+
+from linkedinapi.model.CachePolicy import CachePolicy
+
+
+class CacheControlHelper:
+
+    @staticmethod
+    def parse(cache_control: Optional[str]) -> CachePolicy:
+        """
+        Parse a Cache-Control request header into a cache policy.
+
+        Unknown directives and malformed values are ignored.
+
+        Args:
+            cache_control: Header value, e.g. "no-cache" or "max-age=600"
+
+        Returns:
+            CachePolicy for the request, the default one if the header is missing
+        """
+        cache_policy = CachePolicy()
+        if not cache_control:
+            return cache_policy
+
+        for directive in cache_control.split(','):
+            name, _, value = directive.strip().lower().partition('=')
+            if name == 'no-cache':
+                cache_policy.no_cache = True
+            elif name == 'no-store':
+                cache_policy.no_store = True
+            elif name == 'max-age' and value.strip().isdigit():
+                cache_policy.max_age = int(value.strip())
+        return cache_policy
@@ -0,0 +1,101 @@
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+
+
+class JobSearchUrlHelper:
+    """
+    Builds jobs search URLs, so that a search is a single navigation that doesn't depend
+    on the labels of the search form, which change with the account locale.
+    """
+
+    BASE_URL = "https://www.linkedin.com/jobs/search/"
+
+    # LinkedIn renders 25 cards per result page and stops paginating after 1000 results
+    PAGE_SIZE = 25
+    MAX_START = 975
+
+    # date_filter values accepted by the API: 1=past 24 hours, 2=past week, 3=past month
+    DATE_FILTERS: Dict[int, str] = {
+        1: 'r86400',
+        2: 'r604800',
+        3: 'r2592000',
+    }
+
+    WORKPLACE_TYPES: Dict[str, str] = {
+        'on_site': '1',
+        'remote': '2',
+        'hybrid': '3',
+    }
+
+    EXPERIENCE_LEVELS: Dict[str, str] = {
+        'internship': '1',
+        'entry_level': '2',
+        'associate': '3',
+        'mid_senior': '4',
+        'director': '5',
+        'executive': '6',
+    }
+
+    SORT_BY: Dict[str, str] = {
+        'relevance': 'R',
+        'date': 'DD',
+    }
+
+    @staticmethod
+    def build_url(search_query: JobSearchQuery) -> str:
+        """
+        Build the jobs search URL for a query.
+
+        Args:
+            search_query: Search criteria and result offset
+
+        Returns:
+            Absolute jobs search URL
+        """
+        params = {
+            'keywords': search_query.keywords,
+            'location': search_query.location,
+        }
+        if search_query.date_filter:
+            params['f_TPR'] = JobSearchUrlHelper.DATE_FILTERS[search_query.date_filter]
+        if search_query.workplace_types:
+            params['f_WT'] = ','.join(
+                JobSearchUrlHelper.WORKPLACE_TYPES[workplace_type] for workplace_type in search_query.workplace_types
+            )
+        if search_query.experience_levels:
+            params['f_E'] = ','.join(
+                JobSearchUrlHelper.EXPERIENCE_LEVELS[level] for level in search_query.experience_levels
+            )
+        if search_query.easy_apply:
+            params['f_AL'] = 'true'
+        if search_query.sort_by:
+            params['sortBy'] = JobSearchUrlHelper.SORT_BY[search_query.sort_by]
+        if search_query.start:
+            params['start'] = str(search_query.start)
+
+        return JobSearchUrlHelper.BASE_URL + '?' + urlencode(params)
+
+    @staticmethod
+    def get_next_start(search_query: JobSearchQuery, page_card_count: int, result_count: Optional[int]) -> int:
+        """
+        Get the offset of the page following the current one.
+
+        LinkedIn pages are often a few cards short of PAGE_SIZE, so the end of the results is
+        told by the result count LinkedIn reports. Without one, a short page is taken as the last.
+
+        Args:
+            search_query: Query of the current page
+            page_card_count: Number of cards found on the current page
+            result_count: Number of results of the whole search, None if LinkedIn didn't report it
+
+        Returns:
+            Offset of the next page, or -1 if the current page is the last one
+        """
+        next_start = search_query.start + JobSearchUrlHelper.PAGE_SIZE
+        if next_start > JobSearchUrlHelper.MAX_START:
+            return -1
+        if result_count is not None:
+            return next_start if next_start < result_count else -1
+        return next_start if page_card_count >= JobSearchUrlHelper.PAGE_SIZE else -1
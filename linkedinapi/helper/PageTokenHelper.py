@@ -0,0 +1,41 @@
+import base64
+
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+
+
+class PageTokenHelper:
+    """
+    Encodes a search query positioned at a result offset into an opaque cursor and back.
+    """
+
+    @staticmethod
+    def encode(search_query: JobSearchQuery) -> str:
+        """
+        Encode a search query into a page token.
+
+        Args:
+            search_query: Search criteria and offset of the page the token points at
+
+        Returns:
+            URL-safe page token
+        """
+        payload = search_query.model_dump_json(exclude_defaults=True).encode('utf-8')
+        return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(page_token: str) -> JobSearchQuery:
+        """
+        Decode a page token into the search query it points at.
+
+        Args:
+            page_token: Token returned by encode
+
+        Returns:
+            JobSearchQuery positioned at the page offset
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        padding = '=' * (-len(page_token) % 4)
+        payload = base64.urlsafe_b64decode(page_token + padding)
+        return JobSearchQuery.model_validate_json(payload)
@@ -0,0 +1,78 @@
+import os
+from typing import List
+from urllib.parse import urlparse
+
+
+class SessionHelper:
+
+    @staticmethod
+    def get_session_file(session_dir: str, username: str) -> str:
+        """
+        Get the path of the browser session file of a user, without creating it.
+
+        Args:
+            session_dir: Directory where browser session files are stored
+            username: LinkedIn username
+
+        Returns:
+            Full path to the session file
+        """
+        return os.path.join(session_dir, "linkedin_" + username + '.json')
+
+    @staticmethod
+    def get_credential_file(session_dir: str, username: str) -> str:
+        """
+        Get the path of the file holding the password hash of the last successful login of a user.
+
+        Args:
+            session_dir: Directory where browser session files are stored
+            username: LinkedIn username
+
+        Returns:
+            Full path to the credential file
+        """
+        return os.path.join(session_dir, "credential_" + username + '.json')
+
+    @staticmethod
+    def list_usernames(session_dir: str) -> List[str]:
+        """
+        List the usernames that have a session file.
+
+        Args:
+            session_dir: Directory where browser session files are stored
+
+        Returns:
+            Usernames in file name order
+        """
+        usernames = []
+        for file_name in sorted(os.listdir(session_dir)):
+            if file_name.startswith("linkedin_") and file_name.endswith(".json"):
+                usernames.append(file_name[len("linkedin_"):-len(".json")])
+        return usernames
+
+    @staticmethod
+    def get_cookie_expiry(storage_state: dict) -> float:
+        """
+        Get the latest expiry among the cookies of a storage state.
+
+        Args:
+            storage_state: Storage state as saved by Playwright
+
+        Returns:
+            Unix time of the last cookie to expire, 0 when there are no persistent cookies
+        """
+        return max((cookie.get('expires', 0) for cookie in storage_state.get('cookies', [])), default=0)
+
+    @staticmethod
+    def is_logged_out_url(url: str) -> bool:
+        """
+        Check whether LinkedIn redirected a page to a login, authwall or checkpoint screen.
+
+        Args:
+            url: Current URL of the page
+
+        Returns:
+            True if the session behind the page is no longer logged in
+        """
+        path = urlparse(url).path
+        return any(path.startswith(prefix) for prefix in ('/login', '/authwall', '/checkpoint', '/uas/login'))
@@ -0,0 +1,36 @@
+from typing import Any
+
+from linkedinapi.model.CompanySnapshot import CompanySnapshot
+from linkedinapi.model.HirerSnapshot import HirerSnapshot
+from linkedinapi.model.JobPostingSearchSnapshot import JobPostingSearchSnapshot
+from linkedinapi.model.JobPostingSnapshot import JobPostingSnapshot
+
+
+class SnapshotHelper:
+
+    KINDS = ('job_posting', 'job_search', 'company', 'hirer')
+
+    @staticmethod
+    def parse(kind: str, html: str, url: str) -> Any:
+        """
+        Parse a captured page into its raw fields.
+
+        Kept free of shared state so it can run in a thread or process pool.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            html: Captured page HTML
+            url: URL the page was captured at
+
+        Returns:
+            Field dictionary, or a list of card dictionaries for job_search
+        """
+        if kind == 'job_posting':
+            return JobPostingSnapshot(html, url).extract_fields()
+        if kind == 'job_search':
+            return JobPostingSearchSnapshot(html, url).extract_job_cards()
+        if kind == 'company':
+            return CompanySnapshot(html, url).extract_fields()
+        if kind == 'hirer':
+            return HirerSnapshot(html, url).extract_fields()
+        raise ValueError(f"Unknown snapshot kind: {kind}")
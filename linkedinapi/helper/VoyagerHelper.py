@@ -0,0 +1,216 @@
+import datetime
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class VoyagerHelper:
+    """
+    Helpers decoding LinkedIn's normalized "voyager" JSON payloads.
+
+    Payloads have a "data" part referencing entities by URN and an "included" list holding
+    the entities themselves; both are searched so that small shape changes don't break decoding.
+    """
+
+    JOB_CARD_URN = re.compile(r"urn:li:fsd_jobPostingCard:\((\d+),")
+    JOB_POSTING_URN = re.compile(r"urn:li:fsd?_jobPosting:(\d+)")
+
+    @staticmethod
+    def index_included(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Index the included entities of a payload by URN.
+
+        Args:
+            payload: Decoded voyager payload
+
+        Returns:
+            Dictionary mapping entityUrn to entity
+        """
+        return {
+            entity['entityUrn']: entity
+            for entity in payload.get('included') or []
+            if isinstance(entity, dict) and entity.get('entityUrn')
+        }
+
+    @staticmethod
+    def iter_strings(value: Any) -> Iterator[str]:
+        """
+        Walk a JSON value and yield every string in document order.
+
+        Args:
+            value: Decoded JSON value
+
+        Yields:
+            Every string contained in the value
+        """
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from VoyagerHelper.iter_strings(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from VoyagerHelper.iter_strings(item)
+
+    @staticmethod
+    def text(value: Any) -> Optional[str]:
+        """
+        Read a voyager text value, either a plain string or a {"text": ...} object.
+
+        Args:
+            value: Voyager value
+
+        Returns:
+            Stripped text, or None if missing
+        """
+        if isinstance(value, dict):
+            value = value.get('text')
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+        return None
+
+    @staticmethod
+    def extract_job_cards(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Decode job search card payloads into raw card dictionaries.
+
+        Args:
+            payloads: voyagerJobsDashJobCards payloads of one result page
+
+        Returns:
+            List of raw card dictionaries, same shape as JobPostingSearchPage.extract_job_cards
+        """
+        cards: Dict[str, Dict[str, Any]] = {}
+        for payload in payloads:
+            included = VoyagerHelper.index_included(payload)
+            ordered_urns = [
+                urn for urn in VoyagerHelper.iter_strings(payload.get('data'))
+                if urn.startswith('urn:li:fsd_jobPostingCard:')
+            ]
+            ordered_urns += [urn for urn in included if urn.startswith('urn:li:fsd_jobPostingCard:')]
+
+            for urn in ordered_urns:
+                entity = included.get(urn)
+                match = VoyagerHelper.JOB_CARD_URN.search(urn)
+                if entity is None or match is None or match.group(1) in cards:
+                    continue
+                cards[match.group(1)] = VoyagerHelper._decode_job_card(match.group(1), entity)
+        return list(cards.values())
+
+    @staticmethod
+    def get_expected_job_card_count(payloads: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        Get how many cards the search API announced for the requested page.
+
+        Args:
+            payloads: voyagerJobsDashJobCards payloads of one result page
+
+        Returns:
+            Number of cards expected on the page, or None if no payload has paging data
+        """
+        expected_count = None
+        for payload in payloads:
+            paging = (payload.get('data') or {}).get('paging') or {}
+            if 'count' not in paging:
+                continue
+            count = paging['count']
+            if 'total' in paging:
+                count = max(0, min(count, paging['total'] - paging.get('start', 0)))
+            expected_count = (expected_count or 0) + count
+        return expected_count
+
+    @staticmethod
+    def get_total_job_count(payloads: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        Get how many results the search API reported for the whole search.
+
+        Args:
+            payloads: voyagerJobsDashJobCards payloads of one result page
+
+        Returns:
+            Total number of results, or None if no payload has paging data
+        """
+        total = None
+        for payload in payloads:
+            paging = (payload.get('data') or {}).get('paging') or {}
+            if isinstance(paging.get('total'), int):
+                total = max(total or 0, paging['total'])
+        return total
+
+    @staticmethod
+    def extract_job_posting(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode a jobPostings/{id} payload into final job posting values.
+
+        Args:
+            payload: Decoded voyager payload
+
+        Returns:
+            Dictionary with id, title, location, description, company_name, company_slug,
+            is_simple, external_url and disabled keys, or None if the payload has no posting
+        """
+        included = VoyagerHelper.index_included(payload)
+        candidates = [payload.get('data') or {}] + list(included.values())
+        posting = next(
+            (c for c in candidates if isinstance(c, dict) and c.get('title') and
+             ('jobPostingId' in c or 'applyMethod' in c or 'formattedLocation' in c)),
+            None,
+        )
+        if posting is None:
+            return None
+
+        job_id = posting.get('jobPostingId')
+        if job_id is None:
+            match = VoyagerHelper.JOB_POSTING_URN.search(posting.get('entityUrn') or '')
+            job_id = match.group(1) if match else None
+
+        apply_method = posting.get('applyMethod') or {}
+        apply_type = apply_method.get('$type') or ''
+        company_name, company_slug = VoyagerHelper._decode_company(posting.get('companyDetails') or {}, included)
+
+        return {
+            'id': int(job_id) if job_id is not None else None,
+            'title': VoyagerHelper.text(posting.get('title')),
+            'location': VoyagerHelper.text(posting.get('formattedLocation')),
+            'description': VoyagerHelper.text(posting.get('description')),
+            'company_name': company_name,
+            'company_slug': company_slug,
+            'is_simple': 'OnsiteApply' in apply_type,
+            'external_url': apply_method.get('companyApplyUrl'),
+            'disabled': posting.get('jobState') == 'CLOSED' or bool(posting.get('closedAt')),
+        }
+
+    @staticmethod
+    def _decode_job_card(job_id: str, entity: Dict[str, Any]) -> Dict[str, Any]:
+        created_at = None
+        is_simple = False
+        for footer_item in entity.get('footerItems') or []:
+            if footer_item.get('type') == 'LISTED_DATE' and footer_item.get('timeAt'):
+                created_at = datetime.datetime.fromtimestamp(footer_item['timeAt'] / 1000, datetime.timezone.utc).strftime('%Y-%m-%d')
+            if footer_item.get('type') == 'EASY_APPLY_TEXT':
+                is_simple = True
+
+        metadata_items = [
+            text for text in (
+                VoyagerHelper.text(entity.get('secondaryDescription')),
+                VoyagerHelper.text(entity.get('tertiaryDescription')),
+            ) if text
+        ]
+
+        return {
+            'id': job_id,
+            'title': VoyagerHelper.text(entity.get('jobPostingTitle')) or VoyagerHelper.text(entity.get('title')),
+            'company_name': VoyagerHelper.text(entity.get('primaryDescription')),
+            'metadata_items': metadata_items,
+            'created_at': created_at,
+            'is_simple': is_simple,
+        }
+
+    @staticmethod
+    def _decode_company(company_details: Dict[str, Any], included: Dict[str, Dict[str, Any]]) -> tuple:
+        company_urn = company_details.get('*companyResolutionResult') or company_details.get('company')
+        company = included.get(company_urn) if isinstance(company_urn, str) else None
+        if company is None:
+            company = company_details.get('companyResolutionResult')
+        if isinstance(company, dict):
+            return company.get('name'), company.get('universalName')
+        return company_details.get('companyName'), None
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from injector import inject
+
+from linkedinapi.exception.LoggedOutError import LoggedOutError
+from linkedinapi.manager.AccountSchedulerManager import AccountSchedulerManager
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.variable.AccountPoolAttemptsVariable import AccountPoolAttemptsVariable
+from linkedinapi.variable.AccountPoolCooldownVariable import AccountPoolCooldownVariable
+from linkedinapi.variable.AccountPoolEnabledVariable import AccountPoolEnabledVariable
+from linkedinapi.variable.AccountPoolVariable import AccountPoolVariable
+
+T = TypeVar('T')
+
+
+class _PoolAccount:
+    """
+    Health and counters of a single pooled session.
+    """
+
+    def __init__(self, username: str) -> None:
+        self.username = username
+        self.valid = False
+        self.session_mtime = 0.0
+        self.logged_out_mtime: Optional[float] = None
+        self.cooldown_until = 0.0
+        self.failures = 0
+        self.operations = 0
+        self.errors = 0
+
+
+class AccountPoolManager:
+    """
+    Manager spreading session-independent lookups over a pool of logged-in accounts.
+
+    Company and hirer pages look the same to every account, so when the pool is enabled
+    they run on the least-loaded healthy session found in the session directory instead
+    of the caller's. Accounts that fail are cooled down with exponential backoff, accounts
+    redirected to a login screen are skipped until their session file is replaced, and a
+    failed operation is retried on the next best account.
+    """
+
+    # Seconds between two scans of the session directory
+    REFRESH_INTERVAL = 30
+    # Upper bound of the exponential cooldown, as a multiple of the base cooldown
+    MAX_BACKOFF = 16
+
+    @inject
+    def __init__(self, session_store: SessionStoreManager, enabled: AccountPoolEnabledVariable,
+                 usernames: AccountPoolVariable, cooldown: AccountPoolCooldownVariable,
+                 attempts: AccountPoolAttemptsVariable, account_scheduler: AccountSchedulerManager) -> None:
+        """
+        Initialize the account pool.
+
+        Args:
+            session_store: Store the pooled sessions are read from
+            enabled: 1 to shard lookups over the pool, 0 to always use the caller's session
+            usernames: Accounts allowed in the pool, every stored session when empty
+            cooldown: Seconds an account is skipped after its first consecutive failure
+            attempts: Accounts tried for a single operation before giving up
+            account_scheduler: Scheduler whose queues tell how loaded each account is
+        """
+        self.session_store = session_store
+        self.enabled = bool(int(enabled))
+        self.usernames = list(usernames)
+        self.cooldown = max(0, int(cooldown))
+        self.attempts = max(1, int(attempts))
+        self.account_scheduler = account_scheduler
+        self.accounts: Dict[str, _PoolAccount] = {}
+        self.refreshed_at: Optional[float] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self.fallbacks = 0
+        self.failovers = 0
+
+    def _get_refresh_lock(self) -> asyncio.Lock:
+        # Created lazily so it binds to the running event loop
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    async def run(self, username: str, operation: Callable[[str], Awaitable[T]]) -> T:
+        """
+        Run a session-independent operation on the best available account.
+
+        Args:
+            username: Caller's username, used when the pool is disabled or has no healthy account
+            operation: Coroutine function doing the work with the username it is given
+
+        Returns:
+            Result of the first attempt that succeeds
+        """
+        if not self.enabled:
+            return await operation(username)
+
+        await self._refresh()
+        candidates = self._rank()[:self.attempts]
+        if not candidates:
+            self.fallbacks += 1
+            return await operation(username)
+
+        last_error: Optional[Exception] = None
+        for attempt, account in enumerate(candidates):
+            if attempt > 0:
+                self.failovers += 1
+            account.operations += 1
+            try:
+                result = await operation(account.username)
+            except Exception as e:
+                last_error = e
+                account.errors += 1
+                await self._mark_failed(account, e)
+                continue
+            account.failures = 0
+            return result
+
+        raise last_error
+
+    def get_stats(self) -> dict:
+        """
+        Get pool health and counters.
+
+        Returns:
+            Dictionary with pool settings, fallbacks, failovers and, per account, health and load
+        """
+        now = time.monotonic()
+        return {
+            "enabled": self.enabled,
+            "attempts": self.attempts,
+            "fallbacks": self.fallbacks,
+            "failovers": self.failovers,
+            "accounts": {
+                username: {
+                    "healthy": self._is_healthy(account, now),
+                    "valid": account.valid,
+                    "logged_out": account.logged_out_mtime is not None,
+                    "cooldown_s": round(max(0.0, account.cooldown_until - now), 1),
+                    "load": self.account_scheduler.get_load(username),
+                    "operations": account.operations,
+                    "errors": account.errors,
+                }
+                for username, account in self.accounts.items()
+            },
+        }
+
+    def _rank(self) -> List[_PoolAccount]:
+        # Accounts able to start right away first, then the least loaded
+        now = time.monotonic()
+        healthy = [account for account in self.accounts.values() if self._is_healthy(account, now)]
+        return sorted(healthy, key=lambda account: (
+            not self.account_scheduler.has_capacity(account.username),
+            self.account_scheduler.get_load(account.username),
+            account.operations,
+        ))
+
+    @staticmethod
+    def _is_healthy(account: _PoolAccount, now: float) -> bool:
+        return account.valid and account.logged_out_mtime is None and account.cooldown_until <= now
+
+    async def _mark_failed(self, account: _PoolAccount, error: Exception) -> None:
+        if isinstance(error, LoggedOutError):
+            # Skipped until a new login replaces the session file, the state the logged out
+            # context wrote back on check-in doesn't count
+            account.logged_out_mtime = await self.session_store.get_mtime(account.username)
+            logging.warning("Pooled account %s is logged out, skipping it until it logs in again", account.username)
+            return
+
+        account.failures += 1
+        backoff = min(2 ** (account.failures - 1), self.MAX_BACKOFF)
+        account.cooldown_until = time.monotonic() + self.cooldown * backoff
+        logging.warning("Pooled account %s failed (%s), cooling down for %d s",
+                        account.username, error, self.cooldown * backoff)
+
+    async def _refresh(self) -> None:
+        now = time.monotonic()
+        if self.refreshed_at is not None and now - self.refreshed_at < self.REFRESH_INTERVAL:
+            return
+
+        async with self._get_refresh_lock():
+            if self.refreshed_at is not None and time.monotonic() - self.refreshed_at < self.REFRESH_INTERVAL:
+                return
+            sessions = await self._scan_sessions()
+            self.refreshed_at = time.monotonic()
+
+        for username in list(self.accounts.keys()):
+            if username not in sessions:
+                del self.accounts[username]
+        for username, (mtime, valid) in sessions.items():
+            account = self.accounts.setdefault(username, _PoolAccount(username))
+            account.session_mtime = mtime
+            account.valid = valid
+            if account.logged_out_mtime is not None and mtime != account.logged_out_mtime:
+                account.logged_out_mtime = None
+                account.failures = 0
+
+    async def _scan_sessions(self) -> Dict[str, tuple]:
+        usernames = self.usernames or await self.session_store.list_usernames()
+        sessions = {}
+        for username in usernames:
+            mtime = await self.session_store.get_mtime(username)
+            if mtime is None:
+                continue
+            sessions[username] = (mtime, await self.session_store.is_logged_in(username))
+        return sessions
@@ -0,0 +1,231 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from injector import inject
+
+from linkedinapi.variable.AccountBurstVariable import AccountBurstVariable
+from linkedinapi.variable.AccountConcurrencyVariable import AccountConcurrencyVariable
+from linkedinapi.variable.AccountRateVariable import AccountRateVariable
+from linkedinapi.variable.AccountWeightsVariable import AccountWeightsVariable
+from linkedinapi.variable.GlobalConcurrencyVariable import GlobalConcurrencyVariable
+
+
+class _AccountState:
+    """
+    Token bucket, queue and counters of a single account.
+    """
+
+    def __init__(self, username: str, weight: int, burst: int) -> None:
+        self.username = username
+        self.weight = weight
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.waiters: Deque[Tuple[asyncio.Future, float]] = deque()
+        self.active = 0
+        self.current_weight = 0
+        self.granted = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+
+class AccountSchedulerManager:
+    """
+    Manager pacing the scraping operations of each LinkedIn account.
+
+    Every operation takes a slot first. A slot is granted when the account has a token
+    in its bucket (refilled at rate per minute, up to burst), is below its own concurrency
+    limit, and the host is below the global one. Accounts waiting at the same time are
+    served by smooth weighted round-robin, so a busy account can't starve the others.
+    """
+
+    @inject
+    def __init__(self, rate: AccountRateVariable, burst: AccountBurstVariable,
+                 account_concurrency: AccountConcurrencyVariable, global_concurrency: GlobalConcurrencyVariable,
+                 weights: AccountWeightsVariable) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            rate: Operations per minute and account, 0 disables rate limiting
+            burst: Operations an idle account can start at once
+            account_concurrency: Operations running at the same time per account
+            global_concurrency: Operations running at the same time across accounts
+            weights: Scheduling weight by username, 1 for accounts not listed
+        """
+        self.rate_per_second = float(rate) / 60
+        self.burst = max(1, int(burst))
+        self.account_concurrency = max(1, int(account_concurrency))
+        self.global_concurrency = max(1, int(global_concurrency))
+        self.weights: Dict[str, int] = dict(weights)
+        self.accounts: Dict[str, _AccountState] = {}
+        self.active = 0
+        self.refill_timer: Optional[asyncio.TimerHandle] = None
+
+    @asynccontextmanager
+    async def slot(self, username: str) -> AsyncIterator[None]:
+        """
+        Wait for the turn of an account and hold its slot for the duration of the block.
+
+        Args:
+            username: LinkedIn username the operation runs with
+        """
+        state = self._get_state(username)
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append((future, time.monotonic()))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._forget(state, future)
+            else:
+                # Granted in the same tick the caller was cancelled: hand the slot back
+                self._release(state)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(state)
+
+    def get_load(self, username: str) -> int:
+        """
+        Get the operations an account is running or waiting for.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Running plus queued operations
+        """
+        state = self.accounts.get(username)
+        if state is None:
+            return 0
+        return state.active + sum(1 for future, _ in state.waiters if not future.done())
+
+    def has_capacity(self, username: str) -> bool:
+        """
+        Check whether an account could start an operation right away.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            True if the account has a token, a free concurrency slot and nobody queued ahead
+        """
+        state = self.accounts.get(username)
+        if state is None:
+            return True
+        self._refill(state, time.monotonic())
+        return state.tokens >= 1 and state.active < self.account_concurrency and not state.waiters
+
+    def get_stats(self) -> dict:
+        """
+        Get scheduler counters.
+
+        Returns:
+            Dictionary with global limits and, per account, queue depth, running operations,
+            tokens left and wait times
+        """
+        now = time.monotonic()
+        accounts = {}
+        for username, state in self.accounts.items():
+            self._refill(state, now)
+            oldest_wait_ms = (now - state.waiters[0][1]) * 1000 if state.waiters else 0.0
+            accounts[username] = {
+                "weight": state.weight,
+                "queued": len(state.waiters),
+                "active": state.active,
+                "tokens": round(state.tokens, 2),
+                "granted": state.granted,
+                "avg_wait_ms": round(state.total_wait_ms / state.granted, 1) if state.granted else 0.0,
+                "max_wait_ms": round(state.max_wait_ms, 1),
+                "oldest_wait_ms": round(oldest_wait_ms, 1),
+            }
+        return {
+            "rate_per_minute": round(self.rate_per_second * 60, 2),
+            "burst": self.burst,
+            "account_concurrency": self.account_concurrency,
+            "global_concurrency": self.global_concurrency,
+            "active": self.active,
+            "accounts": accounts,
+        }
+
+    def _get_state(self, username: str) -> _AccountState:
+        state = self.accounts.get(username)
+        if state is None:
+            state = _AccountState(username, max(1, int(self.weights.get(username, 1))), self.burst)
+            self.accounts[username] = state
+        return state
+
+    def _refill(self, state: _AccountState, now: float) -> None:
+        if self.rate_per_second <= 0:
+            state.tokens = float(self.burst)
+            return
+        state.tokens = min(float(self.burst), state.tokens + (now - state.refilled_at) * self.rate_per_second)
+        state.refilled_at = now
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        next_refill: Optional[float] = None
+
+        while self.active < self.global_concurrency:
+            candidates = []
+            next_refill = None
+            for state in self.accounts.values():
+                while state.waiters and state.waiters[0][0].done():
+                    state.waiters.popleft()
+                if not state.waiters or state.active >= self.account_concurrency:
+                    continue
+                self._refill(state, now)
+                if state.tokens < 1:
+                    refill_in = (1 - state.tokens) / self.rate_per_second
+                    next_refill = refill_in if next_refill is None else min(next_refill, refill_in)
+                    continue
+                candidates.append(state)
+
+            if not candidates:
+                break
+
+            # Smooth weighted round-robin: the account furthest behind its share goes next
+            total_weight = sum(state.weight for state in candidates)
+            for state in candidates:
+                state.current_weight += state.weight
+            chosen = max(candidates, key=lambda state: state.current_weight)
+            chosen.current_weight -= total_weight
+            self._grant(chosen, now)
+
+        if next_refill is not None:
+            self._schedule_dispatch(next_refill)
+
+    def _grant(self, state: _AccountState, now: float) -> None:
+        future, enqueued_at = state.waiters.popleft()
+        state.tokens -= 1
+        state.active += 1
+        state.granted += 1
+        self.active += 1
+
+        wait_ms = (now - enqueued_at) * 1000
+        state.total_wait_ms += wait_ms
+        state.max_wait_ms = max(state.max_wait_ms, wait_ms)
+        future.set_result(None)
+
+    def _release(self, state: _AccountState) -> None:
+        state.active -= 1
+        self.active -= 1
+        self._dispatch()
+
+    def _forget(self, state: _AccountState, future: asyncio.Future) -> None:
+        for waiter in state.waiters:
+            if waiter[0] is future:
+                state.waiters.remove(waiter)
+                break
+
+    def _schedule_dispatch(self, delay: float) -> None:
+        if self.refill_timer is not None:
+            self.refill_timer.cancel()
+        self.refill_timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Hashable, List, Optional, TypeVar
+
+from injector import inject
+
+from linkedinapi.model.BatchItemResult import BatchItemResult
+from linkedinapi.variable.BatchConcurrencyVariable import BatchConcurrencyVariable
+
+K = TypeVar('K', bound=Hashable)
+T = TypeVar('T')
+
+
+class BatchManager:
+    """
+    Manager running the items of batch requests with a global concurrency limit.
+
+    The limit is shared by all batches in flight, so it bounds the number of tabs
+    batch requests keep busy regardless of how many of them arrive at once.
+    """
+
+    @inject
+    def __init__(self, concurrency: BatchConcurrencyVariable) -> None:
+        """
+        Initialize the batch manager.
+
+        Args:
+            concurrency: Maximum number of batch items loaded at the same time
+        """
+        self.concurrency = max(1, int(concurrency))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.batches = 0
+        self.items = 0
+        self.errors = 0
+        self.active = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    @staticmethod
+    def dedupe(keys: List[K]) -> List[K]:
+        """
+        Remove duplicate keys, keeping the first occurrence order.
+
+        Args:
+            keys: Keys as received
+
+        Returns:
+            Unique keys
+        """
+        return list(dict.fromkeys(keys))
+
+    async def iter_results(self, keys: List[K], loader: Callable[[K], Awaitable[T]]
+                           ) -> AsyncIterator[BatchItemResult[T]]:
+        """
+        Load every unique key and yield the outcomes as they finish.
+
+        Args:
+            keys: Keys to load, duplicates are loaded once
+            loader: Coroutine function loading a single key
+
+        Yields:
+            Per-item results, failed items carry the error message instead of a result
+        """
+        self.batches += 1
+
+        async def load(key: K) -> BatchItemResult[T]:
+            async with self._get_semaphore():
+                self.active += 1
+                try:
+                    return BatchItemResult(key=str(key), ok=True, result=await loader(key))
+                except Exception as e:
+                    self.errors += 1
+                    logging.warning("Batch item %s failed: %s", key, e)
+                    return BatchItemResult(key=str(key), ok=False, error=str(e))
+                finally:
+                    self.active -= 1
+                    self.items += 1
+
+        tasks = [asyncio.ensure_future(load(key)) for key in self.dedupe(keys)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer went away: don't keep scraping for nobody
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, keys: List[K], loader: Callable[[K], Awaitable[T]]) -> List[BatchItemResult[T]]:
+        """
+        Load every unique key and return the outcomes in request order.
+
+        Args:
+            keys: Keys to load, duplicates are loaded once
+            loader: Coroutine function loading a single key
+
+        Returns:
+            List of per-item results
+        """
+        results = {result.key: result async for result in self.iter_results(keys, loader)}
+        return [results[str(key)] for key in self.dedupe(keys)]
+
+    def get_stats(self) -> dict:
+        """
+        Get batch counters.
+
+        Returns:
+            Dictionary with concurrency limit, batches, items, errors and active items
+        """
+        return {
+            "concurrency": self.concurrency,
+            "batches": self.batches,
+            "items": self.items,
+            "errors": self.errors,
+            "active": self.active,
+        }
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from typing import Optional
+
+from injector import inject
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from linkedinapi.manager.MetricsManager import MetricsManager
+
+
+class BrowserManager:
+    """
+    Manager owning a single long-lived Playwright driver and Chromium browser.
+
+    The browser is launched lazily on first use and shared by every client call.
+    If it crashes or gets disconnected it is relaunched on the next request.
+    """
+
+    headless: bool = False
+
+    @inject
+    def __init__(self, metrics: MetricsManager) -> None:
+        """
+        Initialize the browser manager without launching anything yet.
+
+        Args:
+            metrics: Metrics the browser launches are timed in
+        """
+        self.metrics = metrics
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.lock: Optional[asyncio.Lock] = None
+        self.launch_count = 0
+        self.reuse_count = 0
+        self.disconnect_count = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        return self.lock
+
+    async def get_browser(self) -> Browser:
+        """
+        Get the shared browser, launching or relaunching it when needed.
+
+        Returns:
+            Connected Chromium browser instance
+        """
+        async with self._get_lock():
+            if self.browser is not None and self.browser.is_connected():
+                self.reuse_count += 1
+                return self.browser
+            with self.metrics.phase('browser_launch'):
+                await self._launch()
+            return self.browser
+
+    async def new_context(self, **kwargs) -> BrowserContext:
+        """
+        Create a new browser context on the shared browser.
+
+        Args:
+            **kwargs: Options forwarded to Browser.new_context
+
+        Returns:
+            Newly created browser context
+        """
+        browser = await self.get_browser()
+        return await browser.new_context(**kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the shared browser and stop the Playwright driver.
+        """
+        async with self._get_lock():
+            if self.browser is not None:
+                try:
+                    await self.browser.close()
+                except Exception:
+                    pass
+                self.browser = None
+            if self.playwright is not None:
+                try:
+                    await self.playwright.stop()
+                except Exception:
+                    pass
+                self.playwright = None
+
+    def is_running(self) -> bool:
+        """
+        Check whether the shared browser is currently connected.
+
+        Returns:
+            True if the browser is launched and connected, False otherwise
+        """
+        return self.browser is not None and self.browser.is_connected()
+
+    def get_stats(self) -> dict:
+        """
+        Get launch and reuse counters for the shared browser.
+
+        Returns:
+            Dictionary with browser lifecycle counters
+        """
+        return {
+            "running": self.is_running(),
+            "launch_count": self.launch_count,
+            "reuse_count": self.reuse_count,
+            "disconnect_count": self.disconnect_count,
+        }
+
+    async def _launch(self) -> None:
+        if self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+
+        try:
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        except Exception:
+            # The driver itself may have died together with the browser, restart it once
+            try:
+                await self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
+
+        self.browser.on("disconnected", self._on_disconnected)
+        self.launch_count += 1
+        logging.info("Chromium launched (launch_count=%d)", self.launch_count)
+
+    def _on_disconnected(self, browser: Browser) -> None:
+        self.disconnect_count += 1
+        logging.warning("Chromium disconnected, it will be relaunched on next use")
@@ -0,0 +1,311 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+from injector import inject
+from playwright.async_api import BrowserContext, Page
+
+from linkedinapi.manager.BrowserManager import BrowserManager
+from linkedinapi.manager.MetricsManager import MetricsManager
+from linkedinapi.manager.PagePool import PagePool
+from linkedinapi.manager.RequestFilterManager import RequestFilterManager
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.variable.ContextPoolIdleTimeoutVariable import ContextPoolIdleTimeoutVariable
+from linkedinapi.variable.ContextPoolSizeVariable import ContextPoolSizeVariable
+from linkedinapi.variable.PagePoolSizeVariable import PagePoolSizeVariable
+
+
+class _PooledContext:
+
+    def __init__(self, username: str, context: BrowserContext, page_pool_size: int) -> None:
+        self.username = username
+        self.context = context
+        self.pages = PagePool(context, page_pool_size)
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.cookies_fingerprint: Optional[str] = None
+
+
+class ContextPoolManager:
+    """
+    Keyed pool of browser contexts, one per LinkedIn username.
+
+    The storage state of a user is loaded from the session store when its context is created. Contexts are
+    kept alive between requests, evicted in LRU order when the pool is full or idle for
+    too long, and their storage state is written back on eviction or when cookies change.
+    Each context owns a PagePool of warm tabs.
+    """
+
+    @inject
+    def __init__(self, session_store: SessionStoreManager, browser_manager: BrowserManager,
+                 request_filter: RequestFilterManager, max_size: ContextPoolSizeVariable, idle_timeout: ContextPoolIdleTimeoutVariable,
+                 page_pool_size: PagePoolSizeVariable, metrics: MetricsManager) -> None:
+        """
+        Initialize the context pool.
+
+        Args:
+            session_store: Store the storage state of each user is read from and written to
+            browser_manager: Manager owning the shared Chromium instance
+            request_filter: Filter installed on every created context
+            max_size: Maximum number of live contexts
+            idle_timeout: Seconds after which an unused context is evicted
+            page_pool_size: Maximum number of idle tabs per route in each context
+            metrics: Metrics the context creations are timed in
+        """
+        self.session_store = session_store
+        self.browser_manager = browser_manager
+        self.request_filter = request_filter
+        self.max_size = int(max_size)
+        self.idle_timeout = int(idle_timeout)
+        self.page_pool_size = int(page_pool_size)
+        self.metrics = metrics
+        self.entries: "OrderedDict[str, _PooledContext]" = OrderedDict()
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.lock: Optional[asyncio.Lock] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.persists = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        return self.lock
+
+    @asynccontextmanager
+    async def acquire(self, username: str) -> AsyncIterator[BrowserContext]:
+        """
+        Check out the browser context of a user for the duration of the block.
+
+        Args:
+            username: LinkedIn username whose session the context is loaded with
+
+        Yields:
+            Browser context loaded with the user's storage state
+        """
+        entry = await self._checkout(username)
+        try:
+            yield entry.context
+        finally:
+            await self._checkin(entry)
+
+    @asynccontextmanager
+    async def acquire_page(self, username: str, route: str = 'blank') -> AsyncIterator[Page]:
+        """
+        Check out a warm tab from the context of a user for the duration of the block.
+
+        Args:
+            username: LinkedIn username whose session the tab is loaded with
+            route: Name of the route the tab should be parked on, one of PagePool.ROUTES
+
+        Yields:
+            Page parked on the requested route
+        """
+        entry = await self._checkout(username)
+        try:
+            async with entry.pages.acquire(route) as page:
+                yield page
+        finally:
+            await self._checkin(entry)
+
+    async def warm(self, username: str, route: str, count: Optional[int] = None) -> None:
+        """
+        Make sure the context of a user holds parked tabs on a route.
+
+        Args:
+            username: LinkedIn username
+            route: Name of the route, one of PagePool.ROUTES
+            count: Number of idle tabs to reach, defaults to the page pool size
+        """
+        entry = await self._checkout(username)
+        try:
+            await entry.pages.warm(route, count)
+        finally:
+            await self._checkin(entry)
+
+    async def invalidate(self, username: str) -> None:
+        """
+        Drop the context of a user without writing back its storage state.
+
+        Used when the session file has been replaced, e.g. after a new login.
+
+        Args:
+            username: LinkedIn username
+        """
+        async with self._get_lock():
+            entry = self.entries.pop(username, None)
+            # A context being created is loading the previous state, it's dropped once created
+            self.pending.pop(username, None)
+        if entry is not None:
+            await self._close(entry, persist=False)
+
+    async def close_all(self) -> None:
+        """
+        Persist and close every pooled context.
+        """
+        async with self._get_lock():
+            entries = list(self.entries.values())
+            self.entries.clear()
+        for entry in entries:
+            await self._close(entry, persist=True)
+
+    def get_stats(self) -> dict:
+        """
+        Get pool occupancy and hit counters.
+
+        Returns:
+            Dictionary with context pool counters
+        """
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "in_use": sum(1 for entry in self.entries.values() if entry.in_use > 0),
+            "hits": self.hits,
+            "misses": self.misses,
+            "creating": len(self.pending),
+            "evictions": self.evictions,
+            "persists": self.persists,
+            "pages": {username: entry.pages.get_stats() for username, entry in self.entries.items()},
+        }
+
+    async def _checkout(self, username: str) -> _PooledContext:
+        evicted: List[_PooledContext] = []
+        try:
+            while True:
+                async with self._get_lock():
+                    evicted.extend(self._pop_idle())
+
+                    entry = self.entries.get(username)
+                    if entry is not None and not self._is_alive(entry):
+                        self.entries.pop(username)
+                        entry = None
+
+                    if entry is not None:
+                        self.hits += 1
+                        self.entries.move_to_end(username)
+                        entry.in_use += 1
+                        entry.last_used = time.monotonic()
+                        return entry
+
+                    pending = self.pending.get(username)
+                    if pending is None:
+                        self.misses += 1
+                        # Contexts being created count against the pool size too
+                        evicted.extend(self._pop_lru(max(0, self.max_size - 1 - len(self.pending))))
+                        pending = asyncio.get_running_loop().create_future()
+                        self.pending[username] = pending
+                        break
+
+                # Another request is creating the context of this user, take it once it's pooled
+                await asyncio.wait([pending])
+
+            # The context is created outside the lock, so other users' checkouts don't wait on it
+            try:
+                entry = await self._create(username)
+            except BaseException:
+                async with self._get_lock():
+                    if self.pending.get(username) is pending:
+                        self.pending.pop(username)
+                pending.set_result(None)
+                raise
+
+            async with self._get_lock():
+                stale = self.pending.get(username) is not pending
+                if not stale:
+                    self.pending.pop(username)
+                    entry.in_use += 1
+                    entry.last_used = time.monotonic()
+                    self.entries[username] = entry
+            pending.set_result(None)
+            if stale:
+                # The user was invalidated while the context was loading the previous storage state
+                await self._close(entry, persist=False)
+                return await self._checkout(username)
+            return entry
+        finally:
+            for evicted_entry in evicted:
+                await self._close(evicted_entry, persist=True)
+
+    async def _create(self, username: str) -> _PooledContext:
+        with self.metrics.phase('context_create'):
+            context = await self.browser_manager.new_context(
+                storage_state=await self.session_store.get_state(username)
+            )
+            try:
+                await self.request_filter.install(context)
+                cookies = await context.cookies()
+            except BaseException:
+                await context.close()
+                raise
+        entry = _PooledContext(username, context, self.page_pool_size)
+        entry.cookies_fingerprint = self._fingerprint(cookies)
+        return entry
+
+    async def _checkin(self, entry: _PooledContext) -> None:
+        entry.in_use -= 1
+        entry.last_used = time.monotonic()
+        if not self._is_alive(entry):
+            return
+        try:
+            fingerprint = self._fingerprint(await entry.context.cookies())
+        except Exception:
+            return
+        if fingerprint != entry.cookies_fingerprint:
+            entry.cookies_fingerprint = fingerprint
+            await self._persist(entry)
+
+    def _pop_idle(self) -> List[_PooledContext]:
+        now = time.monotonic()
+        idle = [
+            username for username, entry in self.entries.items()
+            if entry.in_use == 0 and now - entry.last_used > self.idle_timeout
+        ]
+        self.evictions += len(idle)
+        return [self.entries.pop(username) for username in idle]
+
+    def _pop_lru(self, target_size: int) -> List[_PooledContext]:
+        popped = []
+        for username in list(self.entries.keys()):
+            if len(self.entries) <= target_size:
+                break
+            if self.entries[username].in_use == 0:
+                popped.append(self.entries.pop(username))
+        self.evictions += len(popped)
+        if len(self.entries) > target_size:
+            logging.warning("Context pool over capacity (%d live, max %d), all contexts are in use",
+                            len(self.entries) + 1, self.max_size)
+        return popped
+
+    async def _close(self, entry: _PooledContext, persist: bool) -> None:
+        if persist and self._is_alive(entry):
+            await self._persist(entry)
+        await entry.pages.close()
+        try:
+            await entry.context.close()
+        except Exception:
+            pass
+
+    async def _persist(self, entry: _PooledContext) -> None:
+        try:
+            await self.session_store.save_context(entry.username, entry.context)
+            self.persists += 1
+        except Exception as e:
+            logging.warning("Could not persist storage state for %s: %s", entry.username, e)
+
+    @staticmethod
+    def _is_alive(entry: _PooledContext) -> bool:
+        browser = entry.context.browser
+        return browser is not None and browser.is_connected()
+
+    @staticmethod
+    def _fingerprint(cookies: list) -> str:
+        items = sorted(
+            (c.get('name'), c.get('value'), c.get('domain'), c.get('path'), c.get('expires'))
+            for c in cookies
+        )
+        return hashlib.sha1(json.dumps(items).encode('utf-8')).hexdigest()
@@ -0,0 +1,405 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from injector import inject
+
+from linkedinapi.model.CrawlJob import CrawlJob
+from linkedinapi.model.CrawlJobRequest import CrawlJobRequest
+from linkedinapi.model.CrawlJobResultPage import CrawlJobResultPage
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+from linkedinapi.service.CompanyService import CompanyService
+from linkedinapi.service.HirerService import HirerService
+from linkedinapi.service.JobPostingService import JobPostingService
+from linkedinapi.variable.CrawlJobDbPathVariable import CrawlJobDbPathVariable
+from linkedinapi.variable.CrawlWorkersVariable import CrawlWorkersVariable
+
+
+class CrawlJobManager:
+    """
+    Manager running long crawls as jobs backed by a persistent SQLite queue.
+
+    Workers claim queued jobs and store results as they are produced, together with a
+    checkpoint: the query of the next page for searches, the stored keys for the other
+    types. Jobs interrupted by a shutdown or crash go back to the queue when the manager
+    starts again and resume from their checkpoint; items that failed are tried again then.
+    """
+
+    poll_interval: float = 5.0
+
+    @inject
+    def __init__(self, db_path: CrawlJobDbPathVariable, workers: CrawlWorkersVariable,
+                 job_posting_service: JobPostingService, company_service: CompanyService,
+                 hirer_service: HirerService) -> None:
+        """
+        Initialize the crawl job manager.
+
+        Args:
+            db_path: Path of the SQLite queue
+            workers: Number of jobs run at the same time
+            job_posting_service: Service running searches and job posting lookups
+            company_service: Service running company lookups
+            hirer_service: Service running hirer lookups
+        """
+        self.db_path = str(db_path)
+        self.workers = max(1, int(workers))
+        self.job_posting_service = job_posting_service
+        self.company_service = company_service
+        self.hirer_service = hirer_service
+        self.connection: Optional[sqlite3.Connection] = None
+        self.db_lock = threading.Lock()
+        self.tasks: List[asyncio.Task] = []
+        self.running: Dict[str, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _get_wakeup(self) -> asyncio.Event:
+        # Created lazily so it binds to the running event loop
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    async def start(self) -> None:
+        """
+        Requeue interrupted jobs and start the workers.
+        """
+        if self.tasks:
+            return
+        self._wakeup = asyncio.Event()
+        requeued = await asyncio.to_thread(self._db_requeue_running)
+        if requeued:
+            logging.info("Requeued %d interrupted crawl jobs", requeued)
+        loop = asyncio.get_running_loop()
+        self.tasks = [loop.create_task(self._work(i)) for i in range(self.workers)]
+
+    async def stop(self) -> None:
+        """
+        Stop the workers. Running jobs are requeued and resume from their checkpoint on the next start.
+        """
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    async def submit(self, username: str, crawl_job_request: CrawlJobRequest) -> CrawlJob:
+        """
+        Queue a new crawl job.
+
+        Args:
+            username: LinkedIn username the job runs with
+            crawl_job_request: What to crawl
+
+        Returns:
+            The queued job
+        """
+        job_id = uuid.uuid4().hex
+        await asyncio.to_thread(self._db_insert, job_id, username, crawl_job_request)
+        self._get_wakeup().set()
+        return await self.get(job_id)
+
+    async def get(self, job_id: str) -> Optional[CrawlJob]:
+        """
+        Get the state of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job, or None if it doesn't exist
+        """
+        return await asyncio.to_thread(self._db_get, job_id)
+
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 100) -> CrawlJobResultPage:
+        """
+        Get a page of the results stored so far.
+
+        Args:
+            job_id: Job identifier
+            offset: Index of the first result
+            limit: Maximum number of results
+
+        Returns:
+            Results and the offset of the next page, None once all stored results were read
+        """
+        items = await asyncio.to_thread(self._db_results, job_id, offset, limit + 1)
+        next_offset = offset + limit if len(items) > limit else None
+        return CrawlJobResultPage(items=items[:limit], next_offset=next_offset)
+
+    async def cancel(self, job_id: str) -> Optional[CrawlJob]:
+        """
+        Cancel a queued or running job. Results stored so far are kept.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job after cancellation, or None if it doesn't exist
+        """
+        await asyncio.to_thread(self._db_cancel, job_id)
+        task = self.running.get(job_id)
+        if task is not None:
+            task.cancel()
+        return await self.get(job_id)
+
+    async def get_stats(self) -> dict:
+        """
+        Get queue counters.
+
+        Returns:
+            Dictionary with worker count, running jobs and jobs by status
+        """
+        return {
+            "workers": self.workers,
+            "running": len(self.running),
+            "jobs": await asyncio.to_thread(self._db_count_by_status),
+        }
+
+    async def _work(self, worker: int) -> None:
+        while True:
+            job = await asyncio.to_thread(self._db_claim)
+            if job is None:
+                wakeup = self._get_wakeup()
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            task = asyncio.get_running_loop().create_task(self._run(job))
+            self.running[job.id] = task
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.done():
+                    # The worker is stopping: stop the job and leave it for the next start
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    await asyncio.to_thread(self._db_requeue, job.id)
+                    raise
+            finally:
+                self.running.pop(job.id, None)
+
+    async def _run(self, job: CrawlJob) -> None:
+        logging.info("Crawl job %s (%s) started", job.id, job.request.type)
+        resumed_at = time.time()
+        stats = dict(job.stats)
+        try:
+            if job.request.type == 'search':
+                await self._run_search(job, stats, resumed_at)
+            else:
+                await self._run_items(job, stats, resumed_at)
+        except asyncio.CancelledError:
+            await asyncio.to_thread(self._db_checkpoint, job.id, None, [], self._timed(stats, resumed_at))
+            raise
+        except Exception as e:
+            logging.exception("Crawl job %s failed", job.id)
+            await asyncio.to_thread(self._db_finish, job.id, 'failed', str(e), self._timed(stats, resumed_at))
+            return
+        await asyncio.to_thread(self._db_finish, job.id, 'done', None, self._timed(stats, resumed_at))
+        logging.info("Crawl job %s done", job.id)
+
+    async def _run_search(self, job: CrawlJob, stats: Dict[str, Any], resumed_at: float) -> None:
+        checkpoint = await asyncio.to_thread(self._db_get_checkpoint, job.id)
+        search_query: Optional[JobSearchQuery] = job.request.search
+        if checkpoint is not None:
+            search_query = JobSearchQuery.model_validate_json(checkpoint) if checkpoint != 'null' else None
+
+        while search_query is not None:
+            job_postings, next_query = await self.job_posting_service.get_job_posting_listing_page(
+                job.username, search_query
+            )
+            if job.request.limit_first_page:
+                next_query = None
+
+            stats["pages"] = stats.get("pages", 0) + 1
+            stats["items"] = stats.get("items", 0) + len(job_postings)
+            results = [(str(job_posting.id), job_posting.model_dump_json()) for job_posting in job_postings]
+            next_checkpoint = next_query.model_dump_json() if next_query is not None else 'null'
+            await asyncio.to_thread(
+                self._db_checkpoint, job.id, next_checkpoint, results, self._timed(stats, resumed_at)
+            )
+            search_query = next_query
+
+    async def _run_items(self, job: CrawlJob, stats: Dict[str, Any], resumed_at: float) -> None:
+        # Items that failed in a previous run are tried again, their new result replaces the failed one
+        stored = await asyncio.to_thread(self._db_result_states, job.id)
+        failed_keys = {key for key, ok in stored.items() if not ok}
+        keys = [key for key in dict.fromkeys(job.request.keys) if not stored.get(key)]
+
+        async for batch_item_result in self._iter_items(job, keys):
+            if batch_item_result.key in failed_keys:
+                stats["retries"] = stats.get("retries", 0) + 1
+                if batch_item_result.ok:
+                    stats["errors"] = stats.get("errors", 0) - 1
+            else:
+                stats["items"] = stats.get("items", 0) + 1
+                if not batch_item_result.ok:
+                    stats["errors"] = stats.get("errors", 0) + 1
+            await asyncio.to_thread(
+                self._db_store_item, job.id, batch_item_result.key, batch_item_result.model_dump_json(),
+                self._timed(stats, resumed_at),
+            )
+
+    def _iter_items(self, job: CrawlJob, keys: List[str]) -> AsyncIterator:
+        if job.request.type == 'job_postings':
+            return self.job_posting_service.iter_job_postings(job.username, [int(key) for key in keys])
+        if job.request.type == 'companies':
+            return self.company_service.iter_companies(job.username, keys)
+        return self.hirer_service.iter_hirers(job.username, keys)
+
+    @staticmethod
+    def _timed(stats: Dict[str, Any], resumed_at: float) -> Dict[str, Any]:
+        timed = dict(stats)
+        timed["run_ms"] = round(stats.get("run_ms", 0) + (time.time() - resumed_at) * 1000, 1)
+        if timed["run_ms"]:
+            timed["items_per_second"] = round(timed.get("items", 0) / timed["run_ms"] * 1000, 3)
+        return timed
+
+    def _db(self) -> sqlite3.Connection:
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection.executescript(
+                "CREATE TABLE IF NOT EXISTS crawl_jobs ("
+                "id TEXT PRIMARY KEY, username TEXT NOT NULL, request TEXT NOT NULL, status TEXT NOT NULL, "
+                "created_at REAL NOT NULL, started_at REAL, finished_at REAL, error TEXT, "
+                "checkpoint TEXT, stats TEXT NOT NULL DEFAULT '{}');"
+                "CREATE INDEX IF NOT EXISTS crawl_jobs_status ON crawl_jobs (status, created_at);"
+                "CREATE TABLE IF NOT EXISTS crawl_job_results ("
+                "job_id TEXT NOT NULL, seq INTEGER NOT NULL, key TEXT NOT NULL, payload TEXT NOT NULL, "
+                "PRIMARY KEY (job_id, seq));"
+            )
+        return self.connection
+
+    def _db_insert(self, job_id: str, username: str, crawl_job_request: CrawlJobRequest) -> None:
+        with self.db_lock, self._db() as connection:
+            connection.execute(
+                "INSERT INTO crawl_jobs (id, username, request, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, username, crawl_job_request.model_dump_json(), time.time()),
+            )
+
+    def _db_get(self, job_id: str) -> Optional[CrawlJob]:
+        with self.db_lock:
+            connection = self._db()
+            row = connection.execute(
+                "SELECT id, username, request, status, created_at, started_at, finished_at, error, stats "
+                "FROM crawl_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            result_count = connection.execute(
+                "SELECT COUNT(*) FROM crawl_job_results WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+        return self._row_to_job(row, result_count)
+
+    def _db_claim(self) -> Optional[CrawlJob]:
+        with self.db_lock, self._db() as connection:
+            row = connection.execute(
+                "SELECT id, username, request, status, created_at, started_at, finished_at, error, stats "
+                "FROM crawl_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE crawl_jobs SET status = 'running', started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (time.time(), row[0]),
+            )
+        return self._row_to_job(row, 0)
+
+    def _db_checkpoint(self, job_id: str, checkpoint: Optional[str], results: List[tuple],
+                       stats: Dict[str, Any]) -> None:
+        # Results and checkpoint are committed together, a resumed job never repeats or skips a page
+        with self.db_lock, self._db() as connection:
+            seq = connection.execute(
+                "SELECT COALESCE(MAX(seq), -1) + 1 FROM crawl_job_results WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+            connection.executemany(
+                "INSERT INTO crawl_job_results (job_id, seq, key, payload) VALUES (?, ?, ?, ?)",
+                [(job_id, seq + i, key, payload) for i, (key, payload) in enumerate(results)],
+            )
+            if checkpoint is not None:
+                connection.execute("UPDATE crawl_jobs SET checkpoint = ? WHERE id = ?", (checkpoint, job_id))
+            connection.execute("UPDATE crawl_jobs SET stats = ? WHERE id = ?", (json.dumps(stats), job_id))
+
+    def _db_get_checkpoint(self, job_id: str) -> Optional[str]:
+        with self.db_lock:
+            row = self._db().execute("SELECT checkpoint FROM crawl_jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _db_store_item(self, job_id: str, key: str, payload: str, stats: Dict[str, Any]) -> None:
+        with self.db_lock, self._db() as connection:
+            updated = connection.execute(
+                "UPDATE crawl_job_results SET payload = ? WHERE job_id = ? AND key = ?", (payload, job_id, key)
+            ).rowcount
+            if not updated:
+                connection.execute(
+                    "INSERT INTO crawl_job_results (job_id, seq, key, payload) "
+                    "SELECT ?, COALESCE(MAX(seq), -1) + 1, ?, ? FROM crawl_job_results WHERE job_id = ?",
+                    (job_id, key, payload, job_id),
+                )
+            connection.execute("UPDATE crawl_jobs SET stats = ? WHERE id = ?", (json.dumps(stats), job_id))
+
+    def _db_result_states(self, job_id: str) -> Dict[str, bool]:
+        with self.db_lock:
+            rows = self._db().execute(
+                "SELECT key, json_extract(payload, '$.ok') FROM crawl_job_results WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return {key: bool(ok) for key, ok in rows}
+
+    def _db_count_by_status(self) -> Dict[str, int]:
+        with self.db_lock:
+            rows = self._db().execute("SELECT status, COUNT(*) FROM crawl_jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def _db_results(self, job_id: str, offset: int, limit: int) -> List[Any]:
+        with self.db_lock:
+            rows = self._db().execute(
+                "SELECT payload FROM crawl_job_results WHERE job_id = ? ORDER BY seq LIMIT ? OFFSET ?",
+                (job_id, limit, offset),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _db_finish(self, job_id: str, status: str, error: Optional[str], stats: Dict[str, Any]) -> None:
+        with self.db_lock, self._db() as connection:
+            connection.execute(
+                "UPDATE crawl_jobs SET status = ?, error = ?, stats = ?, finished_at = ? "
+                "WHERE id = ? AND status = 'running'",
+                (status, error, json.dumps(stats), time.time(), job_id),
+            )
+
+    def _db_cancel(self, job_id: str) -> None:
+        with self.db_lock, self._db() as connection:
+            connection.execute(
+                "UPDATE crawl_jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id),
+            )
+
+    def _db_requeue(self, job_id: str) -> None:
+        with self.db_lock, self._db() as connection:
+            connection.execute("UPDATE crawl_jobs SET status = 'queued' WHERE id = ? AND status = 'running'", (job_id,))
+
+    def _db_requeue_running(self) -> int:
+        with self.db_lock, self._db() as connection:
+            return connection.execute("UPDATE crawl_jobs SET status = 'queued' WHERE status = 'running'").rowcount
+
+    @staticmethod
+    def _row_to_job(row: tuple, result_count: int) -> CrawlJob:
+        return CrawlJob(
+            id=row[0],
+            username=row[1],
+            request=CrawlJobRequest.model_validate_json(row[2]),
+            status=row[3],
+            created_at=row[4],
+            started_at=row[5],
+            finished_at=row[6],
+            error=row[7],
+            result_count=result_count,
+            stats=json.loads(row[8]),
+        )
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple, Type, TypeVar
+
+from injector import inject
+from pydantic import BaseModel
+
+from linkedinapi.model.CachePolicy import CachePolicy
+from linkedinapi.variable.EntityCacheDbPathVariable import EntityCacheDbPathVariable
+from linkedinapi.variable.EntityCacheNegativeTtlVariable import EntityCacheNegativeTtlVariable
+from linkedinapi.variable.EntityCachePersistVariable import EntityCachePersistVariable
+from linkedinapi.variable.EntityCacheSizeVariable import EntityCacheSizeVariable
+from linkedinapi.variable.EntityCacheStaleTtlVariable import EntityCacheStaleTtlVariable
+from linkedinapi.variable.EntityCacheTtlsVariable import EntityCacheTtlsVariable
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+# (stored_at, serialized model or None, missing)
+_Entry = Tuple[float, Optional[str], bool]
+
+
+class EntityCacheManager:
+    """
+    Manager caching scraped entities (job postings, companies, hirers) in the service tier.
+
+    Entities are keyed by kind and id/slug. Lookups go through an in-process LRU first and
+    an optional SQLite file second, which survives restarts. Each kind has its own TTL,
+    entities that came back missing are kept for the shorter negative TTL. Past its TTL a
+    value is still served for stale_ttl seconds while a single background refresh runs.
+    """
+
+    default_ttl: int = 3600
+
+    @inject
+    def __init__(self, size: EntityCacheSizeVariable, ttls: EntityCacheTtlsVariable,
+                 negative_ttl: EntityCacheNegativeTtlVariable, stale_ttl: EntityCacheStaleTtlVariable,
+                 persist: EntityCachePersistVariable, db_path: EntityCacheDbPathVariable) -> None:
+        """
+        Initialize the entity cache.
+
+        Args:
+            size: Maximum number of entities kept in memory
+            ttls: Seconds an entity stays fresh, by kind
+            negative_ttl: Seconds a missing entity stays cached
+            stale_ttl: Seconds past the TTL a value is served while being refreshed
+            persist: Whether to keep a SQLite tier
+            db_path: Path of the SQLite file
+        """
+        self.size = int(size)
+        self.ttls: Dict[str, int] = dict(ttls)
+        self.negative_ttl = int(negative_ttl)
+        self.stale_ttl = int(stale_ttl)
+        self.db_path = str(db_path) if int(persist) else None
+        self.entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self.refreshing: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.background: Set[asyncio.Task] = set()
+        self.connection: Optional[sqlite3.Connection] = None
+        self.db_lock = threading.Lock()
+        self.counters: Dict[str, int] = {
+            "hits": 0, "disk_hits": 0, "negative_hits": 0, "stale_hits": 0,
+            "misses": 0, "bypasses": 0, "refreshes": 0, "refresh_errors": 0,
+        }
+
+    async def get_or_load(self, kind: str, key: str, model_class: Type[ModelT],
+                          loader: Callable[[], Awaitable[Optional[ModelT]]],
+                          cache_policy: Optional[CachePolicy] = None,
+                          is_missing: Optional[Callable[[Optional[ModelT]], bool]] = None) -> Optional[ModelT]:
+        """
+        Get an entity from the cache, loading and storing it on a miss.
+
+        Args:
+            kind: Entity kind, e.g. 'company'
+            key: Entity id or slug
+            model_class: Model the entity is rebuilt as
+            loader: Coroutine function scraping the entity
+            cache_policy: Directives of the request, see CachePolicy
+            is_missing: Predicate telling whether a loaded entity means "not found", defaults to None check
+
+        Returns:
+            The cached or freshly loaded entity
+        """
+        cache_policy = cache_policy or CachePolicy()
+        is_missing = is_missing or (lambda value: value is None)
+
+        if cache_policy.no_store:
+            self.counters["bypasses"] += 1
+            return await loader()
+
+        if not cache_policy.no_cache:
+            entry = await self._lookup(kind, key)
+            if entry is not None:
+                stored_at, payload, missing = entry
+                age = time.time() - stored_at
+                ttl = self.negative_ttl if missing else self.ttls.get(kind, self.default_ttl)
+                if cache_policy.max_age is not None:
+                    ttl = min(ttl, cache_policy.max_age)
+
+                if age <= ttl:
+                    self.counters["negative_hits" if missing else "hits"] += 1
+                    return self._load_model(model_class, payload)
+
+                if not missing and cache_policy.max_age is None and age <= ttl + self.stale_ttl:
+                    self.counters["stale_hits"] += 1
+                    self._schedule_refresh(kind, key, loader, is_missing)
+                    return self._load_model(model_class, payload)
+
+        self.counters["misses"] += 1
+        value = await loader()
+        await self.put(kind, key, value, is_missing(value))
+        return value
+
+    async def put(self, kind: str, key: str, value: Optional[BaseModel], missing: bool = False) -> None:
+        """
+        Store an entity in both tiers.
+
+        Args:
+            kind: Entity kind
+            key: Entity id or slug
+            value: Entity to store, None for a missing one
+            missing: Whether the entity counts as not found
+        """
+        entry = (time.time(), value.model_dump_json() if value is not None else None, missing)
+        self._remember((kind, key), entry)
+        if self.db_path is not None:
+            await asyncio.to_thread(self._db_write, kind, key, entry)
+
+    async def invalidate(self, kind: str, key: str) -> None:
+        """
+        Drop an entity from both tiers.
+
+        Args:
+            kind: Entity kind
+            key: Entity id or slug
+        """
+        self.entries.pop((kind, key), None)
+        if self.db_path is not None:
+            await asyncio.to_thread(self._db_delete, kind, key)
+
+    def get_stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with sizes, TTLs and hit/miss counters
+        """
+        return {
+            "size": len(self.entries),
+            "max_size": self.size,
+            "ttls": self.ttls,
+            "negative_ttl": self.negative_ttl,
+            "stale_ttl": self.stale_ttl,
+            "persistent": self.db_path is not None,
+            "refreshing": len(self.refreshing),
+            **self.counters,
+        }
+
+    async def _lookup(self, kind: str, key: str) -> Optional[_Entry]:
+        entry = self.entries.get((kind, key))
+        if entry is not None:
+            self.entries.move_to_end((kind, key))
+            return entry
+
+        if self.db_path is None:
+            return None
+        entry = await asyncio.to_thread(self._db_read, kind, key)
+        if entry is not None:
+            self.counters["disk_hits"] += 1
+            self._remember((kind, key), entry)
+        return entry
+
+    def _remember(self, cache_key: Tuple[str, str], entry: _Entry) -> None:
+        self.entries[cache_key] = entry
+        self.entries.move_to_end(cache_key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def _schedule_refresh(self, kind: str, key: str, loader: Callable[[], Awaitable[Optional[BaseModel]]],
+                          is_missing: Callable[[Optional[BaseModel]], bool]) -> None:
+        if (kind, key) in self.refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                value = await loader()
+                await self.put(kind, key, value, is_missing(value))
+                self.counters["refreshes"] += 1
+            except Exception as e:
+                self.counters["refresh_errors"] += 1
+                logging.warning("Background refresh of %s %s failed: %s", kind, key, e)
+            finally:
+                self.refreshing.pop((kind, key), None)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self.refreshing[(kind, key)] = task
+        self.background.add(task)
+        task.add_done_callback(self.background.discard)
+
+    @staticmethod
+    def _load_model(model_class: Type[ModelT], payload: Optional[str]) -> Optional[ModelT]:
+        # Every caller gets its own instance, so callers can't mutate the cached one
+        return model_class.model_validate_json(payload) if payload is not None else None
+
+    def _db(self) -> sqlite3.Connection:
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS entity_cache ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, payload TEXT, "
+                "missing INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (kind, key))"
+            )
+            self.connection.commit()
+        return self.connection
+
+    def _db_read(self, kind: str, key: str) -> Optional[_Entry]:
+        with self.db_lock:
+            row = self._db().execute(
+                "SELECT stored_at, payload, missing FROM entity_cache WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        return (row[0], row[1], bool(row[2])) if row is not None else None
+
+    def _db_write(self, kind: str, key: str, entry: _Entry) -> None:
+        with self.db_lock:
+            connection = self._db()
+            connection.execute(
+                "INSERT OR REPLACE INTO entity_cache (kind, key, stored_at, payload, missing) VALUES (?, ?, ?, ?, ?)",
+                (kind, key, entry[0], entry[1], int(entry[2])),
+            )
+            connection.commit()
+
+    def _db_delete(self, kind: str, key: str) -> None:
+        with self.db_lock:
+            connection = self._db()
+            connection.execute("DELETE FROM entity_cache WHERE kind = ? AND key = ?", (kind, key))
+            connection.commit()
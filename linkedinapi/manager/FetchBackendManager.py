@@ -0,0 +1,100 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from injector import inject
+
+from linkedinapi.backend.FetchBackend import FetchBackend
+from linkedinapi.backend.HttpFetchBackend import HttpFetchBackend
+from linkedinapi.backend.PlaywrightFetchBackend import PlaywrightFetchBackend
+from linkedinapi.manager.AccountSchedulerManager import AccountSchedulerManager
+from linkedinapi.manager.MetricsManager import MetricsManager
+from linkedinapi.model.FetchedPage import FetchedPage
+from linkedinapi.variable.FetchRoutesVariable import FetchRoutesVariable
+
+
+class FetchBackendManager:
+    """
+    Manager routing the page loads of client operations to a fetch backend before the browser flow.
+
+    An operation routed to a backend first fetches its page there and builds the model from the
+    HTML; when the page can't be fetched or the model misses required fields, the client falls
+    back to its own browser flow. Operations without a route always use the browser flow.
+    """
+
+    @inject
+    def __init__(self, http_backend: HttpFetchBackend, playwright_backend: PlaywrightFetchBackend,
+                 routes: FetchRoutesVariable, account_scheduler: AccountSchedulerManager,
+                 metrics: MetricsManager) -> None:
+        """
+        Initialize the backend router.
+
+        Args:
+            http_backend: Backend fetching server-rendered HTML over HTTP
+            playwright_backend: Backend loading pages in a pooled browser tab
+            routes: Backend name by operation name, e.g. {'company': 'http'}
+            account_scheduler: Scheduler pacing the fetches of each account like the browser operations
+            metrics: Metrics the fetches are timed in
+        """
+        self.backends: Dict[str, FetchBackend] = {
+            backend.name: backend for backend in (http_backend, playwright_backend)
+        }
+        self.routes = {operation: backend for operation, backend in routes.items() if backend in self.backends}
+        self.account_scheduler = account_scheduler
+        self.metrics = metrics
+        self.operations: Dict[str, Dict[str, int]] = {}
+
+    async def fetch(self, operation: str, username: str, url: str,
+                    build: Callable[[FetchedPage], Awaitable[Any]], is_complete: Callable[[Any], bool],
+                    ready_selector: Optional[str] = None) -> Optional[Any]:
+        """
+        Fetch the page of an operation on its routed backend and build its model.
+
+        Args:
+            operation: Name of the client operation
+            username: LinkedIn username whose session the page is fetched with
+            url: LinkedIn URL of the page
+            build: Coroutine function building the model from the fetched page
+            is_complete: Predicate telling whether the built model has every required field
+            ready_selector: Selector present once the page content is there
+
+        Returns:
+            The complete model, or None when the operation has no route or the browser flow is needed
+        """
+        backend_name = self.routes.get(operation)
+        if backend_name is None:
+            return None
+
+        stats = self.operations.setdefault(operation, {"hits": 0, "unavailable": 0, "incomplete": 0})
+        with self.metrics.phase(f"fetch_{backend_name}"):
+            async with self.account_scheduler.slot(username):
+                page = await self.backends[backend_name].fetch(username, url, ready_selector)
+        if page is None:
+            stats["unavailable"] += 1
+            return None
+
+        with self.metrics.phase('extract'):
+            model = await build(page)
+        if model is None or not is_complete(model):
+            stats["incomplete"] += 1
+            return None
+        stats["hits"] += 1
+        return model
+
+    async def close(self) -> None:
+        """
+        Close every backend.
+        """
+        for backend in self.backends.values():
+            await backend.close()
+
+    def get_stats(self) -> dict:
+        """
+        Get routing counters.
+
+        Returns:
+            Dictionary with the routes, hits and fallbacks by operation and the counters of each backend
+        """
+        return {
+            "routes": self.routes,
+            "operations": self.operations,
+            "backends": {name: backend.get_stats() for name, backend in self.backends.items()},
+        }
@@ -0,0 +1,364 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from injector import inject
+from playwright.async_api import BrowserContext, Page, Request
+
+from linkedinapi.model.FlightRecording import FlightRecording
+from linkedinapi.variable.FlightRecorderDirVariable import FlightRecorderDirVariable
+from linkedinapi.variable.FlightRecorderHarVariable import FlightRecorderHarVariable
+from linkedinapi.variable.FlightRecorderMaxSizeVariable import FlightRecorderMaxSizeVariable
+from linkedinapi.variable.FlightRecorderSampleRateVariable import FlightRecorderSampleRateVariable
+from linkedinapi.variable.FlightRecorderScreenshotsVariable import FlightRecorderScreenshotsVariable
+from linkedinapi.variable.FlightRecorderThresholdVariable import FlightRecorderThresholdVariable
+
+
+class FlightRecorderManager:
+    """
+    Manager recording Playwright traces of a sampled share of the client operations.
+
+    A sampled operation turns tracing on for the context of its tab and, optionally, keeps
+    the requests of the tab to write them as a HAR file. The artifacts are kept only when the
+    operation failed or took longer than the threshold, under <dir>/<id>/, and the oldest
+    recordings are deleted once the directory grows over the size limit.
+
+    Tracing covers the whole browser context, so a recording also shows what other requests
+    of the same account did in parallel; a context is only traced by one operation at a time.
+    Traces hold the session cookies of the account: treat them like the session files.
+    """
+
+    FILES = ('trace.zip', 'har.json')
+    ID_PATTERN = re.compile(r'^[0-9]{8}-[0-9]{6}-[a-z_]+-[0-9a-f]{8}$')
+    # Headers carrying the session, never written to the HAR files
+    REDACTED_HEADERS = {'cookie', 'set-cookie', 'csrf-token', 'authorization'}
+
+    @inject
+    def __init__(self, recorder_dir: FlightRecorderDirVariable, sample_rate: FlightRecorderSampleRateVariable,
+                 threshold: FlightRecorderThresholdVariable, har: FlightRecorderHarVariable,
+                 screenshots: FlightRecorderScreenshotsVariable, max_size: FlightRecorderMaxSizeVariable) -> None:
+        """
+        Initialize the flight recorder.
+
+        Args:
+            recorder_dir: Directory the recordings are kept in
+            sample_rate: Share of the operations traced, from 0 (off) to 1 (all)
+            threshold: Milliseconds above which a traced operation is kept
+            har: 1 to also keep the requests of the tab as a HAR file
+            screenshots: 1 to add screenshots to the traces, heavier on CPU and disk
+            max_size: Megabytes the recordings may take before the oldest are deleted
+        """
+        self.recorder_dir = str(recorder_dir)
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self.threshold_ms = int(threshold)
+        self.har = bool(int(har))
+        self.screenshots = bool(int(screenshots))
+        self.max_bytes = int(max_size) * 1024 * 1024
+        self.tracing: Set[BrowserContext] = set()
+        self.sampled = 0
+        self.kept = 0
+        self.discarded = 0
+        self.skipped = 0
+        self.rotated = 0
+        self.errors = 0
+
+    @asynccontextmanager
+    async def record(self, operation: str, key: str, username: str, page: Page,
+                     started: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Trace the block if the operation is sampled, keeping the trace if it turns out slow or failed.
+
+        Args:
+            operation: Name of the client operation
+            key: Entity key of the operation, e.g. job id or company slug
+            username: LinkedIn username whose session the tab is loaded with
+            page: Tab the operation runs in
+            started: time.perf_counter() at the start of the operation, defaults to now
+
+        Yields:
+            Nothing, the block is the recorded operation
+        """
+        started = started if started is not None else time.perf_counter()
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            yield
+            return
+
+        context = page.context
+        if context in self.tracing:
+            self.skipped += 1
+            yield
+            return
+
+        self.tracing.add(context)
+        requests: List[Request] = []
+
+        def on_request_done(request: Request) -> None:
+            requests.append(request)
+
+        try:
+            try:
+                await context.tracing.start(screenshots=self.screenshots, snapshots=True, title=f"{operation} {key}")
+            except Exception as e:
+                self.errors += 1
+                logging.warning("Could not start tracing %s %s: %s", operation, key, e)
+                yield
+                return
+
+            self.sampled += 1
+            if self.har:
+                page.on('requestfinished', on_request_done)
+                page.on('requestfailed', on_request_done)
+            started_at = time.time() - (time.perf_counter() - started)
+            error = None
+            try:
+                yield
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                if self.har:
+                    page.remove_listener('requestfinished', on_request_done)
+                    page.remove_listener('requestfailed', on_request_done)
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                if error is not None or elapsed_ms >= self.threshold_ms:
+                    await self._keep(context, page, requests, FlightRecording(
+                        id=self._new_id(operation),
+                        operation=operation,
+                        key=key,
+                        username=username,
+                        started_at=started_at,
+                        elapsed_ms=elapsed_ms,
+                        error=error,
+                    ))
+                else:
+                    await self._discard(context)
+        finally:
+            self.tracing.discard(context)
+
+    async def list_recordings(self, username: Optional[str] = None) -> List[FlightRecording]:
+        """
+        List the kept recordings, newest first.
+
+        Args:
+            username: Only list the recordings of this account, all of them if None
+
+        Returns:
+            Kept recordings
+        """
+        recordings = await asyncio.to_thread(self._read_all)
+        if username is not None:
+            recordings = [recording for recording in recordings if recording.username == username]
+        return recordings
+
+    async def get(self, recording_id: str) -> Optional[FlightRecording]:
+        """
+        Get a kept recording.
+
+        Args:
+            recording_id: Recording identifier
+
+        Returns:
+            The recording, or None if it doesn't exist or was rotated away
+        """
+        if not self.ID_PATTERN.match(recording_id):
+            return None
+        return await asyncio.to_thread(self._read, recording_id)
+
+    def get_file_path(self, recording: FlightRecording, file_name: str) -> Optional[str]:
+        """
+        Get the path of an artifact of a recording.
+
+        Args:
+            recording: Recording returned by get
+            file_name: Artifact name, one of FILES
+
+        Returns:
+            Path of the artifact, or None if the recording has no such artifact
+        """
+        if file_name not in self.FILES or file_name not in recording.files:
+            return None
+        return os.path.join(self.recorder_dir, recording.id, file_name)
+
+    def get_stats(self) -> dict:
+        """
+        Get recorder counters.
+
+        Returns:
+            Dictionary with the settings and the sampled, kept, discarded, skipped and rotated counts
+        """
+        return {
+            "sample_rate": self.sample_rate,
+            "threshold_ms": self.threshold_ms,
+            "har": self.har,
+            "screenshots": self.screenshots,
+            "tracing": len(self.tracing),
+            "sampled": self.sampled,
+            "kept": self.kept,
+            "discarded": self.discarded,
+            "skipped": self.skipped,
+            "rotated": self.rotated,
+            "errors": self.errors,
+        }
+
+    async def _keep(self, context: BrowserContext, page: Page, requests: List[Request],
+                    recording: FlightRecording) -> None:
+        recording_dir = os.path.join(self.recorder_dir, recording.id)
+        try:
+            await asyncio.to_thread(os.makedirs, recording_dir, exist_ok=True)
+            await context.tracing.stop(path=os.path.join(recording_dir, 'trace.zip'))
+            recording.files.append('trace.zip')
+            if self.har:
+                har = await self._build_har(requests)
+                await asyncio.to_thread(self._write_json, os.path.join(recording_dir, 'har.json'), har)
+                recording.files.append('har.json')
+            recording.url = None if page.is_closed() else page.url
+            await asyncio.to_thread(self._finish, recording)
+            self.kept += 1
+            logging.info("Kept flight recording %s (%s %s, %.0f ms)", recording.id, recording.operation,
+                         recording.key, recording.elapsed_ms)
+        except Exception as e:
+            self.errors += 1
+            logging.warning("Could not keep flight recording %s: %s", recording.id, e)
+            await asyncio.to_thread(shutil.rmtree, recording_dir, True)
+
+    async def _discard(self, context: BrowserContext) -> None:
+        try:
+            await context.tracing.stop()
+            self.discarded += 1
+        except Exception as e:
+            self.errors += 1
+            logging.warning("Could not stop tracing: %s", e)
+
+    async def _build_har(self, requests: List[Request]) -> Dict[str, Any]:
+        entries = []
+        for request in requests:
+            try:
+                response = await request.response()
+            except Exception:
+                response = None
+            timing = request.timing
+            started = datetime.fromtimestamp(timing['startTime'] / 1000, timezone.utc) \
+                if timing.get('startTime', -1) > 0 else datetime.now(timezone.utc)
+            entry = {
+                "startedDateTime": started.isoformat(),
+                "time": max(0, timing.get('responseEnd', -1)),
+                "request": {
+                    "method": request.method,
+                    "url": request.url,
+                    "httpVersion": "HTTP/1.1",
+                    "headers": self._har_headers(request.headers),
+                    "queryString": [],
+                    "cookies": [],
+                    "headersSize": -1,
+                    "bodySize": len(request.post_data_buffer or b''),
+                },
+                "response": {
+                    "status": response.status if response is not None else 0,
+                    "statusText": response.status_text if response is not None else "",
+                    "httpVersion": "HTTP/1.1",
+                    "headers": self._har_headers(response.headers) if response is not None else [],
+                    "cookies": [],
+                    "content": {
+                        "size": -1,
+                        "mimeType": response.headers.get('content-type', '') if response is not None else '',
+                    },
+                    "redirectURL": "",
+                    "headersSize": -1,
+                    "bodySize": -1,
+                },
+                "cache": {},
+                "timings": self._har_timings(timing),
+                "_resourceType": request.resource_type,
+            }
+            if request.failure:
+                entry["_failure"] = request.failure
+            entries.append(entry)
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "linkedin-api flight recorder", "version": "1.0"},
+                "pages": [],
+                "entries": entries,
+            },
+        }
+
+    @classmethod
+    def _har_headers(cls, headers: Dict[str, str]) -> List[Dict[str, str]]:
+        return [
+            {"name": name, "value": "[redacted]" if name.lower() in cls.REDACTED_HEADERS else value}
+            for name, value in headers.items()
+        ]
+
+    @staticmethod
+    def _har_timings(timing: Dict[str, float]) -> Dict[str, float]:
+        def span(start: str, end: str) -> float:
+            if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+                return -1
+            return round(timing[end] - timing[start], 3)
+
+        return {
+            "blocked": -1,
+            "dns": span('domainLookupStart', 'domainLookupEnd'),
+            "connect": span('connectStart', 'connectEnd'),
+            "ssl": span('secureConnectionStart', 'connectEnd'),
+            "send": 0,
+            "wait": span('requestStart', 'responseStart'),
+            "receive": span('responseStart', 'responseEnd'),
+        }
+
+    @staticmethod
+    def _new_id(operation: str) -> str:
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{operation}-{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _write_json(path: str, data: Any) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def _finish(self, recording: FlightRecording) -> None:
+        recording_dir = os.path.join(self.recorder_dir, recording.id)
+        recording.size_bytes = sum(
+            os.path.getsize(os.path.join(recording_dir, file_name)) for file_name in recording.files
+        )
+        # recording.json is written last, so a listed recording always has its artifacts
+        with open(os.path.join(recording_dir, 'recording.json'), 'w', encoding='utf-8') as f:
+            f.write(recording.model_dump_json())
+        self._rotate()
+
+    def _rotate(self) -> None:
+        recordings = self._read_all()
+        total = sum(recording.size_bytes for recording in recordings)
+        # Oldest first, the newest recording is always kept even when it alone exceeds the limit
+        for recording in reversed(recordings[1:]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(os.path.join(self.recorder_dir, recording.id), ignore_errors=True)
+            total -= recording.size_bytes
+            self.rotated += 1
+
+    def _read_all(self) -> List[FlightRecording]:
+        if not os.path.isdir(self.recorder_dir):
+            return []
+        recordings = []
+        for recording_id in os.listdir(self.recorder_dir):
+            recording = self._read(recording_id)
+            if recording is not None:
+                recordings.append(recording)
+        recordings.sort(key=lambda recording: recording.started_at, reverse=True)
+        return recordings
+
+    def _read(self, recording_id: str) -> Optional[FlightRecording]:
+        try:
+            with open(os.path.join(self.recorder_dir, recording_id, 'recording.json'), encoding='utf-8') as f:
+                return FlightRecording.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
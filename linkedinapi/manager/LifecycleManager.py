@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from injector import inject
+
+from linkedinapi.manager.BrowserManager import BrowserManager
+from linkedinapi.manager.ContextPoolManager import ContextPoolManager
+from linkedinapi.manager.FetchBackendManager import FetchBackendManager
+from linkedinapi.manager.PagePool import PagePool
+from linkedinapi.manager.SessionStoreManager import SessionStoreManager
+from linkedinapi.manager.SnapshotParserManager import SnapshotParserManager
+from linkedinapi.variable.WarmupEnabledVariable import WarmupEnabledVariable
+from linkedinapi.variable.WarmupRoutesVariable import WarmupRoutesVariable
+
+
+class LifecycleManager:
+    """
+    Manager warming the shared browser resources up at startup and releasing them at shutdown.
+
+    The warm-up runs in the background so the server answers /health right away: it launches
+    Chromium, opens a pooled context for every logged-in session (up to the context pool size)
+    and optionally parks tabs on hot routes. /ready reports it. Shutdown persists the storage
+    state of every pooled context and closes the browser and the parser workers.
+    """
+
+    @inject
+    def __init__(self, browser_manager: BrowserManager, context_pool: ContextPoolManager,
+                 session_store: SessionStoreManager, snapshot_parser: SnapshotParserManager,
+                 fetch_backends: FetchBackendManager, enabled: WarmupEnabledVariable,
+                 routes: WarmupRoutesVariable) -> None:
+        """
+        Initialize the lifecycle manager.
+
+        Args:
+            browser_manager: Manager owning the shared Chromium instance
+            context_pool: Pool the warmed-up contexts are kept in
+            session_store: Store listing the sessions to load
+            snapshot_parser: Worker pool stopped at shutdown
+            fetch_backends: Fetch backends whose connections are closed at shutdown
+            enabled: 1 to warm up at startup, 0 to be ready immediately and launch lazily
+            routes: PagePool routes to park tabs on in every warmed-up context
+        """
+        self.browser_manager = browser_manager
+        self.context_pool = context_pool
+        self.session_store = session_store
+        self.snapshot_parser = snapshot_parser
+        self.fetch_backends = fetch_backends
+        self.enabled = bool(int(enabled))
+        self.routes = [route for route in routes if route in PagePool.ROUTES]
+        self.task: Optional[asyncio.Task] = None
+        self.state = 'stopped'
+        self.sessions: List[str] = []
+        self.errors: Dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.duration_ms: Optional[float] = None
+
+    async def start(self) -> None:
+        """
+        Start the warm-up in the background.
+        """
+        if not self.enabled:
+            self.state = 'ready'
+            return
+        self.state = 'warming_up'
+        self.sessions = []
+        self.errors = {}
+        self.started_at = time.monotonic()
+        self.duration_ms = None
+        self.task = asyncio.get_running_loop().create_task(self._warm_up())
+
+    async def stop(self) -> None:
+        """
+        Stop an unfinished warm-up, persist the pooled sessions and close the browser and HTTP connections.
+        """
+        self.state = 'stopping'
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        try:
+            await self.context_pool.close_all()
+        except Exception as e:
+            logging.warning("Could not close the context pool cleanly: %s", e)
+        await self.fetch_backends.close()
+        await self.browser_manager.close()
+        self.snapshot_parser.shutdown()
+        self.state = 'stopped'
+
+    def is_ready(self) -> bool:
+        """
+        Check whether the warm-up is over and the browser can serve requests.
+
+        Returns:
+            True once the warm-up finished, or right away when it is disabled. After a failed
+            warm-up, True as soon as a request managed to launch the browser
+        """
+        return self.state == 'ready' or (self.state == 'failed' and self.browser_manager.is_running())
+
+    def get_stats(self) -> dict:
+        """
+        Get warm-up progress.
+
+        Returns:
+            Dictionary with the state, warmed-up sessions, per-session errors and duration
+        """
+        return {
+            "enabled": self.enabled,
+            "state": self.state,
+            "routes": self.routes,
+            "sessions": self.sessions,
+            "errors": self.errors,
+            "duration_ms": self.duration_ms,
+        }
+
+    async def _warm_up(self) -> None:
+        try:
+            await self.browser_manager.get_browser()
+        except Exception as e:
+            logging.exception("Warm-up could not launch the browser")
+            self.errors['browser'] = str(e)
+            self.state = 'failed'
+            return
+
+        usernames = []
+        for username in await self.session_store.list_usernames():
+            if await self.session_store.is_logged_in(username):
+                usernames.append(username)
+        # Warming more sessions than the pool holds would only evict the first ones again
+        usernames = usernames[:self.context_pool.max_size]
+
+        await asyncio.gather(*(self._warm_session(username) for username in usernames))
+
+        self.duration_ms = round((time.monotonic() - self.started_at) * 1000, 1)
+        self.state = 'ready'
+        logging.info("Warm-up done in %.0f ms with %d sessions", self.duration_ms, len(self.sessions))
+
+    async def _warm_session(self, username: str) -> None:
+        try:
+            if self.routes:
+                for route in self.routes:
+                    await self.context_pool.warm(username, route)
+            else:
+                async with self.context_pool.acquire(username):
+                    pass
+            self.sessions.append(username)
+        except Exception as e:
+            # A broken session shouldn't keep the others from warming up
+            logging.warning("Warm-up of %s failed: %s", username, e)
+            self.errors[username] = str(e)
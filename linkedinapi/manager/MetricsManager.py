@@ -0,0 +1,187 @@
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+
+# Operation of the LinkedinClient the current task is running, phases are labelled with it
+_operation: ContextVar[str] = ContextVar('metrics_operation', default='background')
+# Phase timings of the API request being served, shared with the tasks the request spawns
+_request_timings: ContextVar[Optional[Dict[str, list]]] = ContextVar('metrics_request_timings', default=None)
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+
+class MetricsManager:
+    """
+    Manager exposing Prometheus metrics of the scraping operations.
+
+    Every LinkedinClient operation is timed as a whole and split into phases (browser launch,
+    context and tab acquisition, navigation, waits, extraction of each field, pagination).
+    Phase timings of the current API request are also collected to be returned in its
+    Server-Timing header. Gauges of the live browser resources are set when /metrics is scraped.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the metrics on a registry of their own.
+        """
+        self.registry = CollectorRegistry()
+        self.operation_seconds = Histogram(
+            'linkedin_operation_seconds', "Duration of LinkedinClient operations",
+            ['operation', 'outcome'], buckets=BUCKETS, registry=self.registry,
+        )
+        self.phase_seconds = Histogram(
+            'linkedin_phase_seconds', "Duration of the phases of LinkedinClient operations",
+            ['operation', 'phase'], buckets=BUCKETS, registry=self.registry,
+        )
+        self.selector_misses = Counter(
+            'linkedin_selector_misses', "Fields the scrapers could not find on the page",
+            ['operation', 'field'], registry=self.registry,
+        )
+        self.browsers = Gauge(
+            'linkedin_browsers', "Connected Chromium instances", registry=self.registry,
+        )
+        self.contexts = Gauge(
+            'linkedin_contexts', "Pooled browser contexts", ['state'], registry=self.registry,
+        )
+        self.tabs = Gauge(
+            'linkedin_tabs', "Pooled browser tabs", ['state'], registry=self.registry,
+        )
+        self.queue_depth = Gauge(
+            'linkedin_queue_depth', "Operations waiting for their turn", ['queue'], registry=self.registry,
+        )
+
+    @asynccontextmanager
+    async def operation(self, name: str) -> AsyncIterator[None]:
+        """
+        Time a LinkedinClient operation and label the phases run inside the block with it.
+
+        Args:
+            name: Name of the operation
+
+        Yields:
+            Nothing, the block is the operation
+        """
+        token = _operation.set(name)
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            yield
+            outcome = 'success'
+        finally:
+            elapsed = time.perf_counter() - started
+            _operation.reset(token)
+            self.operation_seconds.labels(name, outcome).observe(elapsed)
+            self._add_timing(name, elapsed)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase of the current operation.
+
+        Args:
+            name: Name of the phase
+
+        Yields:
+            Nothing, the block is the phase
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - started)
+
+    def record_phase(self, name: str, seconds: float, operation: Optional[str] = None) -> None:
+        """
+        Record a phase timed elsewhere.
+
+        Args:
+            name: Name of the phase
+            seconds: Duration of the phase
+            operation: Operation the phase belongs to, defaults to the current one
+        """
+        operation = operation or _operation.get()
+        self.phase_seconds.labels(operation, name).observe(seconds)
+        self._add_timing(f"{operation}.{name}", seconds)
+
+    def record_misses(self, operation: str, fields: Dict[str, Any], prefix: str = '') -> None:
+        """
+        Count the missing fields of an extracted model.
+
+        Args:
+            operation: Operation the model was extracted by
+            fields: Dumped model, nested models are counted with their parent field as prefix
+            prefix: Prefix of the field names
+        """
+        for field, value in fields.items():
+            if isinstance(value, dict):
+                self.record_misses(operation, value, f"{prefix}{field}.")
+            elif value is None or value == '' or value == []:
+                self.selector_misses.labels(operation, prefix + field).inc()
+
+    def start_request(self) -> Token:
+        """
+        Start collecting the phase timings of an API request.
+
+        Returns:
+            Token to pass to end_request
+        """
+        return _request_timings.set({})
+
+    def end_request(self, token: Token) -> Optional[str]:
+        """
+        Stop collecting the phase timings of an API request.
+
+        Args:
+            token: Token returned by start_request
+
+        Returns:
+            Value of the Server-Timing header, None if the request ran no operation
+        """
+        timings = _request_timings.get()
+        _request_timings.reset(token)
+        if not timings:
+            return None
+        return ", ".join(
+            f'{name};dur={seconds * 1000:.1f};desc="{count}x"' if count > 1 else f"{name};dur={seconds * 1000:.1f}"
+            for name, (seconds, count) in timings.items()
+        )
+
+    def set_gauges(self, browsers: int, contexts: Dict[str, int], tabs: Dict[str, int],
+                   queues: Dict[str, int]) -> None:
+        """
+        Set the gauges of the live browser resources.
+
+        Args:
+            browsers: Connected browsers
+            contexts: Pooled contexts by state
+            tabs: Pooled tabs by state
+            queues: Waiting operations by queue
+        """
+        self.browsers.set(browsers)
+        for state, count in contexts.items():
+            self.contexts.labels(state).set(count)
+        for state, count in tabs.items():
+            self.tabs.labels(state).set(count)
+        for queue, count in queues.items():
+            self.queue_depth.labels(queue).set(count)
+
+    def render(self) -> bytes:
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            Encoded metrics
+        """
+        return generate_latest(self.registry)
+
+    @staticmethod
+    def _add_timing(name: str, seconds: float) -> None:
+        timings = _request_timings.get()
+        if timings is None:
+            return
+        timing = timings.setdefault(name, [0.0, 0])
+        timing[0] += seconds
+        timing[1] += 1
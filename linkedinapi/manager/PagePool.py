@@ -0,0 +1,227 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+from playwright.async_api import BrowserContext, Page
+
+
+class PagePool:
+    """
+    Pool of warm tabs belonging to a single browser context.
+
+    Tabs are parked on a known route (e.g. the jobs search) so that LinkedIn's SPA is
+    already booted when a request checks one out. Tabs that come back navigated away
+    are parked again in the background, broken or worn out tabs are recycled.
+    """
+
+    ROUTES: Dict[str, Optional[str]] = {
+        'jobs_search': "https://www.linkedin.com/jobs/search/",
+        'job_view': "https://www.linkedin.com/jobs/",
+        'blank': None,
+    }
+
+    # Routes whose sub-pages still count as parked (a job view tab can soft-navigate to any job)
+    PREFIX_ROUTES = {'job_view'}
+
+    # Query parameters that mean a search tab carries state from a previous request
+    SEARCH_STATE_PARAMS = {'keywords', 'location', 'geoId', 'start'}
+
+    max_uses: int = 50
+
+    def __init__(self, context: BrowserContext, size: int) -> None:
+        """
+        Initialize the page pool.
+
+        Args:
+            context: Browser context the tabs are opened in
+            size: Maximum number of idle tabs kept per route
+        """
+        self.context = context
+        self.size = size
+        self.idle: Dict[str, List[Page]] = {route: [] for route in self.ROUTES}
+        self.uses: Dict[Page, int] = {}
+        self.parking: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self.in_use = 0
+
+    @asynccontextmanager
+    async def acquire(self, route: str) -> AsyncIterator[Page]:
+        """
+        Check out a tab parked on the given route for the duration of the block.
+
+        Args:
+            route: Name of the route, one of PagePool.ROUTES
+
+        Yields:
+            Page parked on the route, or a blank one when no parked tab was idle
+        """
+        page = await self.checkout(route)
+        self.in_use += 1
+        try:
+            yield page
+        finally:
+            self.in_use -= 1
+            self.checkin(route, page)
+
+    async def checkout(self, route: str) -> Page:
+        """
+        Take a ready tab for the given route, opening a blank one if none is idle.
+
+        A new tab isn't navigated to the route, the caller's own navigation replaces it anyway;
+        it is parked on the route when checked in.
+
+        Args:
+            route: Name of the route, one of PagePool.ROUTES
+
+        Returns:
+            Page parked on the route, or a blank page on a miss
+        """
+        idle = self.idle[route]
+        while idle:
+            page = idle.pop()
+            if not page.is_closed():
+                self.hits += 1
+                self.uses[page] = self.uses.get(page, 0) + 1
+                return page
+            await self._discard(page)
+
+        self.misses += 1
+        page = await self.context.new_page()
+        self.uses[page] = 1
+        return page
+
+    def checkin(self, route: str, page: Page) -> None:
+        """
+        Return a tab to the pool, re-parking it when it was navigated away.
+
+        Args:
+            route: Name of the route the tab was checked out for
+            page: Page to return
+        """
+        if page.is_closed():
+            self.uses.pop(page, None)
+            return
+        if len(self.idle[route]) >= self.size or self.uses.get(page, 0) >= self.max_uses:
+            self._schedule(self._discard(page))
+            return
+        if self._is_parked(route, page):
+            self.idle[route].append(page)
+            return
+        self._schedule(self._park(route, page))
+
+    async def warm(self, route: str, count: Optional[int] = None) -> None:
+        """
+        Open tabs parked on a route until the pool holds the requested amount.
+
+        Args:
+            route: Name of the route, one of PagePool.ROUTES
+            count: Number of idle tabs to reach, defaults to the pool size
+        """
+        count = min(self.size, count if count is not None else self.size)
+        while len(self.idle[route]) < count:
+            page = await self.context.new_page()
+            self.uses[page] = 0
+            await self._park(route, page)
+
+    async def close(self) -> None:
+        """
+        Close every idle tab and cancel pending parking tasks.
+        """
+        for task in list(self.parking):
+            task.cancel()
+        for route in self.idle:
+            for page in self.idle[route]:
+                await self._discard(page)
+            self.idle[route] = []
+
+    def get_stats(self) -> dict:
+        """
+        Get tab counters of the pool.
+
+        Returns:
+            Dictionary with idle and checked out tab counts and hit counters
+        """
+        return {
+            "idle": {route: len(pages) for route, pages in self.idle.items()},
+            "in_use": self.in_use,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recycled": self.recycled,
+        }
+
+    @staticmethod
+    async def soft_goto(page: Page, url: str, ready_selector: str, timeout: int = 3000) -> None:
+        """
+        Navigate inside the already booted SPA, falling back to a full page load.
+
+        The URL is pushed through the History API so LinkedIn's router renders the
+        route client-side. Elements matching the ready selector before the navigation are
+        marked stale, so only freshly rendered content counts. If it does not show up in
+        time, a regular goto is performed instead.
+
+        Args:
+            page: Page to navigate
+            url: Target URL on the same origin
+            ready_selector: Selector that proves the target route has rendered
+            timeout: Milliseconds to wait for the soft navigation
+        """
+        if page.url.startswith("https://www.linkedin.com/"):
+            try:
+                await page.evaluate(
+                    """([url, selector]) => {
+                        document.querySelectorAll(selector).forEach(e => e.setAttribute('data-pool-stale', ''));
+                        history.pushState({}, '', url);
+                        dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+                    }""",
+                    [url, ready_selector],
+                )
+                await page.wait_for_selector(ready_selector + ':not([data-pool-stale])', timeout=timeout)
+                return
+            except Exception:
+                pass
+        await page.goto(url)
+
+    def _is_parked(self, route: str, page: Page) -> bool:
+        if page.is_closed():
+            return False
+        url = self.ROUTES[route]
+        if url is None:
+            return True
+        if not page.url.startswith(url):
+            return False
+        if route in self.PREFIX_ROUTES:
+            return True
+        parsed = urlparse(page.url)
+        if parsed.path.rstrip('/') != urlparse(url).path.rstrip('/'):
+            return False
+        query = parse_qs(parsed.query)
+        return not any(key in self.SEARCH_STATE_PARAMS or key.startswith('f_') for key in query)
+
+    async def _park(self, route: str, page: Page) -> None:
+        try:
+            await page.goto(self.ROUTES[route] or "about:blank")
+        except Exception as e:
+            logging.info("Could not park tab on %s, recycling it: %s", route, e)
+            await self._discard(page)
+            return
+        if len(self.idle[route]) < self.size:
+            self.idle[route].append(page)
+        else:
+            await self._discard(page)
+
+    async def _discard(self, page: Page) -> None:
+        self.recycled += 1
+        self.uses.pop(page, None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    def _schedule(self, coroutine) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self.parking.add(task)
+        task.add_done_callback(self.parking.discard)
@@ -0,0 +1,229 @@
+import logging
+import re
+from typing import Dict, List, Optional, Pattern
+from weakref import WeakKeyDictionary
+
+from injector import inject
+from playwright.async_api import BrowserContext, Page, Request, Route
+
+from linkedinapi.model.RequestFilterProfile import RequestFilterProfile
+from linkedinapi.variable.LinkedinBaseUrlVariable import LinkedinBaseUrlVariable
+from linkedinapi.variable.LoginRequestFilterProfileVariable import LoginRequestFilterProfileVariable
+from linkedinapi.variable.RequestFilterProfileVariable import RequestFilterProfileVariable
+
+TRACKER_URL_PATTERNS = [
+    r"px\.ads\.linkedin\.com",
+    r"linkedin\.com/li/track",
+    r"linkedin\.com/(sensorCollect|csp/dtag|tscp-serving)",
+    r"snap\.licdn\.com/li\.lms-analytics",
+    r"doubleclick\.net",
+    r"googlesyndication\.com",
+    r"googletagmanager\.com",
+    r"google-analytics\.com",
+    r"adservice\.google\.",
+    r"bat\.bing\.com",
+    r"connect\.facebook\.net",
+]
+
+
+class RequestFilterManager:
+    """
+    Manager blocking requests the scrapers don't need (images, media, fonts, trackers, ads).
+
+    A single route handler is installed on every context; the profile applied to a request
+    is the one of the page it belongs to, the configured default for scraping tabs and the
+    login profile for the login tab. Pages opened by another page (e.g. the external apply
+    tab) use the opener profile's popup_profile.
+
+    When a base URL is configured, allowed requests to LinkedIn are served by that host
+    instead (e.g. the benchmark stand-in), while pages keep their linkedin.com URLs.
+    """
+
+    LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+    PROFILES: Dict[str, RequestFilterProfile] = {
+        'strict': RequestFilterProfile(
+            name='strict',
+            blocked_resource_types=['image', 'media', 'font', 'beacon', 'ping', 'eventsource'],
+            blocked_url_patterns=TRACKER_URL_PATTERNS,
+            popup_profile='relaxed',
+        ),
+        'relaxed': RequestFilterProfile(
+            name='relaxed',
+            blocked_resource_types=['media', 'font', 'beacon', 'ping'],
+            blocked_url_patterns=TRACKER_URL_PATTERNS,
+            popup_profile='relaxed',
+        ),
+        'off': RequestFilterProfile(name='off'),
+    }
+
+    # Rough average transfer size of blocked resources, used to estimate saved bandwidth
+    ESTIMATED_BYTES: Dict[str, int] = {
+        'image': 25000,
+        'media': 400000,
+        'font': 40000,
+        'script': 30000,
+        'stylesheet': 20000,
+        'xhr': 2000,
+        'fetch': 2000,
+    }
+    DEFAULT_ESTIMATED_BYTES = 1000
+
+    @inject
+    def __init__(self, default_profile: RequestFilterProfileVariable, login_profile: LoginRequestFilterProfileVariable,
+                 base_url: LinkedinBaseUrlVariable) -> None:
+        """
+        Initialize the request filter.
+
+        Args:
+            default_profile: Name of the profile used by the scraping tabs and other pages without an explicit one
+            login_profile: Name of the profile used by the login tab
+            base_url: Origin serving LinkedIn requests in place of www.linkedin.com, empty for the real site
+        """
+        self.profiles: Dict[str, RequestFilterProfile] = dict(self.PROFILES)
+        if default_profile not in self.profiles:
+            logging.warning("Unknown request filter profile %s, falling back to strict", default_profile)
+            default_profile = 'strict'
+        if login_profile not in self.profiles:
+            logging.warning("Unknown login request filter profile %s, falling back to relaxed", login_profile)
+            login_profile = 'relaxed'
+        self.default_profile = str(default_profile)
+        self.login_profile = str(login_profile)
+        self.compiled: Dict[str, List[List[Pattern]]] = {}
+        self.page_profiles: "WeakKeyDictionary[Page, str]" = WeakKeyDictionary()
+        self.allowed_count = 0
+        self.blocked_count = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.estimated_saved_bytes = 0
+        self.base_url = str(base_url).rstrip('/')
+        self.rewritten_count = 0
+
+    def register_profile(self, profile: RequestFilterProfile) -> None:
+        """
+        Add or replace a named profile.
+
+        Args:
+            profile: Profile to register
+        """
+        self.profiles[profile.name] = profile
+        self.compiled.pop(profile.name, None)
+
+    async def install(self, context: BrowserContext, profile: Optional[str] = None) -> None:
+        """
+        Install the filtering route handler on a browser context.
+
+        Nothing is installed when the profile of its pages is 'off' and no base URL is set,
+        since Playwright disables the HTTP cache for routed contexts.
+
+        Args:
+            context: Browser context to filter
+            profile: Name of the profile its pages will use, the default profile if None
+        """
+        if (profile or self.default_profile) == 'off' and not self.base_url:
+            return
+        await context.route("**/*", self._handle)
+
+    def set_profile(self, page: Page, profile: str) -> None:
+        """
+        Select the filtering profile of a page.
+
+        Args:
+            page: Page whose requests are filtered
+            profile: Name of a registered profile
+        """
+        if profile not in self.profiles:
+            raise ValueError(f"Unknown request filter profile: {profile}")
+        self.page_profiles[page] = profile
+
+    def get_stats(self) -> dict:
+        """
+        Get blocked and allowed request counters.
+
+        Returns:
+            Dictionary with request filter counters
+        """
+        return {
+            "default_profile": self.default_profile,
+            "login_profile": self.login_profile,
+            "allowed": self.allowed_count,
+            "blocked": self.blocked_count,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "estimated_saved_bytes": self.estimated_saved_bytes,
+            "base_url": self.base_url or None,
+            "rewritten": self.rewritten_count,
+        }
+
+    def is_blocked(self, profile_name: str, resource_type: str, url: str) -> bool:
+        """
+        Decide whether a request is blocked under a profile.
+
+        Args:
+            profile_name: Name of a registered profile
+            resource_type: Playwright resource type of the request
+            url: Request URL
+
+        Returns:
+            True if the request must be aborted, False otherwise
+        """
+        profile = self.profiles[profile_name]
+        allowed_patterns, blocked_patterns = self._get_patterns(profile)
+        if resource_type in profile.allowed_resource_types:
+            return False
+        if any(pattern.search(url) for pattern in allowed_patterns):
+            return False
+        if resource_type in profile.blocked_resource_types:
+            return True
+        return any(pattern.search(url) for pattern in blocked_patterns)
+
+    async def _handle(self, route: Route, request: Request) -> None:
+        profile_name = await self._get_request_profile(request)
+        if not self.is_blocked(profile_name, request.resource_type, request.url):
+            self.allowed_count += 1
+            if self.base_url and request.url.startswith(self.LINKEDIN_ORIGIN + "/"):
+                await self._fulfill_from_base_url(route, request)
+                return
+            await route.fallback()
+            return
+
+        self.blocked_count += 1
+        self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+        self.estimated_saved_bytes += self.ESTIMATED_BYTES.get(request.resource_type, self.DEFAULT_ESTIMATED_BYTES)
+        await route.abort('blockedbyclient')
+
+    async def _fulfill_from_base_url(self, route: Route, request: Request) -> None:
+        self.rewritten_count += 1
+        try:
+            response = await route.fetch(url=self.base_url + request.url[len(self.LINKEDIN_ORIGIN):], max_redirects=0)
+        except Exception as e:
+            logging.warning("Could not fetch %s from %s: %s", request.url, self.base_url, e)
+            await route.abort('connectionrefused')
+            return
+        await route.fulfill(response=response)
+
+    async def _get_request_profile(self, request: Request) -> str:
+        try:
+            page = request.frame.page
+        except Exception:
+            # Service worker requests have no frame
+            return self.default_profile
+
+        profile_name = self.page_profiles.get(page)
+        if profile_name is not None:
+            return profile_name
+
+        opener = await page.opener()
+        if opener is not None:
+            opener_profile = self.profiles[self.page_profiles.get(opener, self.default_profile)]
+            profile_name = opener_profile.popup_profile or opener_profile.name
+        else:
+            profile_name = self.default_profile
+        self.page_profiles[page] = profile_name
+        return profile_name
+
+    def _get_patterns(self, profile: RequestFilterProfile) -> List[List[Pattern]]:
+        if profile.name not in self.compiled:
+            self.compiled[profile.name] = [
+                [re.compile(p) for p in profile.allowed_url_patterns],
+                [re.compile(p) for p in profile.blocked_url_patterns],
+            ]
+        return self.compiled[profile.name]
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from injector import inject
+
+from linkedinapi.helper.JobSearchUrlHelper import JobSearchUrlHelper
+from linkedinapi.model.JobPostingListingItem import JobPostingListingItem
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+from linkedinapi.variable.SearchPageCacheTtlVariable import SearchPageCacheTtlVariable
+
+
+class SearchPageCacheManager:
+    """
+    Manager keeping extracted search result pages for a short time.
+
+    Pages are keyed by user and search URL, so consecutive cursor calls and overlapping
+    searches don't scrape the same page twice. Entries expire after the TTL, the least
+    recently used ones are dropped past max_size.
+    """
+
+    max_size: int = 256
+
+    @inject
+    def __init__(self, ttl: SearchPageCacheTtlVariable) -> None:
+        """
+        Initialize the search page cache.
+
+        Args:
+            ttl: Seconds a page stays cached, 0 disables the cache
+        """
+        self.ttl = int(ttl)
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[float, List[JobPostingListingItem], Optional[JobSearchQuery]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, username: str, search_query: JobSearchQuery
+            ) -> Optional[Tuple[List[JobPostingListingItem], Optional[JobSearchQuery]]]:
+        """
+        Get a cached result page.
+
+        Args:
+            username: LinkedIn username the page was scraped with
+            search_query: Query positioned at the page offset
+
+        Returns:
+            Tuple of the page items and the query of the next page, or None on a miss
+        """
+        key = (username, JobSearchUrlHelper.build_url(search_query))
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        _, items, next_query = entry
+        return [item.model_copy() for item in items], next_query
+
+    def put(self, username: str, search_query: JobSearchQuery, items: List[JobPostingListingItem],
+            next_query: Optional[JobSearchQuery]) -> None:
+        """
+        Cache a result page.
+
+        Args:
+            username: LinkedIn username the page was scraped with
+            search_query: Query positioned at the page offset
+            items: Items extracted from the page
+            next_query: Query of the next page, None if this is the last one
+        """
+        if self.ttl <= 0:
+            return
+
+        key = (username, JobSearchUrlHelper.build_url(search_query))
+        self.entries[key] = (time.monotonic() + self.ttl, [item.model_copy() for item in items], next_query)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with size, ttl, hits and misses
+        """
+        return {
+            "size": len(self.entries),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
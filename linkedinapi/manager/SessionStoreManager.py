@@ -0,0 +1,269 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from injector import inject
+from playwright.async_api import BrowserContext
+
+from linkedinapi.helper.SessionHelper import SessionHelper
+from linkedinapi.variable.SessionDirVariable import SessionDirVariable
+
+
+class _SessionEntry:
+    """
+    Parsed storage state of a user with the file version it was read from.
+    """
+
+    def __init__(self, state: dict, mtime: Optional[float]) -> None:
+        self.state = state
+        self.mtime = mtime
+        self.expires_at = SessionHelper.get_cookie_expiry(state)
+        self.checked_at = time.monotonic()
+
+
+class SessionStoreManager:
+    """
+    Manager keeping the storage state of every user in memory.
+
+    Session files are parsed once and reloaded only when their mtime changes, which is
+    checked at most every STAT_INTERVAL seconds. Writes go to a temporary file renamed
+    over the session file, under a per-user lock, so concurrent logins and context
+    persists never leave a half-written file. File I/O runs off the event loop.
+
+    A salted hash of the password of the last successful login is kept next to each session,
+    so a login can reuse a live session only when it brings the same password.
+    """
+
+    # Seconds a loaded entry is trusted before its file is stat'ed again
+    STAT_INTERVAL = 1.0
+    # PBKDF2-SHA256 rounds of the stored password hashes
+    PASSWORD_ITERATIONS = 200000
+
+    @inject
+    def __init__(self, session_dir: SessionDirVariable) -> None:
+        """
+        Initialize the session store.
+
+        Args:
+            session_dir: Directory path where browser session data is stored
+        """
+        self.session_dir = session_dir
+        self.entries: Dict[str, _SessionEntry] = {}
+        self.credentials: Dict[str, Optional[dict]] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.loads = 0
+        self.writes = 0
+
+    def _get_lock(self, username: str) -> asyncio.Lock:
+        # Created lazily so they bind to the running event loop
+        lock = self.locks.get(username)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.locks[username] = lock
+        return lock
+
+    async def get_state(self, username: str) -> dict:
+        """
+        Get the storage state of a user.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Storage state as accepted by Browser.new_context, empty when the user has no session file
+        """
+        return (await self._get_entry(username)).state
+
+    async def is_logged_in(self, username: str) -> bool:
+        """
+        Check whether the session of a user still holds a cookie that hasn't expired.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            True if the user is already logged in, False otherwise
+        """
+        return (await self._get_entry(username)).expires_at > time.time()
+
+    async def get_mtime(self, username: str) -> Optional[float]:
+        """
+        Get the modification time of the session file of a user.
+
+        Args:
+            username: LinkedIn username
+
+        Returns:
+            Modification time, None when the user has no session file
+        """
+        return (await self._get_entry(username)).mtime
+
+    async def list_usernames(self) -> List[str]:
+        """
+        List the usernames that have a session file.
+
+        Returns:
+            Usernames in file name order
+        """
+        return await asyncio.to_thread(SessionHelper.list_usernames, self.session_dir)
+
+    async def save(self, username: str, state: dict) -> None:
+        """
+        Replace the storage state of a user and write it to the session file atomically.
+
+        Args:
+            username: LinkedIn username
+            state: Storage state as returned by BrowserContext.storage_state
+        """
+        async with self._get_lock(username):
+            session_file = SessionHelper.get_session_file(self.session_dir, username)
+            mtime = await asyncio.to_thread(self._write, session_file, state)
+            self.entries[username] = _SessionEntry(state, mtime)
+            self.writes += 1
+
+    async def save_context(self, username: str, context: BrowserContext) -> None:
+        """
+        Save the current storage state of a browser context.
+
+        Args:
+            username: LinkedIn username the context belongs to
+            context: Browser context to read the state from
+        """
+        await self.save(username, await context.storage_state())
+
+    async def save_password(self, username: str, password: str) -> None:
+        """
+        Remember the password of a successful login as a salted hash.
+
+        Args:
+            username: LinkedIn username
+            password: Password LinkedIn accepted
+        """
+        salt = secrets.token_bytes(16)
+        password_hash = await asyncio.to_thread(self._hash_password, password, salt, self.PASSWORD_ITERATIONS)
+        credential = {"salt": salt.hex(), "iterations": self.PASSWORD_ITERATIONS, "hash": password_hash.hex()}
+        async with self._get_lock(username):
+            credential_file = SessionHelper.get_credential_file(self.session_dir, username)
+            await asyncio.to_thread(self._write, credential_file, credential)
+            self.credentials[username] = credential
+
+    async def check_password(self, username: str, password: str) -> bool:
+        """
+        Check a password against the one of the last successful login of a user.
+
+        Args:
+            username: LinkedIn username
+            password: Password to check
+
+        Returns:
+            True if it is the same password, False if it differs or no login was recorded
+        """
+        if username not in self.credentials:
+            self.credentials[username] = await asyncio.to_thread(self._read_credential, username)
+        credential = self.credentials[username]
+        if credential is None:
+            return False
+        password_hash = await asyncio.to_thread(
+            self._hash_password, password, bytes.fromhex(credential['salt']), credential['iterations']
+        )
+        return hmac.compare_digest(password_hash.hex(), credential['hash'])
+
+    def get_stats(self) -> dict:
+        """
+        Get store counters.
+
+        Returns:
+            Dictionary with loaded sessions, hits, file loads and writes
+        """
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "loads": self.loads,
+            "writes": self.writes,
+        }
+
+    async def _get_entry(self, username: str) -> _SessionEntry:
+        entry = self.entries.get(username)
+        if entry is not None and time.monotonic() - entry.checked_at < self.STAT_INTERVAL:
+            self.hits += 1
+            return entry
+
+        async with self._get_lock(username):
+            entry = self.entries.get(username)
+            if entry is not None and time.monotonic() - entry.checked_at < self.STAT_INTERVAL:
+                self.hits += 1
+                return entry
+
+            mtime = await asyncio.to_thread(self._stat, username)
+            if entry is not None and entry.mtime == mtime:
+                self.hits += 1
+                entry.checked_at = time.monotonic()
+                return entry
+
+            self.loads += 1
+            state, mtime = await asyncio.to_thread(self._read, username)
+            entry = _SessionEntry(state, mtime)
+            self.entries[username] = entry
+            return entry
+
+    def _stat(self, username: str) -> Optional[float]:
+        try:
+            return os.stat(SessionHelper.get_session_file(self.session_dir, username)).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _read(self, username: str) -> Tuple[dict, Optional[float]]:
+        session_file = SessionHelper.get_session_file(self.session_dir, username)
+        try:
+            with open(session_file, 'r') as f:
+                mtime = os.fstat(f.fileno()).st_mtime
+                state = json.load(f)
+        except FileNotFoundError:
+            return {"cookies": [], "origins": []}, None
+        except ValueError as e:
+            logging.warning("Ignoring unreadable session file of %s: %s", username, e)
+            return {"cookies": [], "origins": []}, mtime
+        state.setdefault("cookies", [])
+        state.setdefault("origins", [])
+        return state, mtime
+
+    def _read_credential(self, username: str) -> Optional[dict]:
+        credential_file = SessionHelper.get_credential_file(self.session_dir, username)
+        try:
+            with open(credential_file, 'r') as f:
+                credential = json.load(f)
+            return {"salt": str(credential['salt']), "iterations": int(credential['iterations']),
+                    "hash": str(credential['hash'])}
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logging.warning("Ignoring unreadable credential file of %s: %s", username, e)
+            return None
+
+    @staticmethod
+    def _hash_password(password: str, salt: bytes, iterations: int) -> bytes:
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations)
+
+    def _write(self, path: str, data: dict) -> float:
+        fd, tmp_path = tempfile.mkstemp(dir=self.session_dir, prefix=".linkedin_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return os.stat(path).st_mtime
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlightManager:
+    """
+    Manager coalescing identical scrapes that are in flight at the same time.
+
+    The first caller for a key starts a task, callers arriving before it completes await
+    the same task and get the same result or exception. Waiters are shielded from each
+    other: cancelling one of them leaves the shared task running for the rest.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the manager with no flights.
+        """
+        self.in_flight: Dict[Tuple, asyncio.Task] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    async def run(self, key: Tuple, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a coroutine once per key among concurrent callers.
+
+        Args:
+            key: Tuple whose first item is the kind of work, e.g. ('company', slug); include the
+                username when the result depends on the session
+            factory: Coroutine function doing the work, only called by the first caller
+
+        Returns:
+            Result of the shared task
+        """
+        counters = self.counters.setdefault(key[0], {"calls": 0, "executions": 0, "coalesced": 0})
+        counters["calls"] += 1
+
+        task = self.in_flight.get(key)
+        if task is None:
+            counters["executions"] += 1
+            task = asyncio.get_running_loop().create_task(factory())
+            self.in_flight[key] = task
+            task.add_done_callback(lambda done: self._land(key, done))
+        else:
+            counters["coalesced"] += 1
+
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> dict:
+        """
+        Get deduplication counters.
+
+        Returns:
+            Dictionary keyed by kind with calls, executions, coalesced and in-flight counts
+        """
+        in_flight: Dict[str, int] = {}
+        for key in self.in_flight:
+            in_flight[key[0]] = in_flight.get(key[0], 0) + 1
+
+        return {
+            kind: {**counters, "in_flight": in_flight.get(kind, 0)}
+            for kind, counters in self.counters.items()
+        }
+
+    def _land(self, key: Tuple, task: asyncio.Task) -> None:
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+        # Every waiter may have been cancelled, don't let the error go unretrieved
+        if not task.cancelled():
+            task.exception()
+
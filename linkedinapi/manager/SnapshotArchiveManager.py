@@ -0,0 +1,121 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Iterator, List
+
+from injector import inject
+
+from linkedinapi.manager.SnapshotParserManager import SnapshotParserManager
+from linkedinapi.variable.SnapshotArchiveEnabledVariable import SnapshotArchiveEnabledVariable
+from linkedinapi.variable.SnapshotDirVariable import SnapshotDirVariable
+
+
+class SnapshotArchiveManager:
+    """
+    Manager storing compressed page snapshots so they can be re-extracted after a selector change.
+
+    Snapshots live under <snapshot_dir>/<kind>/<key>/<timestamp>.json.gz and hold the URL,
+    capture time and HTML of the page.
+    """
+
+    @inject
+    def __init__(self, snapshot_dir: SnapshotDirVariable, enabled: SnapshotArchiveEnabledVariable,
+                 snapshot_parser: SnapshotParserManager) -> None:
+        """
+        Initialize the snapshot archive.
+
+        Args:
+            snapshot_dir: Root directory of the archive
+            enabled: Whether captured pages are archived
+            snapshot_parser: Parser used to re-extract archived snapshots
+        """
+        self.snapshot_dir = snapshot_dir
+        self.enabled = bool(enabled)
+        self.snapshot_parser = snapshot_parser
+        self.archived_count = 0
+
+    async def archive(self, kind: str, key: str, url: str, html: str) -> None:
+        """
+        Store a compressed snapshot of a page if archiving is enabled.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            key: Entity key, e.g. job id or company slug
+            url: URL the page was captured at
+            html: Captured page HTML
+        """
+        if not self.enabled:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, kind, key, url, html)
+            self.archived_count += 1
+        except Exception as e:
+            logging.warning("Could not archive %s snapshot %s: %s", kind, key, e)
+
+    def iter_snapshots(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every archived snapshot of a kind, oldest first within each key.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+
+        Yields:
+            Dictionaries with kind, key, url, captured_at and html keys
+        """
+        kind_dir = os.path.join(self.snapshot_dir, kind)
+        if not os.path.isdir(kind_dir):
+            return
+        for key in sorted(os.listdir(kind_dir)):
+            key_dir = os.path.join(kind_dir, key)
+            for file_name in sorted(os.listdir(key_dir)):
+                with gzip.open(os.path.join(key_dir, file_name), 'rt', encoding='utf-8') as f:
+                    yield json.load(f)
+
+    async def reextract(self, kind: str, latest_only: bool = True) -> List[Any]:
+        """
+        Re-run extraction on archived snapshots without scraping again.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            latest_only: Only use the most recent snapshot of each key
+
+        Returns:
+            List of models built from the snapshots
+        """
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        all_snapshots = []
+        for snapshot in self.iter_snapshots(kind):
+            if latest_only:
+                snapshots[snapshot['key']] = snapshot
+            else:
+                all_snapshots.append(snapshot)
+        selected = list(snapshots.values()) if latest_only else all_snapshots
+
+        return await asyncio.gather(*[
+            self.snapshot_parser.build(kind, snapshot['html'], snapshot['url']) for snapshot in selected
+        ])
+
+    def get_stats(self) -> dict:
+        """
+        Get archive counters.
+
+        Returns:
+            Dictionary with the enabled flag and archived snapshot count
+        """
+        return {
+            "enabled": self.enabled,
+            "archived": self.archived_count,
+        }
+
+    def _write(self, kind: str, key: str, url: str, html: str) -> None:
+        safe_key = re.sub(r'[^A-Za-z0-9_.-]', '_', str(key))
+        key_dir = os.path.join(self.snapshot_dir, kind, safe_key)
+        os.makedirs(key_dir, exist_ok=True)
+        captured_at = time.time()
+        path = os.path.join(key_dir, f"{int(captured_at * 1000)}.json.gz")
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump({"kind": kind, "key": str(key), "url": url, "captured_at": captured_at, "html": html}, f)
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional
+
+from injector import inject
+
+from linkedinapi.factory.CompanyFactory import CompanyFactory
+from linkedinapi.factory.HirerFactory import HirerFactory
+from linkedinapi.factory.JobPostingInfoFactory import JobPostingInfoFactory
+from linkedinapi.factory.JobPostingListingItemFactory import JobPostingListingItemFactory
+from linkedinapi.helper.SnapshotHelper import SnapshotHelper
+from linkedinapi.variable.SnapshotParserPoolVariable import SnapshotParserPoolVariable
+from linkedinapi.variable.SnapshotParserWorkersVariable import SnapshotParserWorkersVariable
+
+
+class SnapshotParserManager:
+    """
+    Manager parsing captured page HTML off the event loop, on a thread or process pool.
+    """
+
+    @inject
+    def __init__(self, pool: SnapshotParserPoolVariable, workers: SnapshotParserWorkersVariable) -> None:
+        """
+        Initialize the parser manager; the worker pool is created on first use.
+
+        Args:
+            pool: Kind of worker pool, 'thread' or 'process'
+            workers: Number of workers
+        """
+        self.pool = str(pool)
+        self.workers = int(workers)
+        self.executor: Optional[Executor] = None
+        self.parsed_count = 0
+
+    def _get_executor(self) -> Executor:
+        if self.executor is None:
+            if self.pool == 'process':
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='snapshot-parser')
+            logging.info("Snapshot parser started with %d %s workers", self.workers, self.pool)
+        return self.executor
+
+    async def parse(self, kind: str, html: str, url: str) -> Any:
+        """
+        Parse a captured page into its raw fields on the worker pool.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            html: Captured page HTML
+            url: URL the page was captured at
+
+        Returns:
+            Raw fields as returned by SnapshotHelper.parse
+        """
+        loop = asyncio.get_running_loop()
+        fields = await loop.run_in_executor(self._get_executor(), SnapshotHelper.parse, kind, html, url)
+        self.parsed_count += 1
+        return fields
+
+    async def build(self, kind: str, html: str, url: str) -> Any:
+        """
+        Parse a captured page and build the same model the live page objects produce.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            html: Captured page HTML
+            url: URL the page was captured at
+
+        Returns:
+            JobPostingInfo, Company, Hirer, or a list of JobPostingListingItem for job_search
+        """
+        fields = await self.parse(kind, html, url)
+        return self.to_model(kind, fields)
+
+    @staticmethod
+    def to_model(kind: str, fields: Any) -> Any:
+        """
+        Build the model of a page kind from its raw fields.
+
+        Args:
+            kind: Page kind, one of SnapshotHelper.KINDS
+            fields: Raw fields as returned by SnapshotHelper.parse
+
+        Returns:
+            Model instance, or a list of JobPostingListingItem for job_search
+        """
+        if kind == 'job_posting':
+            return JobPostingInfoFactory.create_from_job_posting_fields(fields)
+        if kind == 'job_search':
+            return JobPostingListingItemFactory.create_all_from_job_posting_search_payload(fields)
+        if kind == 'company':
+            return CompanyFactory.create_from_company_fields(fields)
+        if kind == 'hirer':
+            return HirerFactory.create_from_hirer_fields(fields)
+        raise ValueError(f"Unknown snapshot kind: {kind}")
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker pool.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def get_stats(self) -> dict:
+        """
+        Get parser counters.
+
+        Returns:
+            Dictionary with the pool kind, worker count and parsed pages
+        """
+        return {
+            "pool": self.pool,
+            "workers": self.workers,
+            "parsed": self.parsed_count,
+        }
@@ -0,0 +1,46 @@
+from typing import Dict
+
+
+class WaitStatsManager:
+    """
+    Manager aggregating how long each named page wait actually took.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty wait statistics.
+        """
+        self.steps: Dict[str, dict] = {}
+
+    def record(self, step: str, elapsed_ms: float, ok: bool) -> None:
+        """
+        Record a single wait.
+
+        Args:
+            step: Name of the wait step
+            elapsed_ms: Milliseconds the wait took
+            ok: False if the wait timed out
+        """
+        stats = self.steps.setdefault(step, {"count": 0, "timeouts": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        if not ok:
+            stats["timeouts"] += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get per-step wait statistics.
+
+        Returns:
+            Dictionary keyed by step with count, timeouts, average and max milliseconds
+        """
+        return {
+            step: {
+                "count": stats["count"],
+                "timeouts": stats["timeouts"],
+                "avg_ms": round(stats["total_ms"] / stats["count"], 1),
+                "max_ms": round(stats["max_ms"], 1),
+            }
+            for step, stats in self.steps.items()
+        }
@@ -0,0 +1,15 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    """
+    Model representing the outcome of a single item of a batch request.
+    """
+    key: str
+    ok: bool
+    result: Optional[T] = None
+    error: Optional[str] = None
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CachePolicy(BaseModel):
+    """
+    Model for the caching directives of a request, parsed from its Cache-Control header.
+
+    no_cache skips cached values but stores the fresh one, no_store bypasses the cache
+    entirely, max_age only accepts cached values younger than the given seconds.
+    """
+    no_cache: bool = False
+    no_store: bool = False
+    max_age: Optional[int] = None
+
+    def is_no_cache(self) -> bool:
+        return self.no_cache
+
+    def is_no_store(self) -> bool:
+        return self.no_store
+
+    def get_max_age(self) -> Optional[int]:
+        return self.max_age
@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class CompanyBatchRequest(BaseModel):
+    """
+    Model for batch request parameters: LinkedIn company slugs, duplicates are fetched once.
+    """
+    company_slugs: List[str] = Field(min_length=1, max_length=500)
+
+    def get_company_slugs(self) -> List[str]:
+        return self.company_slugs
@@ -8,6 +8,10 @@ class CompanySinglePage:
     A class to represent a single company page on LinkedIn.
     """
 
+    ready_selector = '.org-top-card-summary__title'
+    overflow_dropdown_selector = '.org-top-card-overflow .artdeco-dropdown'
+    dropdown_item_selector = '.artdeco-dropdown__content-inner a'
+
     def __init__(self, page: Page):
         """
         Initialize the CompanySinglePage with a Playwright Page object.
@@ -22,7 +26,7 @@ class CompanySinglePage:
 
         :return: Company name as a string, or None if not found
         """
-        name_selector = '.org-top-card-summary__title'
+        name_selector = self.ready_selector
         try:
             await self.page.wait_for_selector(name_selector, timeout=1000)
             name_element = await self.page.query_selector(name_selector)
@@ -55,29 +59,36 @@ class CompanySinglePage:
         except Exception:
             return None
 
-    async def get_website(self) -> Optional[str]:
+    async def open_overflow_menu(self) -> bool:
         """
-        Get the company website from the company page.
+        Open the overflow dropdown of the top card, its items are only rendered once it's clicked.
 
-        :return: Company website as a string, or None if not found
+        :return: True if the dropdown items showed up, False otherwise
         """
-        main_dropdown_selector = '.org-top-card-overflow .artdeco-dropdown'
         try:
-            await self.page.wait_for_selector(main_dropdown_selector, timeout=1000)
-
-            await self.page.click(main_dropdown_selector)
+            await self.page.wait_for_selector(self.overflow_dropdown_selector, timeout=1000)
+            await self.page.click(self.overflow_dropdown_selector)
+            await self.page.wait_for_selector(self.dropdown_item_selector, timeout=1000)
+            return True
+        except Exception:
+            return False
 
-            await self.page.wait_for_timeout(1000)
+    async def get_website(self) -> Optional[str]:
+        """
+        Get the company website from the company page.
 
-            # loop .artdeco-dropdown__content-inner a
-            dropdown_items = await self.page.query_selector_all('.artdeco-dropdown__content-inner a')
+        :return: Company website as a string, or None if not found
+        """
+        if await self.open_overflow_menu():
+            try:
+                dropdown_items = await self.page.query_selector_all(self.dropdown_item_selector)
 
-            # if a contains link-external-medium in its html then return the href
-            for item in dropdown_items:
-                if 'link-external-medium' in await item.inner_html():
-                    return await item.get_attribute('href')
-        except Exception:
-            pass
+                # if a contains link-external-medium in its html then return the href
+                for item in dropdown_items:
+                    if 'link-external-medium' in await item.inner_html():
+                        return await item.get_attribute('href')
+            except Exception:
+                pass
 
         main_buttonbar_link_selector = '.org-top-card-primary-actions__inner a'
 
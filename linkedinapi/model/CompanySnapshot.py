@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+
+from linkedinapi.model.CompanySinglePage import CompanySinglePage
+from linkedinapi.model.HtmlSnapshot import HtmlSnapshot
+
+
+class CompanySnapshot(HtmlSnapshot):
+    """
+    A class to represent a captured company page, mirroring CompanySinglePage.
+    """
+
+    def get_slug(self) -> Optional[str]:
+        """
+        Get the company slug from the captured URL.
+
+        :return: Company slug as a string, or None if not found
+        """
+        try:
+            return self.url.split('company/')[1].split('/')[0]
+        except Exception:
+            return None
+
+    def get_website(self) -> Optional[str]:
+        """
+        Get the company website from the overflow dropdown or the primary actions bar.
+
+        The dropdown items are only in the HTML if the menu was opened before the capture,
+        see CompanySinglePage.open_overflow_menu.
+
+        :return: Company website as a string, or None if not found
+        """
+        if self.first(CompanySinglePage.overflow_dropdown_selector) is not None:
+            for item in self.all(CompanySinglePage.dropdown_item_selector):
+                if 'link-external-medium' in (item.inner_html or ''):
+                    return self.attribute(item, 'href')
+        for element in self.all('.org-top-card-primary-actions__inner a'):
+            if 'org-top-card-primary-actions__external-link' in (element.inner_html or ''):
+                return self.attribute(element, 'href')
+        return None
+
+    def extract_fields(self) -> Dict[str, Any]:
+        """
+        Read the company fields from the HTML.
+
+        :return: Dictionary with name, slug and website keys
+        """
+        return {
+            'name': self.first_text('.org-top-card-summary__title'),
+            'slug': self.get_slug(),
+            'website': self.get_website(),
+        }
@@ -0,0 +1,32 @@
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel
+
+from linkedinapi.model.CrawlJobRequest import CrawlJobRequest
+
+CrawlJobStatus = Literal['queued', 'running', 'done', 'failed', 'cancelled']
+
+
+class CrawlJob(BaseModel):
+    """
+    Model representing the state of a crawl job.
+
+    stats holds pages, items, errors, run_ms (time spent running, summed over resumes)
+    and items_per_second.
+    """
+    id: str
+    username: str
+    request: CrawlJobRequest
+    status: CrawlJobStatus
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result_count: int = 0
+    stats: Dict[str, Any] = {}
+
+    def get_id(self) -> str:
+        return self.id
+
+    def get_status(self) -> str:
+        return self.status
@@ -0,0 +1,33 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+
+CrawlJobType = Literal['search', 'job_postings', 'companies', 'hirers']
+
+
+class CrawlJobRequest(BaseModel):
+    """
+    Model for a crawl job submission.
+
+    'search' jobs walk the result pages of a search, the other types fetch the details
+    of the ids or slugs listed in keys.
+    """
+    type: CrawlJobType
+    search: Optional[JobSearchQuery] = None
+    limit_first_page: bool = False
+    keys: List[str] = Field(default=[], max_length=10000)
+
+    @model_validator(mode='after')
+    def check_payload(self) -> 'CrawlJobRequest':
+        if self.type == 'search' and self.search is None:
+            raise ValueError("search jobs require search")
+        if self.type != 'search' and not self.keys:
+            raise ValueError(f"{self.type} jobs require keys")
+        if self.type == 'job_postings' and not all(key.isdigit() for key in self.keys):
+            raise ValueError("job_postings keys must be job posting IDs")
+        return self
+
+    def get_type(self) -> str:
+        return self.type
@@ -0,0 +1,13 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+
+class CrawlJobResultPage(BaseModel):
+    """
+    Model representing a page of stored crawl job results.
+
+    Search jobs store job posting listing items, the other types store per-item batch results.
+    """
+    items: List[Any] = []
+    next_offset: Optional[int] = None
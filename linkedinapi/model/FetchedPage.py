@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class FetchedPage(BaseModel):
+    """
+    Model representing the HTML of a page as returned by a fetch backend.
+
+    url is the LinkedIn URL the page ended up at, after redirects.
+    """
+    url: str
+    status: int
+    html: str
+    backend: str
+    elapsed_ms: float
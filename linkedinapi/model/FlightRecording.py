@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class FlightRecording(BaseModel):
+    """
+    Model representing a kept flight recording of a slow or failed operation.
+
+    files lists the artifacts of the recording: trace.zip (open it with `playwright show-trace`)
+    and, when HAR capture is on, har.json.
+    """
+    id: str
+    operation: str
+    key: str
+    username: str
+    started_at: float
+    elapsed_ms: float
+    error: Optional[str] = None
+    url: Optional[str] = None
+    files: List[str] = []
+    size_bytes: int = 0
+
+    def get_id(self) -> str:
+        return self.id
@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class HirerBatchRequest(BaseModel):
+    """
+    Model for batch request parameters: LinkedIn hirer slugs, duplicates are fetched once.
+    """
+    hirer_slugs: List[str] = Field(min_length=1, max_length=500)
+
+    def get_hirer_slugs(self) -> List[str]:
+        return self.hirer_slugs
@@ -8,6 +8,8 @@ class HirerSinglePage:
     A class to represent a single hirer page on LinkedIn.
     """
 
+    ready_selector = 'h1'
+
     def __init__(self, page: Page):
         """
         Initialize the HirerSinglePage with a Playwright Page object.
@@ -22,7 +24,7 @@ class HirerSinglePage:
 
         :return: Hirer name as a string, or None if not found
         """
-        name_selector = 'h1'
+        name_selector = self.ready_selector
         try:
             await self.page.wait_for_selector(name_selector, timeout=1000)
             name_element = await self.page.query_selector(name_selector)
@@ -0,0 +1,33 @@
+from typing import Any, Dict, Optional
+
+from linkedinapi.model.HtmlSnapshot import HtmlSnapshot
+
+
+class HirerSnapshot(HtmlSnapshot):
+    """
+    A class to represent a captured hirer profile page, mirroring HirerSinglePage.
+    """
+
+    def get_slug(self) -> Optional[str]:
+        """
+        Get the hirer slug from the captured URL.
+
+        :return: Hirer slug as a string, or None if not found
+        """
+        try:
+            return self.url.split('in/')[1].split('/')[0]
+        except Exception:
+            return None
+
+    def extract_fields(self) -> Dict[str, Any]:
+        """
+        Read the hirer fields from the HTML.
+
+        :return: Dictionary with name, slug, location and role keys
+        """
+        return {
+            'name': self.first_text('h1'),
+            'slug': self.get_slug(),
+            'location': self.first_text('.text-body-small.inline.t-black--light.break-words'),
+            'role': self.first_text('.text-body-medium.break-words'),
+        }
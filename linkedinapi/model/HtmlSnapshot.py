@@ -0,0 +1,78 @@
+import re
+from typing import List, Optional
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+
+class HtmlSnapshot:
+    """
+    A class to represent a captured LinkedIn page, parsed offline from its HTML.
+
+    Subclasses mirror the selectors of the live page objects and return the same raw
+    field dictionaries, so the factories build identical models from either source.
+    """
+
+    def __init__(self, html: str, url: str):
+        """
+        Initialize the snapshot by parsing the captured HTML.
+
+        :param html: Page HTML as returned by page.content()
+        :param url: URL the page was captured at
+        """
+        self.url = url
+        self.tree = LexborHTMLParser(html)
+
+    def first(self, selector: str, root: Optional[LexborNode] = None) -> Optional[LexborNode]:
+        """
+        Get the first node matching the selector.
+
+        :param selector: CSS selector
+        :param root: Node to search under, the whole document if None
+        :return: Matching node, or None if not found
+        """
+        return (root or self.tree).css_first(selector)
+
+    def all(self, selector: str, root: Optional[LexborNode] = None) -> List[LexborNode]:
+        """
+        Get every node matching the selector.
+
+        :param selector: CSS selector
+        :param root: Node to search under, the whole document if None
+        :return: List of matching nodes
+        """
+        return (root or self.tree).css(selector)
+
+    def text(self, node: Optional[LexborNode]) -> Optional[str]:
+        """
+        Get the trimmed text of a node, approximating the browser's innerText.
+
+        :param node: Node to read
+        :return: Text with collapsed spaces and empty lines removed, or None if the node is missing
+        """
+        if node is None:
+            return None
+        raw = node.text(deep=True, separator='')
+        lines = [re.sub(r'[ \t ]+', ' ', line).strip() for line in raw.splitlines()]
+        return '\n'.join(line for line in lines if line)
+
+    def first_text(self, selector: str, root: Optional[LexborNode] = None) -> Optional[str]:
+        """
+        Get the trimmed text of the first node matching the selector.
+
+        :param selector: CSS selector
+        :param root: Node to search under, the whole document if None
+        :return: Text of the node, or None if not found
+        """
+        return self.text(self.first(selector, root))
+
+    def attribute(self, node: Optional[LexborNode], name: str) -> Optional[str]:
+        """
+        Get an attribute of a node.
+
+        :param node: Node to read
+        :param name: Attribute name
+        :return: Attribute value, or None if the node or the attribute is missing
+        """
+        if node is None:
+            return None
+        return node.attributes.get(name)
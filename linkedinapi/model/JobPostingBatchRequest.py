@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class JobPostingBatchRequest(BaseModel):
+    """
+    Model for batch request parameters: LinkedIn job posting IDs, duplicates are fetched once.
+    """
+    job_ids: List[int] = Field(min_length=1, max_length=500)
+
+    def get_job_ids(self) -> List[int]:
+        return self.job_ids
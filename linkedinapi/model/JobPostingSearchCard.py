@@ -5,6 +5,9 @@ from playwright.async_api import ElementHandle
 
 
 class JobPostingSearchCard:
+    # Easy Apply cards carry the LinkedIn logo in their footer, whatever the UI language
+    simple_apply_selector = '[data-test-icon^="linkedin-bug"], li-icon[type^="linkedin-bug"]'
+
     def __init__(self, element_handle: ElementHandle):
         self.element_handle = element_handle
 
@@ -31,4 +34,4 @@ class JobPostingSearchCard:
         return match.group(1) if match else None
 
     async def is_simple_application(self) -> bool:
-        return 'Candidatura semplice' in await self.element_handle.inner_text()
+        return await self.element_handle.query_selector(self.simple_apply_selector) is not None
@@ -1,79 +1,160 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from playwright.async_api import Page
 
+from linkedinapi.helper.JobSearchUrlHelper import JobSearchUrlHelper
+from linkedinapi.helper.VoyagerHelper import VoyagerHelper
 from linkedinapi.model.JobPostingSearchCard import JobPostingSearchCard
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+from linkedinapi.model.PageWaiter import PageWaiter
+from linkedinapi.model.ResponseCapture import ResponseCapture
 
 
 class JobPostingSearchPage:
-    def __init__(self, page: Page):
+    results_list_selector = '.scaffold-layout__list'
+    # Rendered instead of the cards when the offset is past the last result
+    no_results_selector = '.jobs-search-no-results-banner'
+    job_card_selector = '.job-card-container'
+    # Page buttons of the classic and of the current pagination bar, only rendered when there's more than one page
+    pagination_selector = '[data-test-pagination-page-btn], .jobs-search-pagination__indicator-button'
+    # Waits that leave the card list partial when they time out
+    card_steps = ('results_list', 'cards_rendered', 'job_cards')
+
+    LAST_PAGE_SCRIPT = """buttons => {
+        const pages = buttons
+            .map(button => parseInt(button.getAttribute('data-test-pagination-page-btn') || button.innerText, 10))
+            .filter(page => !isNaN(page));
+        return pages.length ? Math.max(...pages) : null;
+    }"""
+
+    EXTRACT_JOB_CARDS_SCRIPT = """(cards, simpleApplySelector) => cards.map(card => {
+        const text = element => element ? element.innerText.trim() : null;
+        const time = card.querySelector('time[datetime]');
+        return {
+            id: card.getAttribute('data-job-id'),
+            title: text(card.querySelector('strong')),
+            company_name: text(card.querySelector('.artdeco-entity-lockup__subtitle')),
+            metadata_items: Array.from(card.querySelectorAll('.job-card-container__metadata-wrapper')).map(text),
+            created_at: time ? time.getAttribute('datetime') : null,
+            is_simple: card.querySelector(simpleApplySelector) !== null,
+        };
+    })"""
+
+    def __init__(self, page: Page, waiter: Optional[PageWaiter] = None,
+                 capture: Optional[ResponseCapture] = None):
         self.page = page
-
-    async def search_jobs(self, query: str, location: str, filter_date: Optional[int] = None) -> None:
-        jobs_url = "https://www.linkedin.com/jobs/search"
-        await self.page.goto(jobs_url)
-
-        await self.page.wait_for_timeout(1000)
-
-        search_selector = 'input[aria-label="Cerca per qualifica, competenza o azienda"]'
-        await self.page.wait_for_selector(search_selector)
-        await self.page.fill(search_selector, query)
-        await self.page.wait_for_timeout(500)
-
-        location_selector = 'input[aria-label="Città, stato o CAP"]'
-        await self.page.wait_for_selector(location_selector)
-        await self.page.fill(location_selector, location)
-        await self.page.wait_for_timeout(500)
-
-        await self.page.keyboard.press('Enter')
-        await self.page.wait_for_timeout(5000)
-
-        if filter_date:
-            await self.page.click("#searchFilter_timePostedRange")
-            await self.page.wait_for_timeout(1500)
-            for i in range(2):
-                await self.page.keyboard.press('Tab')
-                await self.page.wait_for_timeout(500)
-            for i in range(filter_date):
-                await self.page.keyboard.press('ArrowDown')
-                await self.page.wait_for_timeout(500)
-            for i in range(2):
-                await self.page.keyboard.press('Tab')
-                await self.page.wait_for_timeout(500)
-            await self.page.keyboard.press('Enter')
-            await self.page.wait_for_timeout(1500)
+        self.waiter = waiter or PageWaiter(page)
+        self.capture = capture
+
+    async def search_jobs(self, search_query: JobSearchQuery) -> bool:
+        """
+        Open the result page of a search with a single navigation to its URL.
+
+        :param search_query: Search criteria and result offset
+        :return: True if the page has a result list, False if the search has no (more) results
+        """
+        self.waiter.restart()
+
+        self._clear_capture()
+        await self.page.goto(JobSearchUrlHelper.build_url(search_query), wait_until='commit')
+        # A page past the end renders the no results banner, don't wait for a list that won't come
+        has_results = await self.waiter.for_selector('results_list',
+                                                     f"{self.results_list_selector}, {self.no_results_selector}",
+                                                     timeout=15000, required=False)
+        has_results = has_results and await self.page.query_selector(self.no_results_selector) is None
+        if has_results:
+            await self.waiter.for_dom_settled('results_settled', self.results_list_selector, quiet_ms=500)
+        return has_results
 
     async def get_job_cards(self) -> List[JobPostingSearchCard]:
+        await self.load_job_cards()
+
         job_cards = []
-        scroll_container_selector = '.scaffold-layout__list'
-        await self.page.wait_for_selector(scroll_container_selector)
+        job_card_elements = await self.page.query_selector_all(self.job_card_selector)
+
+        for job_card_element in job_card_elements:
+            job_card = JobPostingSearchCard(job_card_element)
+            job_cards.append(job_card)
+
+        return job_cards
+
+    async def extract_job_cards(self) -> List[Dict[str, Any]]:
+        """
+        Extract all rendered job cards in a single in-page evaluation.
+
+        :return: List of raw card dictionaries with id, title, company_name, metadata_items,
+                 created_at and is_simple keys
+        """
+        await self.load_job_cards()
+        return await self.page.eval_on_selector_all(self.job_card_selector, self.EXTRACT_JOB_CARDS_SCRIPT,
+                                                    JobPostingSearchCard.simple_apply_selector)
+
+    async def capture_job_cards(self, timeout: int = 3000) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read the job cards of the current result page from the captured search API responses.
+
+        :param timeout: Milliseconds to wait for the response, capped by the waiter budget
+        :return: List of raw card dictionaries shaped like extract_job_cards, or None if the
+                 captured payloads are missing or don't cover the whole page
+        """
+        if self.capture is None:
+            return None
+
+        payloads = await self.capture.wait_for(ResponseCapture.JOB_CARDS, min(timeout, self.waiter.remaining_ms()))
+        job_cards = VoyagerHelper.extract_job_cards(payloads)
+        expected_count = VoyagerHelper.get_expected_job_card_count(payloads)
+        if not job_cards or (expected_count and len(job_cards) < expected_count):
+            return None
+        return job_cards
+
+    async def get_result_count(self) -> Optional[int]:
+        """
+        Get how many results the search has, as reported by LinkedIn.
+
+        The total of the captured search API responses is used when there is one, the last
+        page of the pagination bar otherwise.
+
+        :return: Number of results, rounded up to whole pages when read from the pagination bar,
+                 or None if LinkedIn reported neither
+        """
+        if self.capture is not None:
+            total = VoyagerHelper.get_total_job_count(self.capture.get(ResponseCapture.JOB_CARDS))
+            if total is not None:
+                return total
+        try:
+            last_page = await self.page.eval_on_selector_all(self.pagination_selector, self.LAST_PAGE_SCRIPT)
+        except Exception:
+            return None
+        return last_page * JobSearchUrlHelper.PAGE_SIZE if last_page else None
+
+    def has_partial_cards(self) -> bool:
+        """
+        Check whether a wait for the result list or its cards timed out, leaving the extracted cards partial.
+
+        :return: True if the cards of the page may be missing or incomplete
+        """
+        return any(not timing['ok'] and timing['step'] in self.card_steps for timing in self.waiter.timings)
+
+    async def load_job_cards(self) -> None:
+        self.waiter.restart()
+
+        scroll_container_selector = self.results_list_selector
+        await self.waiter.for_selector('results_list', scroll_container_selector)
         scroll_container = await self.page.query_selector(scroll_container_selector)
         scroll_container_bounds = await scroll_container.bounding_box()
         scroll_container_x = scroll_container_bounds['x']
         scroll_container_y = scroll_container_bounds['y']
 
         await self.page.mouse.move(scroll_container_x + 100, scroll_container_y + 100)
-        await self.page.wait_for_timeout(1500)
 
+        # Cards are rendered lazily while scrolling, wait until the list stops changing
         for i in range(8):
             await self.page.mouse.wheel(0, 400)
-            await self.page.wait_for_timeout(500)
-
-        job_card_selector = '.job-card-container'
-        await self.page.wait_for_selector(job_card_selector)
-        job_card_elements = await self.page.query_selector_all(job_card_selector)
-
-        for job_card_element in job_card_elements:
-            job_card = JobPostingSearchCard(job_card_element)
-            job_cards.append(job_card)
-
-        return job_cards
+        await self.waiter.for_dom_settled('cards_rendered', scroll_container_selector, quiet_ms=500)
 
-    async def has_next_page(self) -> bool:
-        next_page_selector = 'button[aria-label="Visualizza pagina successiva"]'
-        return await self.page.query_selector(next_page_selector) is not None
+        await self.waiter.for_selector('job_cards', self.job_card_selector, required=False)
 
-    async def go_to_next_page(self) -> None:
-        next_page_selector = 'button[aria-label="Visualizza pagina successiva"]'
-        await self.page.click(next_page_selector)
-        await self.page.wait_for_timeout(1000)
+    def _clear_capture(self) -> None:
+        # Responses captured before a new result set is requested belong to the previous one
+        if self.capture is not None:
+            self.capture.clear(ResponseCapture.JOB_CARDS)
@@ -0,0 +1,28 @@
+from typing import Any, Dict, List
+
+from linkedinapi.model.HtmlSnapshot import HtmlSnapshot
+from linkedinapi.model.JobPostingSearchCard import JobPostingSearchCard
+
+
+class JobPostingSearchSnapshot(HtmlSnapshot):
+    """
+    A class to represent a captured job search result page, mirroring JobPostingSearchPage.
+    """
+
+    def extract_job_cards(self) -> List[Dict[str, Any]]:
+        """
+        Read every rendered job card from the HTML.
+
+        :return: List of raw card dictionaries, same shape as JobPostingSearchPage.extract_job_cards
+        """
+        cards = []
+        for card in self.all('.job-card-container'):
+            cards.append({
+                'id': self.attribute(card, 'data-job-id'),
+                'title': self.first_text('strong', card),
+                'company_name': self.first_text('.artdeco-entity-lockup__subtitle', card),
+                'metadata_items': [self.text(node) for node in self.all('.job-card-container__metadata-wrapper', card)],
+                'created_at': self.attribute(self.first('time[datetime]', card), 'datetime'),
+                'is_simple': self.first(JobPostingSearchCard.simple_apply_selector, card) is not None,
+            })
+        return cards
@@ -1,8 +1,11 @@
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from playwright.async_api import Page
 
+from linkedinapi.helper.VoyagerHelper import VoyagerHelper
 from linkedinapi.model.Hirer import Hirer
+from linkedinapi.model.PageWaiter import PageWaiter
+from linkedinapi.model.ResponseCapture import ResponseCapture
 
 
 class JobPostingSinglePage:
@@ -10,208 +13,195 @@ class JobPostingSinglePage:
     A class to represent a single job posting page on LinkedIn.
     """
 
-    def __init__(self, page: Page):
+    ready_selector = '.artdeco-card h1'
+    content_selector = '.jobs-details, .job-view-layout, main'
+    apply_button_selector = '.jobs-apply-button--top-card .jobs-apply-button'
+    # Easy Apply buttons carry the LinkedIn logo and external ones a link icon, whatever the UI language
+    simple_apply_selector = ('.jobs-apply-button--top-card .jobs-apply-button [data-test-icon^="linkedin-bug"], '
+                             '.jobs-apply-button--top-card .jobs-apply-button li-icon[type^="linkedin-bug"]')
+    # Closed postings replace the apply button with an error feedback, flagged by its class and icon in every language
+    disabled_selector = '.artdeco-inline-feedback--error, .artdeco-inline-feedback [data-test-icon="signal-error"]'
+
+    EXTRACT_FIELDS_SCRIPT = """([simpleApplySelector, disabledSelector]) => {
+        const text = element => element ? element.innerText.trim() : null;
+        const first = selector => document.querySelector(selector);
+        const company = first('.job-details-jobs-unified-top-card__company-name a');
+        return {
+            title: text(first('.artdeco-card h1')),
+            location: text(first('.job-details-jobs-unified-top-card__primary-description-container .tvm__text:first-child')),
+            description: text(first('.jobs-box__html-content p')),
+            skills: Array.from(document.querySelectorAll('.job-details-how-you-match__skills-item-subtitle')).map(text),
+            additional_skills: text(first('.job-details-how-you-match__skills-section-descriptive-skill')),
+            company_name: text(company),
+            company_url: company ? company.getAttribute('href') : null,
+            disabled: first(disabledSelector) !== null,
+            is_simple: first(simpleApplySelector) !== null,
+            hirers: Array.from(document.querySelectorAll('.hirer-card__hirer-information')).map(hirer => {
+                const link = hirer.querySelector('a');
+                return {
+                    name: text(hirer.querySelector('.jobs-poster__name strong')),
+                    link: link ? link.getAttribute('href') : null,
+                    role: text(hirer.querySelector('.linked-area .text-body-small')),
+                };
+            }),
+        };
+    }"""
+
+    def __init__(self, page: Page, waiter: Optional[PageWaiter] = None,
+                 capture: Optional[ResponseCapture] = None):
         """
         Initialize the JobPostingSinglePage with a Playwright Page object.
 
         :param page: Playwright Page object
+        :param waiter: PageWaiter holding the deadline of the extraction
+        :param capture: ResponseCapture started before navigating to the posting, if any
         """
         self.page = page
+        self.waiter = waiter or PageWaiter(page)
+        self.capture = capture
 
-    async def get_id(self) -> Optional[int]:
+    async def wait_until_loaded(self) -> bool:
         """
-        Get the job ID from the job posting page.
+        Wait once for the top card to render and for the details to stop changing.
 
-        :return: Job ID as an integer, or None if not found
+        :return: True if the top card rendered before the deadline, False otherwise
         """
-        try:
-            return int(self.page.url.split('jobs/view/')[1].split('/')[0])
-        except Exception:
-            return None
+        loaded = await self.waiter.for_selector('job_top_card', self.ready_selector, required=False)
+        if loaded:
+            await self.waiter.for_dom_settled('job_details_settled', self.content_selector, quiet_ms=300, timeout=1500)
+        return loaded
 
-    async def get_title(self) -> Optional[str]:
+    async def extract_fields(self) -> Dict[str, Any]:
         """
-        Get the job title from the job posting page.
+        Read every field of the job posting in a single in-page evaluation.
+
+        Absent sections come back as None or empty lists instead of costing a timeout each.
 
-        :return: Job title as a string, or None if not found
+        :return: Dictionary of raw field values, see JobPostingInfoFactory.create_from_job_posting_fields
         """
-        job_title_selector = '.artdeco-card h1'
-        try:
-            await self.page.wait_for_selector(job_title_selector, timeout=1000)
-            job_title_element = await self.page.query_selector(job_title_selector)
-            return (await job_title_element.inner_text()).strip()
-        except Exception:
-            return None
+        fields = await self.page.evaluate(self.EXTRACT_FIELDS_SCRIPT, [self.simple_apply_selector, self.disabled_selector])
+        fields['id'] = await self.get_id()
+        return fields
 
-    async def get_location(self) -> Optional[str]:
+    async def capture_job_posting(self, job_id: int, timeout: int = 2000) -> Optional[Dict[str, Any]]:
         """
-        Get the job location from the job posting page.
+        Read the job posting from the captured jobPostings API response.
 
-        :return: Job location as a string, or None if not found
+        :param job_id: LinkedIn job posting ID the page was navigated to
+        :param timeout: Milliseconds to wait for the response, capped by the waiter budget
+        :return: Dictionary of final values as returned by VoyagerHelper.extract_job_posting,
+                 or None if no response for this posting was captured
         """
-        job_location_selector = '.job-details-jobs-unified-top-card__primary-description-container .tvm__text:first-child'
-        try:
-            await self.page.wait_for_selector(job_location_selector, timeout=1000)
-            job_location_element = await self.page.query_selector(job_location_selector)
-            return (await job_location_element.inner_text()).strip()
-        except Exception:
+        if self.capture is None:
             return None
 
-    async def get_description(self) -> Optional[str]:
+        payloads = await self.capture.wait_for(ResponseCapture.JOB_POSTING, min(timeout, self.waiter.remaining_ms()))
+        for payload in reversed(payloads):
+            posting = VoyagerHelper.extract_job_posting(payload)
+            if posting is not None and posting.get('id') == int(job_id):
+                return posting
+        return None
+
+    async def get_id(self) -> Optional[int]:
         """
-        Get the job description from the job posting page.
+        Get the job ID from the job posting page.
 
-        :return: Job description as a string, or None if not found
+        :return: Job ID as an integer, or None if not found
         """
-        job_description_selector = '.jobs-box__html-content p'
         try:
-            await self.page.wait_for_selector(job_description_selector, timeout=1000)
-            job_description_element = await self.page.query_selector(job_description_selector)
-            return (await job_description_element.inner_text()).strip()
+            return int(self.page.url.split('jobs/view/')[1].split('/')[0])
         except Exception:
             return None
 
-    async def get_skills(self) -> List[str]:
-        """
-        Get the required skills from the job posting page.
-
-        :return: List of required skills, or an empty list if not found
+    async def get_external_url(self) -> Optional[str]:
         """
-        job_skills_selector = '.job-details-how-you-match__skills-item-subtitle'
-        try:
-            await self.page.wait_for_selector(job_skills_selector, timeout=1000)
-            job_skills_objects = await self.page.query_selector_all(job_skills_selector)
-            skills = []
-            for job_skills_object in job_skills_objects:
-                job_skills = (await job_skills_object.inner_text()).strip()
-                job_skills = job_skills.split(',')
-                for job_skill in job_skills:
-                    is_last_skill = job_skill == job_skills[-1]
-                    if not is_last_skill:
-                        skills.append(job_skill.strip())
-                    else:
-                        split_skill = job_skill.split(' e ')
-                        for s in split_skill:
-                            skills.append(s.strip())
-            return skills
-        except Exception:
-            return []
+        Get the external URL for the job application.
 
-    async def get_additional_skills(self) -> List[str]:
-        """
-        Get the additional skills from the job posting page.
+        The click and the wait for the new tab are bounded by the waiter deadline.
 
-        :return: List of additional skills, or an empty list if not found
+        :return: External URL as a string, or None if there is no apply button or no tab opened in time
         """
-        additional_skills_selector = '.job-details-how-you-match__skills-section-descriptive-skill'
         try:
-            await self.page.wait_for_selector(additional_skills_selector, timeout=1000)
-            additional_skills_object = await self.page.query_selector(additional_skills_selector)
-            skills = []
-            if additional_skills_object:
-                additional_skills = (await additional_skills_object.inner_text()).strip()
-                additional_skills = additional_skills.split('·')
-                for additional_skill in additional_skills:
-                    skills.append(additional_skill.strip())
-            return skills
+            if await self.page.query_selector(self.apply_button_selector) is None:
+                return None
+            # The context is shared with other pooled tabs, so only a tab opened by this click counts
+            timeout = max(1, min(5000, self.waiter.remaining_ms()))
+            async with self.page.context.expect_page(timeout=timeout) as new_page_info:
+                await self.page.click(self.apply_button_selector, timeout=timeout)
+            new_page = await new_page_info.value
         except Exception:
-            return []
-
-    async def get_company_info(self) -> Tuple[Optional[str], Optional[str]]:
-        """
-        Get the company name and slug from the job posting page.
+            return None
 
-        :return: Tuple containing company name and slug, or (None, None) if not found
-        """
-        company_url_selector = '.job-details-jobs-unified-top-card__company-name a'
         try:
-            await self.page.wait_for_selector(company_url_selector, timeout=1000)
-            company_name_element = await self.page.query_selector(company_url_selector)
-            company_name = (await company_name_element.inner_text()).strip()
-            company_url = (await company_name_element.get_attribute('href'))
-            company_slug = company_url.split('company/')[1].split('/')[0]
-            return company_name, company_slug
+            await new_page.wait_for_load_state('domcontentloaded')
+            return new_page.url
         except Exception:
-            return None, None
+            return None
+        finally:
+            await new_page.close()
 
-    async def is_disabled(self) -> bool:
+    @staticmethod
+    def parse_skills(skills_texts: List[str]) -> List[str]:
         """
-        Check if the job posting is disabled.
+        Split the "how you match" skill lines into single skills.
 
-        :return: True if the job posting is disabled, False otherwise
+        :param skills_texts: Texts like "Python, SQL e Docker"
+        :return: List of skills
         """
-        job_disabled_selector = '.artdeco-inline-feedback__message'
-        try:
-            if await self.page.query_selector(job_disabled_selector):
-                job_disabled_element = await self.page.query_selector(job_disabled_selector)
-                job_disabled_text = (await job_disabled_element.inner_text()).strip().lower()
-                return job_disabled_text.find('non accetta') != -1
-            return False
-        except Exception:
-            return False
+        skills = []
+        for skills_text in skills_texts:
+            job_skills = skills_text.split(',')
+            for job_skill in job_skills:
+                is_last_skill = job_skill == job_skills[-1]
+                if not is_last_skill:
+                    skills.append(job_skill.strip())
+                else:
+                    split_skill = job_skill.split(' e ')
+                    for s in split_skill:
+                        skills.append(s.strip())
+        return skills
 
-    async def is_simple_application(self) -> bool:
+    @staticmethod
+    def parse_additional_skills(additional_skills_text: Optional[str]) -> List[str]:
         """
-        Check if the job posting is a simple application.
+        Split the descriptive skills line into single skills.
 
-        :return: True if the job posting is a simple application, False otherwise
+        :param additional_skills_text: Text like "Git · Linux"
+        :return: List of skills, empty if the text is missing
         """
-        job_external_button_selector = '.jobs-apply-button--top-card .jobs-apply-button'
-        try:
-            await self.page.wait_for_selector(job_external_button_selector, timeout=1000)
-            if await self.page.query_selector(job_external_button_selector):
-                job_external_button_element = await self.page.query_selector(job_external_button_selector)
-                job_external_button_text = (await job_external_button_element.inner_text()).strip()
-                return job_external_button_text.find('semplice') != -1
-            return False
-        except Exception:
-            return False
+        if not additional_skills_text:
+            return []
+        return [additional_skill.strip() for additional_skill in additional_skills_text.split('·')]
 
-    async def get_external_url(self) -> Optional[str]:
+    @staticmethod
+    def parse_company_slug(company_url: Optional[str]) -> Optional[str]:
         """
-        Get the external URL for the job application.
+        Get the company slug from a company URL.
 
-        :return: External URL as a string, or None if not found
+        :param company_url: URL containing company/<slug>
+        :return: Company slug, or None if not found
         """
-        job_external_button_selector = '.jobs-apply-button--top-card .jobs-apply-button'
         try:
-            await self.page.click(job_external_button_selector)
-            await self.page.wait_for_timeout(5000)
-            if len(self.page.context.pages) > 1:
-                new_page = self.page.context.pages[-1]
-                return new_page.url
-            return self.page.url
+            return company_url.split('company/')[1].split('/')[0]
         except Exception:
             return None
 
-    async def get_hirers(self) -> List[Hirer]:
+    @staticmethod
+    def parse_hirers(hirer_fields: List[Dict[str, Optional[str]]]) -> List[Hirer]:
         """
-        Get the hirer information (name, link, role) from the job posting page.
+        Build hirers from their raw name, link and role values.
 
-        :return: List of tuples containing hirer name, link, and role, or an empty list if not found
+        :param hirer_fields: List of dictionaries with name, link and role keys
+        :return: List of hirers
         """
-        hirer_info_selector = '.hirer-card__hirer-information'
-        try:
-            await self.page.wait_for_selector(hirer_info_selector, timeout=1000)
-            hirer_elements = await self.page.query_selector_all(hirer_info_selector)
-            hirers: List[Hirer] = []
-            for hirer_element in hirer_elements:
-                name_element = await hirer_element.query_selector('.jobs-poster__name strong')
-                link_element = await hirer_element.query_selector('a')
-                role_element = await hirer_element.query_selector('.linked-area .text-body-small')
-                
-                name = (await name_element.inner_text()).strip() if name_element else None
-                link = (await link_element.get_attribute('href')) if link_element else None
-                role = (await role_element.inner_text()).strip() if role_element else None
-
-                slug = link.split('in/')[1].split('/')[0] if link else None
-
-                hirer = Hirer()
-                hirer.set_name(name)
-                hirer.set_slug(slug)
-                hirer.set_role(role)
-
-                hirers.append(hirer)
-            return hirers
-        except Exception:
-            return []
+        hirers: List[Hirer] = []
+        for fields in hirer_fields:
+            link = fields.get('link')
+            slug = link.split('in/')[1].split('/')[0] if link and 'in/' in link else None
+
+            hirer = Hirer()
+            hirer.set_name(fields.get('name'))
+            hirer.set_slug(slug)
+            hirer.set_role(fields.get('role'))
+            hirers.append(hirer)
+        return hirers
@@ -0,0 +1,50 @@
+from typing import Any, Dict, Optional
+
+from linkedinapi.model.HtmlSnapshot import HtmlSnapshot
+from linkedinapi.model.JobPostingSinglePage import JobPostingSinglePage
+
+
+class JobPostingSnapshot(HtmlSnapshot):
+    """
+    A class to represent a captured job posting page, mirroring JobPostingSinglePage.
+    """
+
+    def get_id(self) -> Optional[int]:
+        """
+        Get the job ID from the captured URL.
+
+        :return: Job ID as an integer, or None if not found
+        """
+        try:
+            return int(self.url.split('jobs/view/')[1].split('/')[0])
+        except Exception:
+            return None
+
+    def extract_fields(self) -> Dict[str, Any]:
+        """
+        Read every field of the job posting from the HTML.
+
+        :return: Dictionary of raw field values, same shape as JobPostingSinglePage.extract_fields
+        """
+        company = self.first('.job-details-jobs-unified-top-card__company-name a')
+        hirers = []
+        for hirer in self.all('.hirer-card__hirer-information'):
+            hirers.append({
+                'name': self.first_text('.jobs-poster__name strong', hirer),
+                'link': self.attribute(self.first('a', hirer), 'href'),
+                'role': self.first_text('.linked-area .text-body-small', hirer),
+            })
+
+        return {
+            'id': self.get_id(),
+            'title': self.first_text('.artdeco-card h1'),
+            'location': self.first_text('.job-details-jobs-unified-top-card__primary-description-container .tvm__text:first-child'),
+            'description': self.first_text('.jobs-box__html-content p'),
+            'skills': [self.text(node) for node in self.all('.job-details-how-you-match__skills-item-subtitle')],
+            'additional_skills': self.first_text('.job-details-how-you-match__skills-section-descriptive-skill'),
+            'company_name': self.text(company),
+            'company_url': self.attribute(company, 'href'),
+            'disabled': self.first(JobPostingSinglePage.disabled_selector) is not None,
+            'is_simple': self.first(JobPostingSinglePage.simple_apply_selector) is not None,
+            'hirers': hirers,
+        }
@@ -0,0 +1,42 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+WorkplaceType = Literal['on_site', 'remote', 'hybrid']
+ExperienceLevel = Literal['internship', 'entry_level', 'associate', 'mid_senior', 'director', 'executive']
+SortBy = Literal['relevance', 'date']
+
+
+class JobSearchQuery(BaseModel):
+    """
+    Model for job search criteria, encoded into the jobs search URL by JobSearchUrlHelper.
+    """
+    keywords: str
+    location: str
+    date_filter: Optional[int] = Field(default=None, ge=1, le=3)
+    workplace_types: List[WorkplaceType] = []
+    experience_levels: List[ExperienceLevel] = []
+    easy_apply: bool = False
+    sort_by: Optional[SortBy] = None
+    start: int = Field(default=0, ge=0)
+
+    def get_keywords(self) -> str:
+        return self.keywords
+
+    def get_location(self) -> str:
+        return self.location
+
+    def get_start(self) -> int:
+        return self.start
+
+    def with_start(self, start: int) -> 'JobSearchQuery':
+        """
+        Get a copy of the query pointing at another result offset.
+
+        Args:
+            start: Index of the first result of the page
+
+        Returns:
+            JobSearchQuery with the same criteria and the new offset
+        """
+        return self.model_copy(update={'start': start})
@@ -0,0 +1,115 @@
+from typing import Optional, Tuple
+
+from playwright.async_api import Error as PlaywrightError, Page
+
+from linkedinapi.model.PageWaiter import PageWaiter
+
+
+class LoginPage:
+    """
+    A class to represent the LinkedIn login page and the screens that follow the submit.
+    """
+
+    url = "https://www.linkedin.com/login"
+
+    # Classifies the current screen, returns false while the login is still in progress
+    outcome_function = """() => {
+        const path = location.pathname;
+        if (document.querySelector('iframe[src*="captcha"], #captcha-internal, #arkose-iframe, [data-arkose]')) {
+            return 'captcha';
+        }
+        if (path.startsWith('/checkpoint')) {
+            return 'checkpoint';
+        }
+        const errors = document.querySelectorAll('#error-for-username, #error-for-password');
+        if (Array.from(errors).some(error => error.textContent.trim())) {
+            return 'wrong_credentials';
+        }
+        if (path.startsWith('/feed') || document.querySelector('#global-nav, .global-nav')) {
+            return 'success';
+        }
+        if (!path.startsWith('/login') && !path.startsWith('/uas/login')) {
+            return 'success';
+        }
+        return false;
+    }"""
+
+    session_cookie = 'li_at'
+
+    # Errors of scripts whose execution context a navigation tore down, the wait goes on after them
+    navigation_errors = (
+        'Execution context was destroyed',
+        'Cannot find context with specified id',
+        'Inspected target navigated or closed',
+    )
+
+    def __init__(self, page: Page):
+        """
+        Initialize the LoginPage with a Playwright Page object.
+
+        :param page: Playwright Page object
+        """
+        self.page = page
+
+    async def submit(self, username: str, password: str) -> None:
+        """
+        Open the login form, fill in the credentials and submit them.
+
+        :param username: LinkedIn username/email
+        :param password: LinkedIn password
+        """
+        await self.page.goto(self.url, wait_until='domcontentloaded')
+        await self.page.fill("input#username", username)
+        await self.page.fill("input#password", password)
+        await self.page.click("button[type=submit]")
+
+    async def wait_for_outcome(self, waiter: PageWaiter, timeout: int) -> Tuple[str, Optional[str]]:
+        """
+        Wait until the page after the submit tells how the login went.
+
+        Returns as soon as the post-login navigation lands, an error message shows up or a
+        checkpoint or captcha screen is reached. A success also requires the session cookie.
+
+        :param waiter: PageWaiter bound to the page
+        :param timeout: Milliseconds to wait at most
+        :return: Tuple of the outcome, one of LoginResult.outcome, and the URL it was detected at
+        """
+        waiter.restart(timeout)
+        while waiter.remaining_ms() > 0:
+            try:
+                if not await waiter.for_function('login_outcome', self.outcome_function,
+                                                 timeout=waiter.remaining_ms(), required=False):
+                    break
+                outcome = await self.page.evaluate(self.outcome_function)
+            except PlaywrightError as e:
+                if self.page.is_closed() or not self._is_navigation_error(e):
+                    raise
+                # The post-login navigation destroyed the context the predicate ran in
+                continue
+            if not outcome:
+                continue
+            if outcome == 'success' and not await self.has_session_cookie():
+                # Off the login form but not signed in yet, keep waiting for the redirect chain
+                await self.page.wait_for_timeout(100)
+                continue
+            return outcome, self.page.url
+        return 'timeout', self.page.url
+
+    def _is_navigation_error(self, error: PlaywrightError) -> bool:
+        """
+        Check whether an error comes from the page navigating while a script ran.
+
+        :param error: Error raised by the page
+        :return: True if the script's execution context was torn down by a navigation
+        """
+        message = str(error)
+        return any(marker in message for marker in self.navigation_errors)
+
+    async def has_session_cookie(self) -> bool:
+        """
+        Check whether the browser context holds the LinkedIn session cookie.
+
+        :return: True if the session cookie is set
+        """
+        cookies = await self.page.context.cookies("https://www.linkedin.com")
+        return any(cookie.get('name') == self.session_cookie for cookie in cookies)
@@ -0,0 +1,21 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+LoginOutcome = Literal['success', 'wrong_credentials', 'checkpoint', 'captcha', 'timeout']
+
+
+class LoginResult(BaseModel):
+    """
+    Model for the outcome of a login attempt.
+
+    checkpoint covers the verification screens LinkedIn shows instead of the feed
+    (2FA codes, email or phone confirmation), captcha a challenge that needs a human.
+    """
+    outcome: LoginOutcome
+    message: str
+    url: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    def is_success(self) -> bool:
+        return self.outcome == 'success'
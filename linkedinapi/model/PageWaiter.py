@@ -0,0 +1,162 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+
+class PageWaiter:
+    """
+    A class to wait on page readiness signals instead of fixed sleeps.
+
+    Every wait is a named step with its own timeout, capped by an overall deadline.
+    Required steps raise as soon as they time out, optional ones return False.
+    Each wait is recorded with the time it actually took.
+    """
+
+    default_step_timeout: int = 10000
+
+    def __init__(self, page: Page, budget_ms: int = 30000,
+                 recorder: Optional[Callable[[str, float, bool], None]] = None):
+        """
+        Initialize the PageWaiter with a Playwright Page object.
+
+        :param page: Playwright Page object
+        :param budget_ms: Overall deadline in milliseconds for all waits until the next restart
+        :param recorder: Optional callback receiving (step, elapsed_ms, ok) for every wait
+        """
+        self.page = page
+        self.budget_ms = budget_ms
+        self.recorder = recorder
+        self.timings: List[Dict[str, Any]] = []
+        self.deadline = time.monotonic() + budget_ms / 1000
+
+    def restart(self, budget_ms: Optional[int] = None) -> None:
+        """
+        Start a new deadline, e.g. for the next result page.
+
+        :param budget_ms: New budget in milliseconds, defaults to the initial one
+        """
+        if budget_ms is not None:
+            self.budget_ms = budget_ms
+        self.deadline = time.monotonic() + self.budget_ms / 1000
+
+    def remaining_ms(self) -> int:
+        """
+        Get the milliseconds left before the deadline.
+
+        :return: Remaining milliseconds, never negative
+        """
+        return max(0, int((self.deadline - time.monotonic()) * 1000))
+
+    async def for_selector(self, step: str, selector: str, timeout: Optional[int] = None,
+                           state: str = 'visible', required: bool = True) -> bool:
+        """
+        Wait until an element matching the selector reaches the given state.
+
+        :param step: Name of the step, used for timings
+        :param selector: CSS selector to wait for
+        :param timeout: Step timeout in milliseconds
+        :param state: Element state, as in Page.wait_for_selector
+        :param required: Raise on timeout if True, return False otherwise
+        :return: True if the element showed up in time
+        """
+        return await self._run(step, timeout, required,
+                               lambda t: self.page.wait_for_selector(selector, state=state, timeout=t))
+
+    async def for_url(self, step: str, predicate: Callable[[str], bool], timeout: Optional[int] = None,
+                      required: bool = True) -> bool:
+        """
+        Wait until the page URL satisfies a predicate, without waiting for a load event.
+
+        :param step: Name of the step, used for timings
+        :param predicate: Function receiving the URL and returning True when ready
+        :param timeout: Step timeout in milliseconds
+        :param required: Raise on timeout if True, return False otherwise
+        :return: True if the URL matched in time
+        """
+        return await self._run(step, timeout, required,
+                               lambda t: self.page.wait_for_url(predicate, wait_until='commit', timeout=t))
+
+    async def for_network_idle(self, step: str, timeout: Optional[int] = None, required: bool = False) -> bool:
+        """
+        Wait until there are no network connections for at least 500 ms.
+
+        :param step: Name of the step, used for timings
+        :param timeout: Step timeout in milliseconds
+        :param required: Raise on timeout if True, return False otherwise
+        :return: True if the network went idle in time
+        """
+        return await self._run(step, timeout, required,
+                               lambda t: self.page.wait_for_load_state('networkidle', timeout=t))
+
+    async def for_function(self, step: str, expression: str, arg: Any = None, timeout: Optional[int] = None,
+                           required: bool = True) -> bool:
+        """
+        Wait until a JavaScript predicate evaluated in the page returns a truthy value.
+
+        :param step: Name of the step, used for timings
+        :param expression: JavaScript function source
+        :param arg: Argument passed to the function
+        :param timeout: Step timeout in milliseconds
+        :param required: Raise on timeout if True, return False otherwise
+        :return: True if the predicate held in time
+        """
+        return await self._run(step, timeout, required,
+                               lambda t: self.page.wait_for_function(expression, arg=arg, timeout=t))
+
+    async def for_dom_settled(self, step: str, selector: str, quiet_ms: int = 300, timeout: Optional[int] = None,
+                              required: bool = False) -> bool:
+        """
+        Wait until the subtree under the selector stops mutating for quiet_ms.
+
+        :param step: Name of the step, used for timings
+        :param selector: CSS selector of the observed root, the body if not found
+        :param quiet_ms: Milliseconds without mutations that count as settled
+        :param timeout: Step timeout in milliseconds
+        :param required: Raise on timeout if True, return False otherwise
+        :return: True if the DOM settled in time
+        """
+        async def wait(t: int) -> None:
+            key = await self.page.evaluate(
+                """selector => {
+                    window.__pageWaiterMutations = window.__pageWaiterMutations || {};
+                    const key = Math.random().toString(36).slice(2);
+                    const target = document.querySelector(selector) || document.body;
+                    window.__pageWaiterMutations[key] = performance.now();
+                    const observer = new MutationObserver(() => { window.__pageWaiterMutations[key] = performance.now(); });
+                    observer.observe(target, {childList: true, subtree: true, characterData: true});
+                    setTimeout(() => observer.disconnect(), 120000);
+                    return key;
+                }""",
+                selector,
+            )
+            await self.page.wait_for_function(
+                "([key, quietMs]) => performance.now() - window.__pageWaiterMutations[key] >= quietMs",
+                arg=[key, quiet_ms],
+                timeout=t,
+            )
+
+        return await self._run(step, timeout, required, wait)
+
+    async def _run(self, step: str, timeout: Optional[int], required: bool, wait: Callable[[int], Any]) -> bool:
+        step_timeout = min(timeout if timeout is not None else self.default_step_timeout, self.remaining_ms())
+        started = time.monotonic()
+        ok = False
+        try:
+            if step_timeout <= 0:
+                raise PlaywrightTimeoutError(f"Wait budget exhausted before step '{step}'")
+            await wait(step_timeout)
+            ok = True
+        except PlaywrightTimeoutError:
+            pass
+        finally:
+            self._record(step, (time.monotonic() - started) * 1000, ok)
+
+        if not ok and required:
+            raise PlaywrightTimeoutError(f"Step '{step}' timed out after {step_timeout} ms")
+        return ok
+
+    def _record(self, step: str, elapsed_ms: float, ok: bool) -> None:
+        self.timings.append({"step": step, "ms": round(elapsed_ms, 1), "ok": ok})
+        if self.recorder is not None:
+            self.recorder(step, elapsed_ms, ok)
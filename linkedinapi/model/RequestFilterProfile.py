@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class RequestFilterProfile(BaseModel):
+    """
+    Model describing which requests a page is allowed to make.
+
+    Allow lists win over deny lists. Resource types are Playwright's request.resource_type
+    values, URL patterns are regular expressions searched in the request URL.
+    """
+    name: str
+    allowed_resource_types: List[str] = []
+    blocked_resource_types: List[str] = []
+    allowed_url_patterns: List[str] = []
+    blocked_url_patterns: List[str] = []
+    popup_profile: Optional[str] = None
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_popup_profile(self) -> Optional[str]:
+        return self.popup_profile
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import re
+from typing import Any, Dict, List, Optional, Pattern
+
+from playwright.async_api import Page, Response
+
+
+class ResponseCapture:
+    """
+    A class to collect the JSON payloads the LinkedIn SPA fetches over XHR.
+
+    Responses whose URL matches one of the named patterns are decoded and stored under
+    that name, so data can be read from the API payloads instead of the rendered DOM.
+    """
+
+    JOB_CARDS = 'job_cards'
+    JOB_POSTING = 'job_posting'
+
+    PATTERNS: Dict[str, str] = {
+        JOB_CARDS: r"/voyager/api/voyagerJobsDashJobCards",
+        JOB_POSTING: r"/voyager/api/jobs/jobPostings/\d+",
+    }
+
+    def __init__(self, page: Page, patterns: Optional[Dict[str, str]] = None):
+        """
+        Initialize the ResponseCapture with a Playwright Page object.
+
+        :param page: Playwright Page object
+        :param patterns: Regular expressions by name, defaults to ResponseCapture.PATTERNS
+        """
+        self.page = page
+        self.patterns: Dict[str, Pattern] = {
+            name: re.compile(pattern) for name, pattern in (patterns or self.PATTERNS).items()
+        }
+        self.payloads: Dict[str, List[Any]] = {name: [] for name in self.patterns}
+        self.events: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in self.patterns}
+        self.started = False
+
+    def start(self) -> None:
+        """
+        Start listening to the page responses.
+        """
+        if not self.started:
+            self.page.on("response", self._on_response)
+            self.started = True
+
+    def stop(self) -> None:
+        """
+        Stop listening to the page responses.
+        """
+        if self.started:
+            self.page.remove_listener("response", self._on_response)
+            self.started = False
+
+    def clear(self, name: Optional[str] = None) -> None:
+        """
+        Forget the payloads captured so far, e.g. before loading the next result page.
+
+        :param name: Name of the pattern to clear, all of them if None
+        """
+        for key in ([name] if name else list(self.payloads)):
+            self.payloads[key] = []
+            self.events[key].clear()
+
+    def get(self, name: str) -> List[Any]:
+        """
+        Get the payloads captured for a pattern.
+
+        :param name: Name of the pattern
+        :return: List of decoded JSON payloads, in arrival order
+        """
+        return list(self.payloads[name])
+
+    async def wait_for(self, name: str, timeout: int) -> List[Any]:
+        """
+        Wait until at least one payload has been captured for a pattern.
+
+        :param name: Name of the pattern
+        :param timeout: Milliseconds to wait
+        :return: Captured payloads, empty if none arrived in time
+        """
+        if not self.payloads[name]:
+            try:
+                await asyncio.wait_for(self.events[name].wait(), timeout / 1000)
+            except asyncio.TimeoutError:
+                pass
+        return self.get(name)
+
+    async def _on_response(self, response: Response) -> None:
+        for name, pattern in self.patterns.items():
+            if not pattern.search(response.url):
+                continue
+            if response.status != 200:
+                return
+            try:
+                payload = await response.json()
+            except Exception as e:
+                logging.debug("Could not decode captured response %s: %s", response.url, e)
+                return
+            self.payloads[name].append(payload)
+            self.events[name].set()
+            return
@@ -1,14 +1,54 @@
+from typing import AsyncIterator, List, Optional
+
 from injector import inject
 
 from linkedinapi.client.LinkedinClient import LinkedinClient
+from linkedinapi.manager.AccountPoolManager import AccountPoolManager
+from linkedinapi.manager.BatchManager import BatchManager
+from linkedinapi.manager.EntityCacheManager import EntityCacheManager
+from linkedinapi.manager.SingleFlightManager import SingleFlightManager
+from linkedinapi.model.BatchItemResult import BatchItemResult
+from linkedinapi.model.CachePolicy import CachePolicy
 from linkedinapi.model.Company import Company
 
 
 class CompanyService:
 
     @inject
-    def __init__(self, linkedin_client: LinkedinClient):
+    def __init__(self, linkedin_client: LinkedinClient, entity_cache: EntityCacheManager,
+                 single_flight: SingleFlightManager, batch_manager: BatchManager,
+                 account_pool: AccountPoolManager):
         self.linkedin_client = linkedin_client
+        self.entity_cache = entity_cache
+        self.single_flight = single_flight
+        self.batch_manager = batch_manager
+        self.account_pool = account_pool
+
+    async def get_company(self, username: str, company_slug: str, cache_policy: Optional[CachePolicy] = None) -> Company:
+        return await self.entity_cache.get_or_load(
+            'company',
+            company_slug,
+            Company,
+            lambda: self.single_flight.run(
+                ('company', company_slug),
+                lambda: self.account_pool.run(
+                    username, lambda account: self.linkedin_client.get_company(account, company_slug)
+                ),
+            ),
+            cache_policy,
+            lambda company: company is None or company.name is None,
+        )
+
+    async def get_companies(self, username: str, company_slugs: List[str],
+                            cache_policy: Optional[CachePolicy] = None) -> List[BatchItemResult[Company]]:
+        return await self.batch_manager.run(
+            company_slugs,
+            lambda company_slug: self.get_company(username, company_slug, cache_policy),
+        )
 
-    async def get_company(self, username: str, company_slug: str) -> Company:
-        return await self.linkedin_client.get_company(username, company_slug)
+    def iter_companies(self, username: str, company_slugs: List[str],
+                       cache_policy: Optional[CachePolicy] = None) -> AsyncIterator[BatchItemResult[Company]]:
+        return self.batch_manager.iter_results(
+            company_slugs,
+            lambda company_slug: self.get_company(username, company_slug, cache_policy),
+        )
@@ -1,14 +1,54 @@
+from typing import AsyncIterator, List, Optional
+
 from injector import inject
 
 from linkedinapi.client.LinkedinClient import LinkedinClient
+from linkedinapi.manager.AccountPoolManager import AccountPoolManager
+from linkedinapi.manager.BatchManager import BatchManager
+from linkedinapi.manager.EntityCacheManager import EntityCacheManager
+from linkedinapi.manager.SingleFlightManager import SingleFlightManager
+from linkedinapi.model.BatchItemResult import BatchItemResult
+from linkedinapi.model.CachePolicy import CachePolicy
 from linkedinapi.model.Hirer import Hirer
 
 
 class HirerService:
 
     @inject
-    def __init__(self, linkedin_client: LinkedinClient):
+    def __init__(self, linkedin_client: LinkedinClient, entity_cache: EntityCacheManager,
+                 single_flight: SingleFlightManager, batch_manager: BatchManager,
+                 account_pool: AccountPoolManager):
         self.linkedin_client = linkedin_client
+        self.entity_cache = entity_cache
+        self.single_flight = single_flight
+        self.batch_manager = batch_manager
+        self.account_pool = account_pool
+
+    async def get_hirer(self, username: str, hirer_slug: str, cache_policy: Optional[CachePolicy] = None) -> Hirer:
+        return await self.entity_cache.get_or_load(
+            'hirer',
+            hirer_slug,
+            Hirer,
+            lambda: self.single_flight.run(
+                ('hirer', hirer_slug),
+                lambda: self.account_pool.run(
+                    username, lambda account: self.linkedin_client.get_hirer(account, hirer_slug)
+                ),
+            ),
+            cache_policy,
+            lambda hirer: hirer is None or hirer.name is None,
+        )
+
+    async def get_hirers(self, username: str, hirer_slugs: List[str],
+                         cache_policy: Optional[CachePolicy] = None) -> List[BatchItemResult[Hirer]]:
+        return await self.batch_manager.run(
+            hirer_slugs,
+            lambda hirer_slug: self.get_hirer(username, hirer_slug, cache_policy),
+        )
 
-    async def get_hirer(self, username: str, hirer_slug: str) -> Hirer:
-        return await self.linkedin_client.get_hirer(username, hirer_slug)
+    def iter_hirers(self, username: str, hirer_slugs: List[str],
+                    cache_policy: Optional[CachePolicy] = None) -> AsyncIterator[BatchItemResult[Hirer]]:
+        return self.batch_manager.iter_results(
+            hirer_slugs,
+            lambda hirer_slug: self.get_hirer(username, hirer_slug, cache_policy),
+        )
@@ -1,10 +1,16 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
 from injector import inject
 
 from linkedinapi.client.LinkedinClient import LinkedinClient
+from linkedinapi.manager.BatchManager import BatchManager
+from linkedinapi.manager.EntityCacheManager import EntityCacheManager
+from linkedinapi.manager.SingleFlightManager import SingleFlightManager
+from linkedinapi.model.BatchItemResult import BatchItemResult
+from linkedinapi.model.CachePolicy import CachePolicy
 from linkedinapi.model.JobPostingInfo import JobPostingInfo
 from linkedinapi.model.JobPostingListingItem import JobPostingListingItem
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
 
 
 class JobPostingService:
@@ -13,47 +19,133 @@ class JobPostingService:
     """
     
     @inject
-    def __init__(self, linkedin_client: LinkedinClient):
+    def __init__(self, linkedin_client: LinkedinClient, entity_cache: EntityCacheManager,
+                 single_flight: SingleFlightManager, batch_manager: BatchManager):
         """
         Initialize the job posting service with LinkedIn client dependency.
         
         Args:
             linkedin_client: Client for interacting with LinkedIn
+            entity_cache: Cache of scraped entities
+            single_flight: Coalescer of identical in-flight scrapes
+            batch_manager: Runner of batch requests with bounded concurrency
         """
         self.linkedin_client = linkedin_client
+        self.entity_cache = entity_cache
+        self.single_flight = single_flight
+        self.batch_manager = batch_manager
     
-    async def get_job_posting(self, username: str, job_id: int) -> JobPostingInfo:
+    async def get_job_posting(self, username: str, job_id: int,
+                              cache_policy: Optional[CachePolicy] = None) -> JobPostingInfo:
         """
         Get detailed information about a specific job posting.
         
         Args:
             username: LinkedIn username to load browser session
             job_id: LinkedIn job posting ID
+            cache_policy: Caching directives of the request
             
         Returns:
             JobPostingInfo object containing detailed job information
         """
-        return await self.linkedin_client.get_job_posting(username, job_id)
+        # The posting is read with the user's session (apply state, external URL), so only the
+        # same user's requests share a scrape or a cache entry
+        return await self.entity_cache.get_or_load(
+            'job_posting',
+            f"{username}:{job_id}",
+            JobPostingInfo,
+            lambda: self.single_flight.run(
+                ('job_posting', username, str(job_id)),
+                lambda: self.linkedin_client.get_job_posting(username, job_id),
+            ),
+            cache_policy,
+            lambda job_posting: job_posting is None or job_posting.title is None,
+        )
+
+    async def get_job_postings(self, username: str, job_ids: List[int],
+                               cache_policy: Optional[CachePolicy] = None) -> List[BatchItemResult[JobPostingInfo]]:
+        """
+        Get detailed information about several job postings, with bounded concurrency.
+
+        Args:
+            username: LinkedIn username to load browser session
+            job_ids: LinkedIn job posting IDs, duplicates are fetched once
+            cache_policy: Caching directives of the request
+
+        Returns:
+            Per-item results in request order
+        """
+        return await self.batch_manager.run(
+            job_ids,
+            lambda job_id: self.get_job_posting(username, job_id, cache_policy),
+        )
+
+    def iter_job_postings(self, username: str, job_ids: List[int],
+                          cache_policy: Optional[CachePolicy] = None) -> AsyncIterator[BatchItemResult[JobPostingInfo]]:
+        """
+        Get detailed information about several job postings, yielding each one as it finishes.
+
+        Args:
+            username: LinkedIn username to load browser session
+            job_ids: LinkedIn job posting IDs, duplicates are fetched once
+            cache_policy: Caching directives of the request
+
+        Returns:
+            Async iterator of per-item results in completion order
+        """
+        return self.batch_manager.iter_results(
+            job_ids,
+            lambda job_id: self.get_job_posting(username, job_id, cache_policy),
+        )
 
-    async def get_job_posting_listing_items(self, username: str, query: str, location: str, limit_first_page: bool, date_filter: Optional[int]) -> List[JobPostingListingItem]:
+    async def get_job_posting_listing_items(self, username: str, search_query: JobSearchQuery,
+                                            limit_first_page: bool) -> List[JobPostingListingItem]:
         """
         Get a list of job postings based on search criteria.
 
         Args:
             username: LinkedIn username to load browser session
-            query: Search query for job postings
-            location: Location filter for job postings
+            search_query: Search criteria for job postings
             limit_first_page: Flag to limit search to first page of results
-            date_filter: Date filter for job postings
 
         Returns:
             List of JobPostingInfo objects containing job posting information
         """
         return await self.linkedin_client.search(
             username,
-            query,
-            location,
-            limit_first_page,
-            date_filter
+            search_query,
+            limit_first_page
         )
-    
+
+    async def get_job_posting_listing_page(self, username: str, search_query: JobSearchQuery
+                                           ) -> Tuple[List[JobPostingListingItem], Optional[JobSearchQuery]]:
+        """
+        Get a single page of job postings, at the offset carried by the search query.
+
+        Args:
+            username: LinkedIn username to load browser session
+            search_query: Search criteria and page offset
+
+        Returns:
+            Tuple of the page items and the query of the next page, None if this is the last one
+        """
+        # Search results depend on the account, so only the same user's requests are coalesced
+        return await self.single_flight.run(
+            ('search_page', username, search_query.model_dump_json()),
+            lambda: self.linkedin_client.search_page(username, search_query),
+        )
+
+    def iter_job_posting_listing_items(self, username: str, search_query: JobSearchQuery,
+                                       limit_first_page: bool) -> AsyncIterator[JobPostingListingItem]:
+        """
+        Stream job postings based on search criteria, page by page.
+
+        Args:
+            username: LinkedIn username to load browser session
+            search_query: Search criteria for job postings
+            limit_first_page: Flag to limit search to first page of results
+
+        Returns:
+            Async iterator of job posting listing items
+        """
+        return self.linkedin_client.iter_search(username, search_query, limit_first_page)
@@ -1,36 +1,50 @@
+import hashlib
+
 from injector import inject
 
 from linkedinapi.client.LinkedinClient import LinkedinClient
 from linkedinapi.helper.TokenHelper import TokenHelper
 from linkedinapi.manager.SecretManager import SecretManager
+from linkedinapi.manager.SingleFlightManager import SingleFlightManager
 
 
 class LoginService:
 
     @inject
-    def __init__(self, linkedin_client: LinkedinClient, secret_manager: SecretManager):
+    def __init__(self, linkedin_client: LinkedinClient, secret_manager: SecretManager,
+                 single_flight: SingleFlightManager):
         self.linkedin_client = linkedin_client
         self.secret_manager = secret_manager
-        
+        self.single_flight = single_flight
+
     async def login(self, username: str, password: str):
         """
         Login to LinkedIn using provided credentials and generate a token.
-        
+
+        Concurrent logins of the same username and password share a single browser flow, a
+        different password always gets a flow of its own and never the outcome of another one.
+
         Args:
             username: LinkedIn username/email
             password: LinkedIn password
-            
+
         Returns:
-            A dictionary containing the login status and token
+            A dictionary containing the login status, the outcome of the attempt and, on success, the token
         """
         try:
-            await self.linkedin_client.login(username, password)
-            token = TokenHelper.generate_token(
-                username,
-                self.secret_manager.get_secret_key(),
-                24
+            login_result = await self.single_flight.run(
+                ('login', username, hashlib.sha256(password.encode()).hexdigest()),
+                lambda: self.linkedin_client.login(username, password),
             )
-            return {"status": "success", "token": token}
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+        if not login_result.is_success():
+            return {"status": "error", **login_result.model_dump()}
+
+        token = TokenHelper.generate_token(
+            username,
+            self.secret_manager.get_secret_key(),
+            24
+        )
+        return {"status": "success", "token": token, **login_result.model_dump()}
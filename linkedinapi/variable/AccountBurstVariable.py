@@ -0,0 +1,2 @@
+class AccountBurstVariable(int):
+    pass
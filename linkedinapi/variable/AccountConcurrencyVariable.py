@@ -0,0 +1,2 @@
+class AccountConcurrencyVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class AccountPoolAttemptsVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class AccountPoolCooldownVariable(int):
+    pass
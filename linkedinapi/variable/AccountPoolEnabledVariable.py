@@ -0,0 +1,2 @@
+class AccountPoolEnabledVariable(int):
+    pass
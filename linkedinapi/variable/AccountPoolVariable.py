@@ -0,0 +1,2 @@
+class AccountPoolVariable(list):
+    pass
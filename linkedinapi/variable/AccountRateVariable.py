@@ -0,0 +1,2 @@
+class AccountRateVariable(float):
+    pass
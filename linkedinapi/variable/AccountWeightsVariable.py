@@ -0,0 +1,2 @@
+class AccountWeightsVariable(dict):
+    pass
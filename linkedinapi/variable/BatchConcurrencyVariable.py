@@ -0,0 +1,2 @@
+class BatchConcurrencyVariable(int):
+    pass
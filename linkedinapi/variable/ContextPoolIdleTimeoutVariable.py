@@ -0,0 +1,2 @@
+class ContextPoolIdleTimeoutVariable(int):
+    pass
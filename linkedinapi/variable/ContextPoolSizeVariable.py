@@ -0,0 +1,2 @@
+class ContextPoolSizeVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class CrawlJobDbPathVariable(str):
+    pass
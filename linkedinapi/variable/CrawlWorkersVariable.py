@@ -0,0 +1,2 @@
+class CrawlWorkersVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class EntityCacheDbPathVariable(str):
+    pass
@@ -0,0 +1,2 @@
+class EntityCacheNegativeTtlVariable(int):
+    pass
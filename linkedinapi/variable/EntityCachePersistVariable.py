@@ -0,0 +1,2 @@
+class EntityCachePersistVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class EntityCacheSizeVariable(int):
+    pass
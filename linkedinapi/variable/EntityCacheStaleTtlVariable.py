@@ -0,0 +1,2 @@
+class EntityCacheStaleTtlVariable(int):
+    pass
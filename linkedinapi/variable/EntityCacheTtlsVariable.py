@@ -0,0 +1,2 @@
+class EntityCacheTtlsVariable(dict):
+    pass
@@ -0,0 +1,2 @@
+class ExtractionEngineVariable(str):
+    pass
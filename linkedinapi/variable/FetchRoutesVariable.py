@@ -0,0 +1,2 @@
+class FetchRoutesVariable(dict):
+    pass
@@ -0,0 +1,2 @@
+class FlightRecorderDirVariable(str):
+    pass
@@ -0,0 +1,2 @@
+class FlightRecorderHarVariable(int):
+    pass
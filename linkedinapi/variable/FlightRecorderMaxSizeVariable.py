@@ -0,0 +1,2 @@
+class FlightRecorderMaxSizeVariable(int):
+    pass
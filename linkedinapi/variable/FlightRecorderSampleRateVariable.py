@@ -0,0 +1,2 @@
+class FlightRecorderSampleRateVariable(float):
+    pass
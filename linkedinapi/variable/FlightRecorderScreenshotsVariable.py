@@ -0,0 +1,2 @@
+class FlightRecorderScreenshotsVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class FlightRecorderThresholdVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class GlobalConcurrencyVariable(int):
+    pass
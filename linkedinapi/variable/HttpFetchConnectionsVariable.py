@@ -0,0 +1,2 @@
+class HttpFetchConnectionsVariable(int):
+    pass
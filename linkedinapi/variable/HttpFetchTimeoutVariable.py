@@ -0,0 +1,2 @@
+class HttpFetchTimeoutVariable(float):
+    pass
@@ -0,0 +1,2 @@
+class LinkedinBaseUrlVariable(str):
+    pass
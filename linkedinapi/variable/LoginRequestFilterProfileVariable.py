@@ -0,0 +1,2 @@
+class LoginRequestFilterProfileVariable(str):
+    pass
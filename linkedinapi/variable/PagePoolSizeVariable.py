@@ -0,0 +1,2 @@
+class PagePoolSizeVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class RequestFilterProfileVariable(str):
+    pass
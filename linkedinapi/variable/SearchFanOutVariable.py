@@ -0,0 +1,2 @@
+class SearchFanOutVariable(int):
+    pass
@@ -0,0 +1,2 @@
+class SearchPageCacheTtlVariable(int):
+    pass
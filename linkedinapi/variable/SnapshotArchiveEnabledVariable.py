@@ -0,0 +1,2 @@
+class SnapshotArchiveEnabledVariable(int):
+    pass
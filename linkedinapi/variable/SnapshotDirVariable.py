@@ -0,0 +1,2 @@
+class SnapshotDirVariable(str):
+    pass
@@ -0,0 +1,2 @@
+class SnapshotParserPoolVariable(str):
+    pass
@@ -0,0 +1,2 @@
+class SnapshotParserWorkersVariable(int):
+    pass
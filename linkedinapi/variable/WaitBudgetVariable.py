@@ -0,0 +1,2 @@
+class WaitBudgetVariable(int):
+    pass
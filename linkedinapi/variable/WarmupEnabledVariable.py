@@ -0,0 +1,2 @@
+class WarmupEnabledVariable(int):
+    pass
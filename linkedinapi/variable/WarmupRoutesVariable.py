@@ -0,0 +1,2 @@
+class WarmupRoutesVariable(list):
+    pass
@@ -0,0 +1,21 @@
+from linkedinapi.helper.JobSearchUrlHelper import JobSearchUrlHelper
+from linkedinapi.model.JobSearchQuery import JobSearchQuery
+
+QUERY = JobSearchQuery(keywords="python", location="Italia")
+
+
+def test_next_start_follows_the_result_count():
+    # Short pages don't end the search while the reported count says there are more results
+    assert JobSearchUrlHelper.get_next_start(QUERY, 23, 60) == 25
+    assert JobSearchUrlHelper.get_next_start(QUERY.with_start(25), 25, 60) == 50
+    assert JobSearchUrlHelper.get_next_start(QUERY.with_start(50), 10, 60) == -1
+
+
+def test_next_start_without_result_count_stops_on_a_short_page():
+    assert JobSearchUrlHelper.get_next_start(QUERY, 25, None) == 25
+    assert JobSearchUrlHelper.get_next_start(QUERY, 24, None) == -1
+    assert JobSearchUrlHelper.get_next_start(QUERY, 0, None) == -1
+
+
+def test_next_start_stops_at_the_last_page_linkedin_serves():
+    assert JobSearchUrlHelper.get_next_start(QUERY.with_start(JobSearchUrlHelper.MAX_START), 25, 5000) == -1
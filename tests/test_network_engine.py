@@ -0,0 +1,270 @@
+import asyncio
+import copy
+import json
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+import pytest
+from playwright.async_api import Error as PlaywrightError, Page, Route, async_playwright
+
+from linkedinapi.client.LinkedinClient import LinkedinClient
+from linkedinapi.container.DefaultContainer import DefaultContainer
+from linkedinapi.factory.JobPostingInfoFactory import JobPostingInfoFactory
+from linkedinapi.factory.JobPostingListingItemFactory import JobPostingListingItemFactory
+from linkedinapi.helper.VoyagerHelper import VoyagerHelper
+from linkedinapi.model.JobPostingSearchPage import JobPostingSearchPage
+from linkedinapi.model.JobPostingSinglePage import JobPostingSinglePage
+from linkedinapi.model.ResponseCapture import ResponseCapture
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+JOB_POSTING_URL = "https://www.linkedin.com/jobs/view/4012345678/"
+JOB_SEARCH_URL = "https://www.linkedin.com/jobs/search/?keywords=python&start=0"
+JOB_CARDS_API_URL = "/voyager/api/voyagerJobsDashJobCards?decorationId=com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-220&count=25&q=jobSearch&start=0"
+JOB_POSTING_API_URL = "/voyager/api/jobs/jobPostings/4012345678?decorationId=com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65"
+
+EXPECTED_JOB_CARDS = [
+    {
+        'id': '4012345678',
+        'title': "Senior Python Developer",
+        'company_name': "Acme Robotics",
+        'metadata_items': ["Milano, Lombardia, Italia (Ibrido)", "Be an early applicant"],
+        'created_at': "2026-10-01",
+        'is_simple': True,
+    },
+    {
+        'id': '4087654321',
+        'title': "Backend Engineer",
+        'company_name': "Globex",
+        'metadata_items': ["Torino, Piemonte, Italia (Da remoto)"],
+        'created_at': "2026-10-12",
+        'is_simple': False,
+    },
+]
+
+EXPECTED_JOB_POSTING = {
+    'id': 4012345678,
+    'title': "Senior Python Developer",
+    'location': "Milano, Lombardia, Italia",
+    'description': "Acme Robotics is looking for a Senior Python Developer to join the platform team in Milan.",
+    'company_name': "Acme Robotics",
+    'company_slug': "acme-robotics",
+    'is_simple': True,
+    'external_url': None,
+    'disabled': False,
+}
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding='utf-8')
+
+
+def read_json_fixture(name: str) -> Dict[str, Any]:
+    return json.loads(read_fixture(name))
+
+
+def in_browser(fixture: str, url: str, read: Callable[[Page], Awaitable[Any]]) -> Any:
+    """
+    Serve a fixture at a LinkedIn URL and the recorded voyager payloads at their API URLs
+    in a headless Chromium, then read the page.
+
+    Skips the test when Chromium can't be launched.
+    """
+    async def fulfill(route: Route) -> None:
+        request_url = route.request.url
+        if '/voyager/api/voyagerJobsDashJobCards' in request_url:
+            await route.fulfill(status=200, content_type='application/json', body=read_fixture('voyager_job_cards.json'))
+        elif '/voyager/api/jobs/jobPostings/4012345678' in request_url:
+            await route.fulfill(status=200, content_type='application/json', body=read_fixture('voyager_job_posting.json'))
+        elif '/voyager/api/' in request_url:
+            await route.fulfill(status=404, content_type='application/json', body='{"status": 404}')
+        else:
+            await route.fulfill(status=200, content_type='text/html', body=read_fixture(fixture))
+
+    async def run() -> Any:
+        async with async_playwright() as playwright:
+            try:
+                browser = await playwright.chromium.launch()
+            except PlaywrightError as e:
+                pytest.skip(f"Chromium is not available: {e}")
+            try:
+                page = await browser.new_page()
+                await page.route('https://www.linkedin.com/**', fulfill)
+                await page.goto(url)
+                return await read(page)
+            finally:
+                await browser.close()
+
+    return asyncio.run(run())
+
+
+async def fetch(page: Page, url: str) -> None:
+    # Stands in for the XHR the LinkedIn SPA sends after the page loaded
+    await page.evaluate("url => fetch(url).then(response => response.text())", url)
+
+
+@pytest.fixture
+def network_client(monkeypatch) -> LinkedinClient:
+    client: LinkedinClient = DefaultContainer.getInstance().get(LinkedinClient)
+    monkeypatch.setattr(client, 'extraction_engine', 'network')
+    return client
+
+
+def test_extract_job_cards():
+    payload = read_json_fixture('voyager_job_cards.json')
+
+    # Cards come in the order of the result list, not of the included entities
+    assert VoyagerHelper.extract_job_cards([payload]) == EXPECTED_JOB_CARDS
+
+
+def test_extract_job_cards_skips_cards_seen_in_an_earlier_payload():
+    payload = read_json_fixture('voyager_job_cards.json')
+
+    assert VoyagerHelper.extract_job_cards([payload, copy.deepcopy(payload)]) == EXPECTED_JOB_CARDS
+
+
+def test_get_expected_job_card_count():
+    payload = read_json_fixture('voyager_job_cards.json')
+    last_page = copy.deepcopy(payload)
+    last_page['data']['paging'].update({'start': 25, 'total': 30})
+    no_paging = copy.deepcopy(payload)
+    del no_paging['data']['paging']
+
+    assert VoyagerHelper.get_expected_job_card_count([payload]) == 2
+    assert VoyagerHelper.get_expected_job_card_count([last_page]) == 5
+    assert VoyagerHelper.get_expected_job_card_count([no_paging]) is None
+
+
+def test_extract_job_posting():
+    payload = read_json_fixture('voyager_job_posting.json')
+
+    assert VoyagerHelper.extract_job_posting(payload) == EXPECTED_JOB_POSTING
+
+
+def test_extract_closed_external_job_posting():
+    payload = read_json_fixture('voyager_job_posting.json')
+    payload['data']['applyMethod'] = {
+        '$type': "com.linkedin.voyager.jobs.OffsiteApply",
+        'companyApplyUrl': "https://careers.acme-robotics.example/jobs/42",
+    }
+    payload['data']['jobState'] = 'CLOSED'
+
+    posting = VoyagerHelper.extract_job_posting(payload)
+
+    assert posting['is_simple'] is False
+    assert posting['disabled'] is True
+    assert posting['external_url'] == "https://careers.acme-robotics.example/jobs/42"
+
+
+def test_extract_job_posting_without_posting():
+    assert VoyagerHelper.extract_job_posting(read_json_fixture('voyager_job_cards.json')) is None
+
+
+def test_voyager_job_posting_has_the_dom_shape():
+    posting = VoyagerHelper.extract_job_posting(read_json_fixture('voyager_job_posting.json'))
+    posting.update({'disabled': None, 'is_simple': None})
+
+    job_posting = JobPostingInfoFactory.create_from_voyager_job_posting(posting, {})
+
+    assert job_posting.disabled is False
+    assert job_posting.is_simple is False
+
+
+def test_response_capture_collects_matching_responses():
+    async def read(page: Page):
+        capture = ResponseCapture(page)
+        capture.start()
+        try:
+            await fetch(page, "/voyager/api/me")
+            await fetch(page, "/voyager/api/jobs/jobPostings/999")
+            await fetch(page, JOB_CARDS_API_URL)
+            await fetch(page, JOB_POSTING_API_URL)
+            return (
+                await capture.wait_for(ResponseCapture.JOB_CARDS, 2000),
+                await capture.wait_for(ResponseCapture.JOB_POSTING, 2000),
+            )
+        finally:
+            capture.stop()
+
+    job_cards, job_postings = in_browser('job_search.html', JOB_SEARCH_URL, read)
+
+    # The 404 of the unknown posting and the unrelated endpoint are not captured
+    assert job_cards == [read_json_fixture('voyager_job_cards.json')]
+    assert job_postings == [read_json_fixture('voyager_job_posting.json')]
+
+
+def test_client_reads_captured_job_cards(network_client):
+    async def read(page: Page):
+        capture = ResponseCapture(page)
+        capture.start()
+        try:
+            await fetch(page, JOB_CARDS_API_URL)
+            job_search_page = JobPostingSearchPage(page, network_client._create_waiter(page), capture)
+            return await network_client._extract_job_cards(job_search_page)
+        finally:
+            capture.stop()
+
+    job_postings = in_browser('job_search.html', JOB_SEARCH_URL, read)
+
+    assert [item.model_dump() for item in job_postings] == [
+        item.model_dump()
+        for item in JobPostingListingItemFactory.create_all_from_job_posting_search_payload(EXPECTED_JOB_CARDS)
+    ]
+
+
+def test_client_falls_back_to_the_dom_without_captured_job_cards(network_client):
+    async def read(page: Page):
+        capture = ResponseCapture(page)
+        capture.start()
+        try:
+            job_search_page = JobPostingSearchPage(page, network_client._create_waiter(page), capture)
+            return await network_client._extract_job_cards(job_search_page), await job_search_page.extract_job_cards()
+        finally:
+            capture.stop()
+
+    job_postings, dom_cards = in_browser('job_search.html', JOB_SEARCH_URL, read)
+
+    assert [item.id for item in job_postings] == [4012345678, 4087654321]
+    assert [item.model_dump() for item in job_postings] == [
+        item.model_dump()
+        for item in JobPostingListingItemFactory.create_all_from_job_posting_search_payload(dom_cards)
+    ]
+
+
+def test_client_reads_captured_job_posting(network_client):
+    async def read(page: Page):
+        capture = ResponseCapture(page)
+        capture.start()
+        try:
+            await fetch(page, JOB_POSTING_API_URL)
+            job_posting_single_page = JobPostingSinglePage(page, network_client._create_waiter(page), capture)
+            return await network_client._extract_job_posting(job_posting_single_page, 4012345678, page)
+        finally:
+            capture.stop()
+
+    job_posting = in_browser('job_posting.html', JOB_POSTING_URL, read)
+
+    assert job_posting.description == EXPECTED_JOB_POSTING['description']
+    assert job_posting.company.slug == "acme-robotics"
+    assert job_posting.is_simple is True
+    # Skills and hirers are not in the payload, they still come from the rendered page
+    assert "Python" in job_posting.skills
+    assert [hirer.slug for hirer in job_posting.hirers] == ["jane-roe-123"]
+
+
+def test_client_falls_back_to_the_dom_without_captured_job_posting(network_client):
+    async def read(page: Page):
+        capture = ResponseCapture(page)
+        capture.start()
+        try:
+            job_posting_single_page = JobPostingSinglePage(page, network_client._create_waiter(page), capture)
+            network = await network_client._extract_job_posting(job_posting_single_page, 4012345678, page)
+            dom = await JobPostingInfoFactory.create_from_job_posting_single_page(JobPostingSinglePage(page))
+            return network, dom
+        finally:
+            capture.stop()
+
+    network, dom = in_browser('job_posting.html', JOB_POSTING_URL, read)
+
+    assert network.title == "Senior Python Developer"
+    assert network.model_dump() == dom.model_dump()